@@ -0,0 +1,126 @@
+"""추론 요청 승인 제어 (bounded executor + load shedding)
+
+동기 예측 코드를 anyio 기본 스레드풀 대신 전용 스레드풀에서 실행합니다.
+동시 실행 수와 대기열 길이에 상한을 두고, 한도를 넘는 요청은 바로 429로,
+대기열에서 deadline을 넘긴 요청은 503으로 거절해 과부하 시 p99 지연시간을 지킵니다.
+deadline은 대기열에서 기다린 시간에만 적용되며, 이미 실행을 시작한 요청은 끝까지 처리합니다.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Rejected(Exception):
+    """승인 제어로 거절된 요청 (HTTP 상태 코드와 Retry-After 포함)"""
+
+    def __init__(self, status_code, detail, retry_after):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class _Expired(Exception):
+    """작업 스레드가 꺼냈을 때 이미 deadline을 넘긴 요청"""
+
+
+class BoundedExecutor:
+    """동시 실행 수와 대기열 길이가 제한된 스레드풀"""
+
+    def __init__(self, name, max_workers, max_queue, deadline_s):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.deadline_s = deadline_s
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected_full = 0
+        self._rejected_deadline = 0
+
+    @classmethod
+    def from_env(cls, prefix, max_workers, max_queue, deadline_ms):
+        """`<PREFIX>_MAX_CONCURRENCY`, `_MAX_QUEUE`, `_DEADLINE_MS` 환경변수로 생성"""
+        return cls(
+            name=prefix.lower(),
+            max_workers=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", max_workers)),
+            max_queue=int(os.getenv(f"{prefix}_MAX_QUEUE", max_queue)),
+            deadline_s=float(os.getenv(f"{prefix}_DEADLINE_MS", deadline_ms)) / 1000,
+        )
+
+    @property
+    def retry_after(self):
+        """Retry-After 헤더 값 (초, 최소 1)"""
+        return max(1, round(self.deadline_s))
+
+    async def run(self, fn, *args):
+        """fn(*args)를 전용 스레드에서 실행하고 결과 반환
+
+        Raises:
+            Rejected: 대기열이 가득 찼거나(429) deadline을 넘긴 경우(503)
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected_full += 1
+                raise Rejected(429, "요청이 너무 많습니다", self.retry_after)
+            self._in_flight += 1
+
+        # 요청 컨텍스트(contextvars)를 작업 스레드로 전달
+        context = contextvars.copy_context()
+        future = self._executor.submit(
+            context.run, self._run_if_fresh, time.monotonic(), fn, *args
+        )
+        future.add_done_callback(self._release)
+        result = asyncio.wrap_future(future)
+        try:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(result), timeout=self.deadline_s
+                )
+            except TimeoutError:
+                # 아직 대기 중이면 실행하지 않고 취소, 이미 실행 중이면 끝날 때까지 기다림
+                if not future.cancel():
+                    return await result
+                with self._lock:
+                    self._rejected_deadline += 1
+                raise Rejected(503, "처리 시간 초과", self.retry_after) from None
+        except _Expired:
+            raise Rejected(503, "처리 시간 초과", self.retry_after) from None
+
+    def _run_if_fresh(self, enqueued, fn, *args):
+        # 취소와 엇갈려 deadline을 넘긴 뒤 꺼낸 작업(응답을 기다리는 쪽이 없을 수도 있음)은
+        # 실행하지 않고 버림
+        if time.monotonic() - enqueued > self.deadline_s:
+            with self._lock:
+                self._rejected_deadline += 1
+            raise _Expired
+        return fn(*args)
+
+    def _release(self, future):
+        with self._lock:
+            self._in_flight -= 1
+            if not future.cancelled() and not isinstance(future.exception(), _Expired):
+                self._completed += 1
+
+    def stats(self):
+        """현재 부하와 거절 횟수"""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_workers,
+                "max_queue": self.max_queue,
+                "deadline_ms": round(self.deadline_s * 1000, 3),
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected_queue_full": self._rejected_full,
+                "rejected_deadline": self._rejected_deadline,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,157 @@
+"""예측 요청/응답 캡처 (재현·벤치마크용)
+
+요청 경로에서는 기록을 큐에 넣기만 하고(put_nowait), 백그라운드 스레드가 모아서
+JSONL 파일에 씁니다. 큐가 가득 차면 요청을 느리게 하지 않도록 기록을 버리고 개수만 셉니다.
+파일은 크기 상한에 도달하면 새 파일로 넘어가고, 개수 상한을 넘으면 가장 오래된 파일을 지웁니다.
+쓰기가 실패한 배치(디스크 가득 참, 직렬화할 수 없는 값 등)는 버리고 개수와 마지막 오류만 stats에
+남기며, 기록 스레드는 계속 실행됩니다.
+
+각 줄의 "path"(엔드포인트), "query"(tier, early_exit, budget_ms, response_mode 등 쿼리 파라미터),
+"request"(요청 본문)로 원래 요청을 그대로 다시 보낼 수 있습니다.
+"""
+
+import json
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+
+CAPTURE_GLOB = "capture-*.jsonl"
+
+_STOP = object()
+
+
+class CaptureSink:
+    """비동기 배치 기록 + 크기 기반 파일 회전"""
+
+    def __init__(
+        self,
+        directory,
+        max_file_bytes=64 * 1024 * 1024,
+        max_files=10,
+        queue_size=10_000,
+        batch_size=256,
+        flush_interval_s=1.0,
+    ):
+        self.directory = Path(directory)
+        self.max_file_bytes = max_file_bytes
+        self.max_files = max_files
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.written = 0
+        self.dropped = 0
+        # 쓰기에 실패한 배치 수와 마지막 오류 (기록 스레드만 갱신)
+        self.write_errors = 0
+        self.last_error = None
+        self._dropped_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._file_bytes = 0
+        self._file_index = 0
+        self._thread = None
+
+    def record(self, record):
+        """기록을 큐에 넣음 (가득 차 있으면 버림, 블로킹 없음)"""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            # 여러 요청 스레드가 동시에 버릴 수 있으므로 잠금 안에서 증가
+            with self._dropped_lock:
+                self.dropped += 1
+
+    def start(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="capture-writer", daemon=True
+        )
+        self._thread.start()
+
+    def close(self):
+        """남은 기록을 모두 쓰고 종료"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval_s)
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as e:  # noqa: BLE001
+                    # 예외로 기록 스레드가 끝나면 이후 캡처가 조용히 사라지므로 세고 계속 진행
+                    self.write_errors += 1
+                    self.last_error = f"{type(e).__name__}: {e}"
+                    if isinstance(e, OSError):
+                        # 일부만 쓰였을 수 있는 파일은 닫고 다음 배치는 새 파일에 씀
+                        self._close_file()
+        self._close_file()
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def _write(self, batch):
+        data = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in batch
+        ).encode()
+        if self._file is None or self._file_bytes + len(data) > self.max_file_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._file_bytes += len(data)
+        self.written += len(batch)
+
+    def _rotate(self):
+        self._close_file()
+        self._file_index += 1
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.directory / f"capture-{timestamp}-{self._file_index:04d}.jsonl"
+        self._file = path.open("ab")
+        self._file_bytes = 0
+
+        for old in capture_files(self.directory)[: -self.max_files]:
+            old.unlink(missing_ok=True)
+
+    def stats(self):
+        return {
+            "directory": str(self.directory),
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+            "last_error": self.last_error,
+        }
+
+
+def capture_files(directory):
+    """캡처 파일 목록 (오래된 순)"""
+    return sorted(Path(directory).glob(CAPTURE_GLOB))
+
+
+def iter_captured(directory):
+    """캡처 디렉토리의 모든 기록을 오래된 순으로 반환 (재현/벤치마크 입력)"""
+    for path in capture_files(directory):
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
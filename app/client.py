@@ -0,0 +1,385 @@
+"""예측 API 클라이언트 SDK (동기/asyncio)
+
+- keep-alive 연결 풀을 재사용하는 httpx 세션
+- 짧은 시간(batch_window_ms) 안에 들어온 `predict` 호출을 `/predict/batch` 한 번으로 묶음
+  (묶은 배치는 최대 max_concurrent_batches개까지 동시에 전송)
+- 멱등 요청(예측, 조회)은 연결 오류와 429/502/503/504에 대해 backoff 후 재시도
+  (429/503의 Retry-After 헤더를 따름)
+
+```python
+from app.client import IrisClient
+
+with IrisClient("http://localhost:8000") as client:
+    client.predict([5.1, 3.5, 1.4, 0.2])
+```
+
+테스트에서는 `IrisClient.for_app(app)` / `AsyncIrisClient.for_app(app)`로
+서버 없이 같은 프로세스의 FastAPI 앱에 연결합니다.
+"""
+
+import asyncio
+import math
+import numbers
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import httpx
+
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+# 서버 /predict, /predict/batch가 받는 행당 특성 수
+N_FEATURES = 4
+
+_STOP = object()
+
+
+class _RetryPolicy:
+    """재시도 여부와 대기 시간 계산 (동기/비동기 클라이언트 공용)"""
+
+    def __init__(self, max_retries, backoff_s, max_backoff_s):
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+
+    def should_retry(self, attempt, response=None, error=None):
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response.status_code in RETRY_STATUS_CODES
+
+    def delay(self, attempt, response=None):
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff_s)
+            except ValueError:
+                pass
+        delay = self.backoff_s * 2**attempt * random.uniform(0.5, 1.5)
+        return min(delay, self.max_backoff_s)
+
+
+def _validate_row(features):
+    """한 행을 검증해 float 리스트로 반환
+
+    잘못된 행이 배치에 섞이면 서버가 배치 전체를 400으로 거절해 같이 묶인 다른 호출까지 실패하므로,
+    큐에 넣기 전에 호출한 쪽에서 ValueError를 냅니다.
+    """
+    try:
+        row = list(features)
+    except TypeError:
+        raise ValueError(f"특성은 {N_FEATURES}개 숫자의 시퀀스여야 합니다") from None
+    if len(row) != N_FEATURES:
+        raise ValueError(f"{N_FEATURES}개 특성 필요 (입력 {len(row)}개)")
+    for value in row:
+        if (
+            isinstance(value, bool)
+            or not isinstance(value, numbers.Real)
+            or not math.isfinite(value)
+        ):
+            raise ValueError(f"특성은 유한한 숫자여야 합니다: {value!r}")
+    return [float(value) for value in row]
+
+
+def _with_version(batch_response):
+    version = batch_response["model_version"]
+    return [{**p, "model_version": version} for p in batch_response["predictions"]]
+
+
+class IrisClient:
+    """동기 클라이언트 - 여러 스레드의 predict 호출을 배치로 묶어 전송"""
+
+    def __init__(
+        self,
+        base_url="http://localhost:8000",
+        timeout=5.0,
+        max_retries=3,
+        backoff_s=0.05,
+        max_backoff_s=2.0,
+        batch_window_ms=2.0,
+        max_batch_size=64,
+        max_connections=10,
+        max_concurrent_batches=4,
+        http_client=None,
+    ):
+        """
+        Args:
+            batch_window_ms: predict 호출을 모으는 시간 (0이면 묶지 않고 /predict 호출)
+            max_batch_size: 한 번에 보내는 최대 행 수
+            max_concurrent_batches: 동시에 전송 중일 수 있는 배치 수
+                (모두 응답을 기다리는 중이면 이미 묶은 배치는 슬롯이 빌 때까지 전송을 기다리고,
+                그동안 들어온 호출은 큐에 쌓였다가 그 다음 배치로 묶임)
+            http_client: 직접 만든 httpx.Client (테스트용 TestClient 등)
+        """
+        self._http = http_client or httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self.retry = _RetryPolicy(max_retries, backoff_s, max_backoff_s)
+        self.batch_window_s = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self._queue = queue.Queue()
+        self._batcher = None
+        self._batcher_lock = threading.Lock()
+        self._senders = None
+        self._send_slots = threading.BoundedSemaphore(max_concurrent_batches)
+
+    @classmethod
+    def for_app(cls, app, **kwargs):
+        """같은 프로세스의 ASGI 앱에 연결 (서버 없이 테스트)"""
+        from fastapi.testclient import TestClient
+
+        return cls(http_client=TestClient(app), **kwargs)
+
+    def _request(self, method, path, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                response = self._http.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if not self.retry.should_retry(attempt, error=e):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+            else:
+                if not self.retry.should_retry(attempt, response=response):
+                    response.raise_for_status()
+                    return response.json()
+                time.sleep(self.retry.delay(attempt, response))
+            attempt += 1
+
+    def health(self):
+        return self._request("GET", "/health")
+
+    def model_info(self):
+        return self._request("GET", "/model/info")
+
+    def predict_batch(self, rows):
+        """여러 행을 한 번에 예측 (행별 결과에 model_version 포함)"""
+        rows = [list(row) for row in rows]
+        results = []
+        for start in range(0, len(rows), self.max_batch_size):
+            chunk = rows[start : start + self.max_batch_size]
+            response = self._request(
+                "POST", "/predict/batch", json={"instances": chunk}
+            )
+            results.extend(_with_version(response))
+        return results
+
+    def predict(self, features):
+        """한 행 예측 - 같은 시간대의 다른 호출과 묶어서 전송
+
+        Raises:
+            ValueError: 행이 N_FEATURES개의 유한한 숫자가 아닐 때 (전송하지 않음)
+        """
+        row = _validate_row(features)
+        if self.batch_window_s <= 0:
+            return self._request("POST", "/predict", json={"features": row})
+
+        future = Future()
+        self._ensure_batcher()
+        self._queue.put((row, future))
+        return future.result()
+
+    def _ensure_batcher(self):
+        with self._batcher_lock:
+            if self._batcher is None:
+                self._senders = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_batches,
+                    thread_name_prefix="iris-client-sender",
+                )
+                self._batcher = threading.Thread(
+                    target=self._run_batcher, name="iris-client-batcher", daemon=True
+                )
+                self._batcher.start()
+
+    def _run_batcher(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window_s
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            # 전송 중인 배치가 max_concurrent_batches개면 하나가 끝날 때까지 대기
+            self._send_slots.acquire()
+            self._senders.submit(self._send_batch, batch)
+
+    def _send_batch(self, batch):
+        try:
+            results = self.predict_batch([features for features, _ in batch])
+        except Exception as e:  # noqa: BLE001
+            # 어떤 오류든 묶인 요청마다 전달해야 기다리는 호출자가 멈추지 않음
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        finally:
+            self._send_slots.release()
+
+    def close(self):
+        """대기 중인 예측을 보내고 연결 종료"""
+        with self._batcher_lock:
+            batcher, self._batcher = self._batcher, None
+            senders, self._senders = self._senders, None
+        if batcher is not None:
+            self._queue.put(_STOP)
+            batcher.join()
+            senders.shutdown(wait=True)
+        self._http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncIrisClient:
+    """asyncio 클라이언트 - 같은 이벤트 루프의 predict 호출을 배치로 묶어 전송"""
+
+    def __init__(
+        self,
+        base_url="http://localhost:8000",
+        timeout=5.0,
+        max_retries=3,
+        backoff_s=0.05,
+        max_backoff_s=2.0,
+        batch_window_ms=2.0,
+        max_batch_size=64,
+        max_connections=10,
+        http_client=None,
+    ):
+        self._http = http_client or httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self.retry = _RetryPolicy(max_retries, backoff_s, max_backoff_s)
+        self.batch_window_s = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._pending = []
+        self._timer = None
+        self._sending = set()
+
+    @classmethod
+    def for_app(cls, app, **kwargs):
+        """같은 프로세스의 ASGI 앱에 연결 (서버 없이 테스트)"""
+        http_client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+        )
+        return cls(http_client=http_client, **kwargs)
+
+    async def _request(self, method, path, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                response = await self._http.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if not self.retry.should_retry(attempt, error=e):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+            else:
+                if not self.retry.should_retry(attempt, response=response):
+                    response.raise_for_status()
+                    return response.json()
+                await asyncio.sleep(self.retry.delay(attempt, response))
+            attempt += 1
+
+    async def health(self):
+        return await self._request("GET", "/health")
+
+    async def model_info(self):
+        return await self._request("GET", "/model/info")
+
+    async def predict_batch(self, rows):
+        """여러 행을 한 번에 예측 (행별 결과에 model_version 포함)"""
+        rows = [list(row) for row in rows]
+        chunks = [
+            rows[start : start + self.max_batch_size]
+            for start in range(0, len(rows), self.max_batch_size)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self._request("POST", "/predict/batch", json={"instances": chunk})
+                for chunk in chunks
+            )
+        )
+        return [result for response in responses for result in _with_version(response)]
+
+    async def predict(self, features):
+        """한 행 예측 - 같은 시간대의 다른 호출과 묶어서 전송
+
+        Raises:
+            ValueError: 행이 N_FEATURES개의 유한한 숫자가 아닐 때 (전송하지 않음)
+        """
+        row = _validate_row(features)
+        if self.batch_window_s <= 0:
+            return await self._request("POST", "/predict", json={"features": row})
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_window_s, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send_batch(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send_batch(self, batch):
+        try:
+            results = await self.predict_batch([features for features, _ in batch])
+        except Exception as e:  # noqa: BLE001
+            # 어떤 오류든 묶인 요청마다 전달해야 기다리는 호출자가 멈추지 않음
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def aclose(self):
+        """대기 중인 예측을 보내고 연결 종료"""
+        self._flush()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+        await self._http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
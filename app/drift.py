@@ -0,0 +1,169 @@
+"""실시간 입력 특성 드리프트 감시
+
+`/predict` 입력을 미리 할당한 NumPy 링 버퍼에 복사만 해 두고, 백그라운드 스레드가
+주기적으로 버퍼 전체를 한 번에 구간화해 학습 데이터 기준 통계(reference_stats.json)와
+PSI/KS로 비교합니다. 버퍼와 결과 모두 크기가 고정되어 있어 메모리 사용량이 늘지 않습니다.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+# PSI 해석 기준 (일반적으로 쓰이는 경계)
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+
+# 빈 구간에서 log(0)을 피하기 위한 최소 비율
+EPSILON = 1e-4
+
+
+def population_stability_index(expected, actual):
+    """구간별 비율 두 개의 PSI"""
+    expected = np.clip(expected, EPSILON, None)
+    actual = np.clip(actual, EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_statistic(expected, actual):
+    """구간 경계에서 계산한 두 누적분포의 최대 차이 (구간화된 KS 통계량)"""
+    return float(np.max(np.abs(np.cumsum(expected) - np.cumsum(actual))))
+
+
+def _status(psi):
+    if psi >= PSI_SIGNIFICANT:
+        return "significant"
+    if psi >= PSI_MODERATE:
+        return "moderate"
+    return "stable"
+
+
+def sample_reference(reference, n_samples=2000, random_state=0):
+    """기준 통계의 특성별 구간 비율을 따르는 입력 표본 (특성 간 상관은 반영하지 않음)
+
+    구간을 비율대로 고른 뒤 구간 안에서 균등하게 뽑으며, 양 끝 구간은 평균 구간 폭만큼으로 자릅니다.
+    """
+    rng = np.random.default_rng(random_state)
+    columns = []
+    for edges, fractions in zip(reference["bin_edges"], reference["bin_fractions"]):
+        edges = np.asarray(edges, dtype=np.float64)
+        fractions = np.asarray(fractions, dtype=np.float64)
+        if len(edges) == 0:
+            columns.append(np.zeros(n_samples))
+            continue
+        width = (edges[-1] - edges[0]) / max(len(edges) - 1, 1) or 1.0
+        bounds = np.concatenate([[edges[0] - width], edges, [edges[-1] + width]])
+        bins = rng.choice(len(fractions), size=n_samples, p=fractions / fractions.sum())
+        columns.append(rng.uniform(bounds[bins], bounds[bins + 1]))
+    return np.column_stack(columns)
+
+
+class DriftMonitor:
+    """링 버퍼에 입력을 모으고 기준 통계와 주기적으로 비교"""
+
+    def __init__(self, n_features=4, capacity=4096, min_samples=100):
+        self.capacity = capacity
+        self.min_samples = min_samples
+        self.reference = None
+        self.latest = None
+        self._buffer = np.empty((capacity, n_features), dtype=np.float64)
+        self._seen = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_reference(self, reference):
+        """기준 통계 교체 (새 모델 로드 시) - 이전 입력은 비움"""
+        with self._lock:
+            self.reference = reference
+            self.latest = None
+            self._seen = 0
+
+    def observe(self, X):
+        """입력 행들을 링 버퍼에 복사 (요청 경로에서 호출)"""
+        if self.reference is None:
+            return
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self._buffer.shape[1])
+        X = X[-self.capacity :]
+        with self._lock:
+            start = self._seen % self.capacity
+            end = start + len(X)
+            if end <= self.capacity:
+                self._buffer[start:end] = X
+            else:
+                split = self.capacity - start
+                self._buffer[start:] = X[:split]
+                self._buffer[: end - self.capacity] = X[split:]
+            self._seen += len(X)
+
+    def window(self):
+        """현재 버퍼에 있는 입력 (복사본)"""
+        with self._lock:
+            return self._buffer[: min(self._seen, self.capacity)].copy()
+
+    def update(self):
+        """버퍼 전체를 기준 통계와 비교해 latest 갱신"""
+        reference = self.reference
+        if reference is None:
+            return None
+
+        start = time.perf_counter()
+        X = self.window()
+        report = {
+            "computed_at": datetime.now().isoformat(),
+            "window_size": len(X),
+            "observed_total": self._seen,
+            "reference_samples": reference["n_samples"],
+            "features": {},
+        }
+        if len(X) >= self.min_samples:
+            for j, name in enumerate(reference["feature_names"]):
+                edges = np.asarray(reference["bin_edges"][j])
+                expected = np.asarray(reference["bin_fractions"][j])
+                counts = np.bincount(
+                    np.searchsorted(edges, X[:, j], side="right"),
+                    minlength=len(expected),
+                )
+                actual = counts / len(X)
+                psi = population_stability_index(expected, actual)
+                report["features"][name] = {
+                    "psi": psi,
+                    "ks": ks_statistic(expected, actual),
+                    "status": _status(psi),
+                }
+
+        statuses = [feature["status"] for feature in report["features"].values()]
+        if not statuses:
+            report["status"] = "insufficient_data"
+        elif "significant" in statuses:
+            report["status"] = "drift"
+        elif "moderate" in statuses:
+            report["status"] = "warning"
+        else:
+            report["status"] = "stable"
+        report["compute_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        self.latest = report
+        return report
+
+    def _run(self, interval_s):
+        while not self._stop.wait(interval_s):
+            self.update()
+
+    def start(self, interval_s):
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval_s,), name="drift-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
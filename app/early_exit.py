@@ -0,0 +1,134 @@
+"""조기 종료(early-exit) RandomForest 추론
+
+모든 트리의 노드를 하나의 NumPy 배열로 펼쳐 두고, 트리를 chunk_size개씩 벡터화해서
+평가합니다. 행마다 누적 확률 합을 유지하며 다음 조건에서 멈춥니다.
+
+- exact: 1위 클래스와 2위 클래스의 누적 차이가 남은 트리 수보다 크면 멈춤.
+  트리 하나가 한 클래스에 더할 수 있는 값은 최대 1이므로, 남은 트리를 모두 평가해도
+  1위가 바뀌지 않습니다. 예측 클래스는 전체 포레스트와 항상 같습니다.
+- budget: exact 조건에 더해 요청별 시간 예산(budget_ms)을 넘으면 그때까지의 결과를 반환.
+  근사이므로 `measure()`로 전체 포레스트와의 일치율을 측정해 함께 보고합니다.
+
+반환하는 확률은 사용한 트리들의 평균입니다.
+"""
+
+import time
+
+import numpy as np
+
+TREE_LEAF = -1
+
+EARLY_EXIT_MODES = ("exact", "budget")
+
+# 누적 합의 부동소수점 오차 때문에 경계에서 잘못 멈추지 않도록 두는 여유
+MARGIN_EPSILON = 1e-9
+
+
+class FlatForest:
+    """RandomForestClassifier의 트리들을 펼친 배열과 조기 종료 추론"""
+
+    def __init__(self, model, chunk_size=8):
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        counts = np.array([tree.node_count for tree in trees])
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+        def shifted(children, offset):
+            return np.where(children == TREE_LEAF, TREE_LEAF, children + offset)
+
+        self.left = np.concatenate(
+            [shifted(t.children_left, o) for t, o in zip(trees, offsets)]
+        )
+        self.right = np.concatenate(
+            [shifted(t.children_right, o) for t, o in zip(trees, offsets)]
+        )
+        self.is_leaf = self.left == TREE_LEAF
+        self.feature = np.where(
+            self.is_leaf, 0, np.concatenate([t.feature for t in trees])
+        )
+        self.threshold = np.concatenate([t.threshold for t in trees])
+
+        values = np.concatenate([t.value[:, 0, :] for t in trees])
+        self.value = values / values.sum(axis=1, keepdims=True)
+
+        self.roots = offsets
+        self.n_trees = len(trees)
+        self.max_depth = max(t.max_depth for t in trees)
+        self.classes_ = model.classes_
+        self.chunk_size = chunk_size
+
+    def _leaf_values(self, X, tree_indices):
+        """행 X와 트리 tree_indices 조합의 리프 확률 (n_rows, n_trees, n_classes)"""
+        node = np.tile(self.roots[tree_indices], (len(X), 1))
+        rows = np.arange(len(X))[:, None]
+        for _ in range(self.max_depth):
+            leaf = self.is_leaf[node]
+            if leaf.all():
+                break
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            child = np.where(go_left, self.left[node], self.right[node])
+            node = np.where(leaf, node, child)
+        return self.value[node]
+
+    def predict_proba(self, X, mode="exact", budget_ms=None):
+        """조기 종료 추론
+
+        Args:
+            X: 입력 (n_rows, n_features)
+            mode: "exact" 또는 "budget"
+            budget_ms: budget 모드의 요청별 시간 예산
+
+        Returns:
+            (확률 (n_rows, n_classes), 행별 사용한 트리 수)
+        """
+        if mode not in EARLY_EXIT_MODES:
+            raise ValueError(f"지원하지 않는 모드: {mode}")
+        start = time.perf_counter()
+
+        # sklearn과 같이 float32로 변환한 값으로 비교
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        n_rows = len(X)
+        totals = np.zeros((n_rows, len(self.classes_)))
+        trees_used = np.zeros(n_rows, dtype=np.int64)
+        active = np.arange(n_rows)
+
+        for chunk_start in range(0, self.n_trees, self.chunk_size):
+            tree_indices = np.arange(
+                chunk_start, min(chunk_start + self.chunk_size, self.n_trees)
+            )
+            totals[active] += self._leaf_values(X[active], tree_indices).sum(axis=1)
+            trees_used[active] = tree_indices[-1] + 1
+
+            remaining = self.n_trees - trees_used[active]
+            top2 = np.sort(totals[active], axis=1)[:, -2:]
+            decided = top2[:, 1] - top2[:, 0] > remaining + MARGIN_EPSILON
+            active = active[~decided]
+            if len(active) == 0:
+                break
+            if (
+                mode == "budget"
+                and budget_ms is not None
+                and (time.perf_counter() - start) * 1000 >= budget_ms
+            ):
+                break
+
+        return totals / trees_used[:, None], trees_used
+
+    def predict(self, X, mode="exact", budget_ms=None):
+        proba, trees_used = self.predict_proba(X, mode, budget_ms)
+        return self.classes_.take(proba.argmax(axis=1)), trees_used
+
+    def measure(self, model, X, budget_ms):
+        """전체 포레스트 대비 exact/budget 모드의 일치율과 평균 사용 트리 수"""
+        X = np.asarray(X)
+        reference = model.predict(X)
+        report = {"n_trees": self.n_trees, "budget_ms": budget_ms, "samples": len(X)}
+        for mode in EARLY_EXIT_MODES:
+            # 서빙과 같이 한 행씩 예측 (시간 예산은 요청 단위)
+            results = [
+                self.predict(X[i : i + 1], mode, budget_ms) for i in range(len(X))
+            ]
+            predictions = np.concatenate([p for p, _ in results])
+            trees_used = np.concatenate([t for _, t in results])
+            report[f"{mode}_agreement_rate"] = float(np.mean(predictions == reference))
+            report[f"{mode}_mean_trees_used"] = float(trees_used.mean())
+        return report
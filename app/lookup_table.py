@@ -0,0 +1,184 @@
+"""분할 임계값 격자 기반 예측 조회 테이블
+
+트리 모델은 특성별 분할 임계값 사이에서는 어떤 트리도 다른 가지로 가지 않으므로,
+모든 트리의 임계값을 구간 경계로 쓰는 격자 칸 안에서는 predict_proba가 상수입니다.
+모델 로드 시 칸마다 대표점 하나로 확률을 미리 계산해 두면, 요청은 특성별 searchsorted와
+배열 인덱싱만으로 모델과 같은 확률을 얻습니다.
+
+칸 수는 특성별 (임계값 수 + 1)의 곱이라 max_cells로 제한합니다. 넘으면 바깥쪽 임계값을
+하나씩 빼서 격자 범위를 좁히고, 범위를 벗어난 입력은 모델로 계산합니다 (범위 안의 칸은 여전히 정확).
+어느 임계값을 뺄지는 참고 입력(X_ref)이 있으면 줄어드는 칸 수 대비 범위 밖으로 밀려나는
+참고 입력이 가장 적은 쪽을, 없으면 임계값이 가장 많은 특성의 중앙값에서 먼 쪽 끝을 고릅니다.
+"""
+
+import time
+
+import numpy as np
+
+# 대표점 확률 계산 시 한 번에 예측하는 행 수 (빌드 중 임시 메모리 제한)
+BUILD_CHUNK_ROWS = 65_536
+
+
+def split_thresholds(model, n_features):
+    """특성별로 모든 트리의 분할 임계값 (정렬, 중복 제거)"""
+    estimators = getattr(model, "estimators_", [model])
+    thresholds = [[] for _ in range(n_features)]
+    for estimator in estimators:
+        tree = estimator.tree_
+        internal = tree.children_left != tree.children_right
+        for feature in range(n_features):
+            thresholds[feature].append(
+                tree.threshold[internal & (tree.feature == feature)]
+            )
+    return [np.unique(np.concatenate(t)) for t in thresholds]
+
+
+def _trim_candidates(kept, X_ref, covered):
+    """제거 후보 (비용, 특성, 아래쪽 끝 여부) - 비용이 가장 작은 후보를 제거"""
+    for feature, edges in enumerate(kept):
+        if len(edges) == 0:
+            continue
+        for low_end in (True, False):
+            if X_ref is None:
+                # 임계값이 가장 많은 특성의, 중앙값에서 먼 쪽 끝
+                center = np.median(edges)
+                farther_low = center - edges[0] > edges[-1] - center
+                cost = (-len(edges), low_end != farther_low)
+            else:
+                # 칸 감소율(로그) 대비 범위 밖으로 밀려나는 참고 입력 수
+                column = X_ref[:, feature]
+                outside = column <= edges[0] if low_end else column > edges[-1]
+                gain = np.log((len(edges) + 1) / len(edges))
+                cost = (np.sum(covered & outside) / gain, -len(edges))
+            yield cost, feature, low_end
+
+
+def _trim(thresholds, max_cells, X_ref=None):
+    """칸 수가 max_cells 이하가 되도록 바깥쪽 임계값을 제거
+
+    Returns:
+        (특성별 격자 내부 경계, 특성별 (하한, 상한) 범위 - 하한 < x <= 상한만 격자 사용)
+    """
+    kept = [t.copy() for t in thresholds]
+    bounds = [[-np.inf, np.inf] for _ in thresholds]
+    covered = None if X_ref is None else np.ones(len(X_ref), dtype=bool)
+    while np.prod([len(t) + 1 for t in kept], dtype=np.float64) > max_cells:
+        candidates = list(_trim_candidates(kept, X_ref, covered))
+        if not candidates:
+            raise ValueError(f"max_cells={max_cells}로는 격자를 만들 수 없습니다")
+        _, feature, low_end = min(candidates)
+        edges = kept[feature]
+        if low_end:
+            bounds[feature][0] = edges[0]
+            kept[feature] = edges[1:]
+        else:
+            bounds[feature][1] = edges[-1]
+            kept[feature] = edges[:-1]
+        if covered is not None:
+            column = X_ref[:, feature]
+            covered &= (column > bounds[feature][0]) & (column <= bounds[feature][1])
+    return kept, bounds
+
+
+def _representatives(edges, lower, upper):
+    """각 칸 (경계[i-1], 경계[i]]에 속하는 float32 값 하나 (sklearn과 같은 float32 비교)"""
+    uppers = np.append(edges, upper)
+    points = uppers.astype(np.float32)
+    # float32로 올림된 값은 칸을 넘어가므로 한 칸 아래 float32로 내림
+    over = points.astype(np.float64) > uppers
+    points[over] = np.nextafter(points[over], np.float32(-np.inf))
+    if np.isinf(upper):
+        last = np.float32(edges[-1]) if len(edges) else np.float32(lower)
+        if np.isinf(last):
+            last = np.float32(0)
+        points[-1] = np.nextafter(last, np.float32(np.inf))
+    return points
+
+
+class LookupTable:
+    """격자 칸별 확률 테이블과 범위 밖 입력의 모델 대체"""
+
+    def __init__(self, model, n_features, max_cells=500_000, X_ref=None):
+        """
+        Args:
+            max_cells: 격자 칸 수 상한 (테이블 메모리 = 칸 수 * 클래스 수 * 8바이트)
+            X_ref: 격자 범위를 정할 때 최대한 포함할 참고 입력 (예: 학습 데이터 분포 표본)
+        """
+        start = time.perf_counter()
+        self.classes_ = model.classes_
+        thresholds = split_thresholds(model, n_features)
+        if X_ref is not None:
+            X_ref = np.asarray(X_ref, dtype=np.float32).astype(np.float64)
+        self.edges, bounds = _trim(thresholds, max_cells, X_ref)
+        self.lower = np.array([b[0] for b in bounds])
+        self.upper = np.array([b[1] for b in bounds])
+        self.shape = tuple(len(e) + 1 for e in self.edges)
+        self.trimmed_thresholds = int(
+            sum(len(t) - len(e) for t, e in zip(thresholds, self.edges))
+        )
+
+        axes = [
+            _representatives(e, lo, hi)
+            for e, lo, hi in zip(self.edges, self.lower, self.upper)
+        ]
+        n_cells = int(np.prod(self.shape))
+        self.proba = np.empty((n_cells, len(self.classes_)))
+        for chunk_start in range(0, n_cells, BUILD_CHUNK_ROWS):
+            index = np.arange(chunk_start, min(chunk_start + BUILD_CHUNK_ROWS, n_cells))
+            cells = np.unravel_index(index, self.shape)
+            X = np.column_stack([axis[c] for axis, c in zip(axes, cells)])
+            self.proba[index] = model.predict_proba(X)
+
+        self.hits = 0
+        self.fallbacks = 0
+        self.build_ms = (time.perf_counter() - start) * 1000
+
+    @property
+    def nbytes(self):
+        return int(self.proba.nbytes + sum(e.nbytes for e in self.edges))
+
+    def lookup(self, X):
+        """격자 범위 안의 행은 테이블 확률, 밖의 행은 NaN
+
+        Returns:
+            (확률 (n_rows, n_classes), 격자 범위 안 여부 (n_rows,))
+        """
+        # sklearn과 같이 float32로 변환한 값으로 비교
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        inside = ((X > self.lower) & (X <= self.upper)).all(axis=1)
+        cells = tuple(
+            np.searchsorted(edges, X[:, j], side="left")
+            for j, edges in enumerate(self.edges)
+        )
+        flat = np.ravel_multi_index(cells, self.shape)
+        proba = np.where(inside[:, None], self.proba[flat], np.nan)
+        return proba, inside
+
+    def predict_proba(self, X, model):
+        """테이블 조회, 격자 밖의 행만 모델로 계산"""
+        proba, inside = self.lookup(X)
+        n_outside = int(len(inside) - inside.sum())
+        if n_outside:
+            outside = ~inside
+            proba[outside] = model.predict_proba(np.asarray(X)[outside])
+        self.hits += len(inside) - n_outside
+        self.fallbacks += n_outside
+        return proba
+
+    def stats(self):
+        return {
+            "cells": int(np.prod(self.shape)),
+            "grid_shape": list(self.shape),
+            "nbytes": self.nbytes,
+            "build_ms": round(self.build_ms, 3),
+            "trimmed_thresholds": self.trimmed_thresholds,
+            "bounds": [
+                [
+                    None if np.isinf(lo) else float(lo),
+                    None if np.isinf(hi) else float(hi),
+                ]
+                for lo, hi in zip(self.lower, self.upper)
+            ],
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+        }
@@ -1,24 +1,112 @@
+import asyncio
+import json
+import os
+import threading
+import time
+import tracemalloc
 from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Literal, Optional, Union
 
-import joblib
 import mlflow
 import mlflow.sklearn
 import numpy as np
-from fastapi import FastAPI, HTTPException
+from fastapi import (
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from mlflow.exceptions import MlflowException
 from mlflow.tracking import MlflowClient
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from app.admission import BoundedExecutor, Rejected
+from app.capture import CaptureSink
+from app.drift import DriftMonitor, sample_reference
+from app.early_exit import FlatForest
+from app.lookup_table import LookupTable
+from app.memory import MemoryTracker, process_rss_bytes, tracemalloc_top
+from app.model_watcher import ModelWatcher
+from app.profiling import ProfilingMiddleware, SamplingProfiler
+from app.response_modes import serializer
+from app.serialization import load_artifact
 
 # 전역 변수
 MODEL = None
 MODEL_INFO = None
+WARMUP_INFO = None
+LOADED_FINGERPRINT = None
+MODEL_WATCHER = None
+# 마지막 MLflow 레지스트리 조회 오류 (폴링마다 같은 오류를 다시 출력하지 않도록 기억)
+REGISTRY_ERROR = None
+# 모델 교체 후 부가 기능을 준비하는 스레드 (prepare_loaded_model)
+POST_LOAD_THREAD = None
+
+# 증류한 저지연 모델 (원본 모델과 같은 학습에서 만든 것만 사용)
+FAST_MODEL = None
+FAST_MODEL_INFO = None
+FAST_MODEL_PATH = Path("models/fast_model.pkl")
+
+# 요청 샘플링 프로파일러 (관리 API로 켜기 전에는 동작하지 않음)
+PROFILER = SamplingProfiler(
+    sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0.01")),
+    interval_ms=float(os.getenv("PROFILE_INTERVAL_MS", "5")),
+)
+
+# 입력 드리프트 감시 (환경변수 DRIFT_WINDOW: 링 버퍼 크기, DRIFT_INTERVAL: 계산 주기 초)
+DRIFT_MONITOR = DriftMonitor(capacity=int(os.getenv("DRIFT_WINDOW", "4096")))
+REFERENCE_STATS_PATH = Path("models/reference_stats.json")
+
+# WebSocket 연결당 동시에 처리하는 메시지 수와 메시지당 최대 행 수
+WS_MAX_IN_FLIGHT = int(os.getenv("WS_MAX_IN_FLIGHT", "32"))
+WS_MAX_BATCH = int(os.getenv("WS_MAX_BATCH", "256"))
+
+# /predict/batch 요청당 최대 행 수
+PREDICT_MAX_BATCH = int(os.getenv("PREDICT_MAX_BATCH", "1024"))
+
+# 요청/응답 캡처 (CAPTURE_DIR을 설정하면 lifespan에서 시작)
+CAPTURE_SINK = None
+
+# 모델/프로세스 메모리 집계와 리로드별 기록
+MEMORY_TRACKER = MemoryTracker()
+
+# 수동 리로드와 자동 감시가 동시에 모델을 바꾸지 않도록 직렬화
+RELOAD_LOCK = threading.Lock()
+
+# 워밍업에 사용할 배치 크기 (단건 요청 + 작은/큰 배치)
+WARMUP_BATCH_SIZES = (1, 8, 64)
+
+# 조기 종료 추론: budget 모드의 기본 시간 예산과 일치율 측정 표본 수
+EARLY_EXIT_BUDGET_MS = float(os.getenv("EARLY_EXIT_BUDGET_MS", "1.0"))
+EARLY_EXIT_SAMPLES = 256
+FLAT_FOREST = None
+EARLY_EXIT_INFO = None
+
+# 분할 임계값 격자 조회 테이블 (LOOKUP_TABLE_MAX_CELLS > 0이면 로드 시 생성, 0이면 끔)
+LOOKUP_TABLE_MAX_CELLS = int(os.getenv("LOOKUP_TABLE_MAX_CELLS", "0"))
+LOOKUP_TABLE = None
+
+# 추론 전용 스레드풀 (환경변수 INFERENCE_MAX_CONCURRENCY / _MAX_QUEUE / _DEADLINE_MS)
+INFERENCE_EXECUTOR = BoundedExecutor.from_env(
+    "INFERENCE", max_workers=os.cpu_count() or 4, max_queue=64, deadline_ms=1000
+)
+# MLflow 관리 API 전용 스레드풀 - 느린 레지스트리 호출이 추론을 막지 않도록 분리
+ADMIN_EXECUTOR = BoundedExecutor.from_env(
+    "ADMIN", max_workers=2, max_queue=8, deadline_ms=30000
+)
 
 
 def load_model():
-    """MLflow 또는 로컬 파일에서 모델 로드"""
-    global MODEL, MODEL_INFO
+    """MLflow 또는 로컬 파일에서 모델 로드
 
+    서빙 중인 전역 모델은 바꾸지 않고 (model, model_info)를 반환합니다 (교체는 refresh_model).
+    """
     # 1순위: MLflow에서 프로덕션 모델 로드
     client = MlflowClient()
 
@@ -47,8 +135,7 @@ def load_model():
                 run = client.get_run(version_info.run_id)
                 model = mlflow.sklearn.load_model(model_uri=model_uri)
 
-                MODEL = model
-                MODEL_INFO = {
+                model_info = {
                     "version": f"mlflow-v{version_info.version}",
                     "metrics": run.data.metrics,
                     "source": "mlflow",
@@ -65,11 +152,11 @@ def load_model():
 
                 # 파라미터 정보 추가
                 if run.data.params:
-                    MODEL_INFO["params"] = run.data.params
+                    model_info["params"] = run.data.params
 
                 print(f"✅ MLflow 모델 로드 (latest): v{version_info.version}")
                 print(f"   MLflow Run ID: {version_info.run_id}")
-                return
+                return model, model_info
 
             if not latest_versions:
                 continue
@@ -78,8 +165,7 @@ def load_model():
             version_info = latest_versions[0]
             run = client.get_run(version_info.run_id)
 
-            MODEL = model
-            MODEL_INFO = {
+            model_info = {
                 "version": f"mlflow-v{version_info.version}",
                 "metrics": run.data.metrics,
                 "source": "mlflow",
@@ -96,12 +182,12 @@ def load_model():
 
             # 파라미터 정보 추가
             if run.data.params:
-                MODEL_INFO["params"] = run.data.params
+                model_info["params"] = run.data.params
 
             stage_name = stage or "latest"
             print(f"✅ MLflow 모델 로드 ({stage_name}): v{version_info.version}")
             print(f"   MLflow Run ID: {version_info.run_id}")
-            return
+            return model, model_info
 
         except Exception as e:
             if stage == stages_to_try[-1]:  # 마지막 시도에서만 경고 출력
@@ -111,10 +197,10 @@ def load_model():
     # 2순위: 로컬 파일에서 모델 로드 (기존 방식)
     model_path = Path("models/model.pkl")
     if model_path.exists():
-        model_artifact = joblib.load(model_path)
+        model_artifact = load_artifact(model_path)
 
-        MODEL = model_artifact["model"]
-        MODEL_INFO = {
+        model = model_artifact["model"]
+        model_info = {
             "version": model_artifact["version"],
             "metrics": model_artifact["metrics"],
             "source": "local",
@@ -140,24 +226,322 @@ def load_model():
 
         # MLflow run_id가 있으면 추가
         if "mlflow_run_id" in model_artifact:
-            MODEL_INFO["mlflow_run_id"] = model_artifact["mlflow_run_id"]
+            model_info["mlflow_run_id"] = model_artifact["mlflow_run_id"]
         if "params" in model_artifact:
-            MODEL_INFO["params"] = model_artifact["params"]
+            model_info["params"] = model_artifact["params"]
+
+        print(f"✅ 로컬 모델 로드: {model_info['version']}")
+        if "mlflow_run_id" in model_info:
+            print(f"   MLflow Run ID: {model_info['mlflow_run_id']}")
+        return model, model_info
+
+    raise FileNotFoundError("모델을 찾을 수 없습니다!")
+
 
-        print(f"✅ 로컬 모델 로드: {MODEL_INFO['version']}")
-        if "mlflow_run_id" in MODEL_INFO:
-            print(f"   MLflow Run ID: {MODEL_INFO['mlflow_run_id']}")
+def load_fast_model(model_info):
+    """model_info의 모델과 같은 학습에서 증류한 fast 티어 모델 로드
+
+    MLflow 모델은 같은 run의 fast_model 아티팩트를, 로컬 모델은 models/fast_model.pkl 중
+    원본 모델 version이 일치하는 것만 사용합니다.
+    Returns:
+        (fast_model, fast_model_info): 없으면 (None, None) - fast 티어를 끔
+    """
+    model, metrics = None, None
+    if model_info.get("source") == "mlflow":
+        try:
+            model = mlflow.sklearn.load_model(
+                f"runs:/{model_info['run_id']}/fast_model"
+            )
+            metrics = {
+                name.removeprefix("fast_"): value
+                for name, value in model_info["metrics"].items()
+                if name.startswith("fast_")
+            }
+        except (MlflowException, OSError) as e:
+            print(f"⚠️ fast 티어 모델 없음: {e}")
+    elif FAST_MODEL_PATH.exists():
+        fast_artifact = load_artifact(FAST_MODEL_PATH)
+        if fast_artifact.get("teacher_version") == model_info["version"]:
+            model, metrics = fast_artifact["model"], fast_artifact.get("metrics", {})
+
+    if model is None:
+        return None, None
+
+    fast_model_info = {
+        "version": f"{model_info['version']}-fast",
+        "target_names": model_info["target_names"],
+        "metrics": metrics,
+    }
+    print(f"⚡ fast 티어 모델 로드: {fast_model_info['version']}")
+    return model, fast_model_info
+
+
+def warm_up_model(model, model_info, fast_model=None):
+    """합성 배치로 모델을 미리 실행해 첫 요청의 지연을 없애고 워밍업 정보 반환
+
+    lazy import, 첫 joblib dispatch, 캐시 적재 비용을 요청 대신 여기서 치릅니다.
+    fast 티어 모델이 있으면 함께 워밍업합니다.
+    """
+    models = [model] if fast_model is None else [model, fast_model]
+    rng = np.random.default_rng(0)
+    n_features = len(model_info["feature_names"])
+
+    start = time.perf_counter()
+    for batch_size in WARMUP_BATCH_SIZES:
+        X = rng.uniform(0.0, 8.0, size=(batch_size, n_features))
+        for warm_model in models:
+            warm_model.predict(X)
+            warm_model.predict_proba(X)
+    duration_ms = (time.perf_counter() - start) * 1000
+
+    print(f"🔥 모델 워밍업 완료: {duration_ms:.1f}ms (배치 {list(WARMUP_BATCH_SIZES)})")
+    return {
+        "model_version": model_info["version"],
+        "batch_sizes": list(WARMUP_BATCH_SIZES),
+        "duration_ms": round(duration_ms, 3),
+        "warmed_at": datetime.now().isoformat(),
+    }
+
+
+def _registry_fingerprint():
+    """load_model과 같은 우선순위로 찾은 MLflow 레지스트리 버전의 지문 (없으면 None)"""
+    client = MlflowClient()
+    for stage in ["Production", "Staging"]:
+        versions = client.get_latest_versions("iris-classifier", stages=[stage])
+        if versions:
+            return f"mlflow-v{versions[0].version}"
+    versions = client.get_latest_versions("iris-classifier")
+    if versions:
+        return f"mlflow-v{max(int(v.version) for v in versions)}"
+    return None
+
+
+def resolve_model_fingerprint():
+    """지금 로드되어야 할 모델의 지문 (모델을 내려받지 않는 가벼운 조회)
+
+    load_model과 같은 우선순위로 MLflow 레지스트리 버전을 확인하고,
+    MLflow를 쓸 수 없으면 models/model.pkl의 mtime과 크기를 사용합니다.
+    """
+    global REGISTRY_ERROR
+
+    try:
+        fingerprint = _registry_fingerprint()
+    except MlflowException as e:
+        # 서버 연결 실패, 등록된 모델 없음 등 - 폴링마다 반복되므로 오류가 바뀔 때만 출력
+        if str(e) != REGISTRY_ERROR:
+            print(f"⚠️ MLflow 레지스트리 조회 실패, 로컬 모델 파일로 확인: {e}")
+        REGISTRY_ERROR = str(e)
     else:
-        raise FileNotFoundError("모델을 찾을 수 없습니다!")
+        REGISTRY_ERROR = None
+        if fingerprint is not None:
+            return fingerprint
+
+    model_path = Path("models/model.pkl")
+    if model_path.exists():
+        stat = model_path.stat()
+        return f"local-{stat.st_mtime_ns}-{stat.st_size}"
+    return None
+
+
+def load_reference_stats():
+    """로드된 모델의 드리프트 기준 통계 (MLflow run 아티팩트 → 로컬 파일 순)"""
+    if MODEL_INFO.get("source") == "mlflow":
+        try:
+            return mlflow.artifacts.load_dict(
+                f"runs:/{MODEL_INFO['run_id']}/reference_stats.json"
+            )
+        except (MlflowException, OSError, ValueError) as e:
+            # 아티팩트가 없거나 내려받지 못했거나 JSON이 깨진 경우 로컬 파일로 대체
+            print(f"⚠️ MLflow 기준 통계 로드 실패: {e}")
+
+    if REFERENCE_STATS_PATH.exists():
+        return json.loads(REFERENCE_STATS_PATH.read_text())
+    return None
+
+
+def flat_forest():
+    """현재 모델의 조기 종료용 FlatForest (포레스트 모델이 아니면 None)
+
+    refresh_model이 로드할 때 만들어 두므로 보통은 바로 반환합니다. 모델을 직접 바꿔
+    없을 때만 여기서 만드므로, 이벤트 루프가 아닌 추론 스레드에서 호출해야 합니다.
+    """
+    global FLAT_FOREST
+
+    model = MODEL
+    if not hasattr(model, "estimators_"):
+        return None
+    if FLAT_FOREST is None or FLAT_FOREST[0] is not model:
+        FLAT_FOREST = (model, FlatForest(model))
+    return FLAT_FOREST[1]
+
+
+def measure_early_exit():
+    """합성 표본에서 조기 종료 모드의 전체 모델 대비 일치율 측정"""
+    global EARLY_EXIT_INFO
+
+    forest = flat_forest()
+    if forest is None:
+        EARLY_EXIT_INFO = None
+        return None
+    rng = np.random.default_rng(0)
+    n_features = len(MODEL_INFO["feature_names"])
+    X = rng.uniform(0.0, 8.0, size=(EARLY_EXIT_SAMPLES, n_features))
+    EARLY_EXIT_INFO = forest.measure(MODEL, X, EARLY_EXIT_BUDGET_MS)
+    return EARLY_EXIT_INFO
+
+
+def build_lookup_table():
+    """현재 모델의 조회 테이블 생성 (격자 범위는 기준 통계 분포를 최대한 포함하도록 선택)"""
+    global LOOKUP_TABLE
+
+    model = MODEL
+    if LOOKUP_TABLE_MAX_CELLS <= 0 or not hasattr(model, "classes_"):
+        LOOKUP_TABLE = None
+        return None
+
+    reference = DRIFT_MONITOR.reference
+    X_ref = sample_reference(reference) if reference is not None else None
+    try:
+        table = LookupTable(
+            model,
+            len(MODEL_INFO["feature_names"]),
+            max_cells=LOOKUP_TABLE_MAX_CELLS,
+            X_ref=X_ref,
+        )
+    except (AttributeError, ValueError, MemoryError) as e:
+        # 트리 모델이 아니거나(tree_ 없음) max_cells로 격자를 만들 수 없거나 메모리 부족
+        print(f"⚠️ 조회 테이블 생성 실패: {e}")
+        LOOKUP_TABLE = None
+        return None
+
+    LOOKUP_TABLE = (model, table)
+    print(
+        f"🗂️ 조회 테이블 생성: {table.stats()['cells']}칸, "
+        f"{table.nbytes / 1024 / 1024:.1f}MB, {table.build_ms:.0f}ms"
+    )
+    return table
+
+
+def lookup_table():
+    """현재 모델의 조회 테이블 (없거나 다른 모델의 것이면 None)"""
+    entry = LOOKUP_TABLE
+    if entry is None or entry[0] is not MODEL:
+        return None
+    return entry[1]
+
+
+def refresh_model():
+    """모델을 로드·워밍업한 뒤 서빙 중인 모델과 한 번에 교체
+
+    로드와 워밍업은 지역 변수에서 끝내므로 그동안 요청은 기존 모델이 처리하고,
+    /ready는 리로드가 끝날 때까지 503을 반환합니다 (실패하면 이전 상태로 복구).
+    드리프트 기준 통계, 조회 테이블, 조기 종료 측정은 교체 후 백그라운드에서 준비합니다.
+    """
+    global MODEL, MODEL_INFO, FAST_MODEL, FAST_MODEL_INFO, FLAT_FOREST, WARMUP_INFO
+    global LOADED_FINGERPRINT, POST_LOAD_THREAD
+
+    with RELOAD_LOCK:
+        # 로드 전에 지문을 기록: 로드 중에 바뀌면 다음 폴링에서 다시 리로드됨
+        fingerprint = resolve_model_fingerprint()
+        previous_warmup, WARMUP_INFO = WARMUP_INFO, None
+        try:
+            model, model_info = load_model()
+            fast_model, fast_model_info = load_fast_model(model_info)
+            warmup_info = warm_up_model(model, model_info, fast_model)
+            # 조기 종료용 평탄화 포레스트도 요청 경로가 아니라 로드할 때 생성
+            flat = (model, FlatForest(model)) if hasattr(model, "estimators_") else None
+            # 모델 크기는 /model/info 요청이 아니라 로드할 때 계산
+            MEMORY_TRACKER.record_load(model, model_info["version"])
+        except BaseException:
+            WARMUP_INFO = previous_warmup
+            raise
+
+        # 워밍업 정보는 마지막에 설정해 모델이 모두 바뀐 뒤에만 ready가 됨
+        MODEL, MODEL_INFO, FAST_MODEL, FAST_MODEL_INFO, FLAT_FOREST, WARMUP_INFO = (
+            model,
+            model_info,
+            fast_model,
+            fast_model_info,
+            flat,
+            warmup_info,
+        )
+        LOADED_FINGERPRINT = fingerprint
+        POST_LOAD_THREAD = threading.Thread(
+            target=prepare_loaded_model, args=(model,), name="post-load", daemon=True
+        )
+        POST_LOAD_THREAD.start()
+
+
+def prepare_loaded_model(model):
+    """교체한 모델의 부가 기능 준비 (드리프트 기준 통계, 조회 테이블, 조기 종료 측정)
+
+    각각 MLflow 조회나 수백 번의 단건 예측이 필요해 로드 경로 밖에서 실행합니다.
+    그 사이 다른 모델로 바뀌었으면 아무것도 하지 않습니다.
+    """
+    with RELOAD_LOCK:
+        if MODEL is not model:
+            return
+        DRIFT_MONITOR.set_reference(load_reference_stats())
+        build_lookup_table()
+        measure_early_exit()
+
+
+def start_capture():
+    """CAPTURE_DIR이 설정되어 있으면 /predict 요청/응답 캡처 시작"""
+    global CAPTURE_SINK
+
+    directory = os.getenv("CAPTURE_DIR")
+    if not directory:
+        return None
+
+    CAPTURE_SINK = CaptureSink(
+        directory,
+        max_file_bytes=int(os.getenv("CAPTURE_MAX_FILE_MB", "64")) * 1024 * 1024,
+        max_files=int(os.getenv("CAPTURE_MAX_FILES", "10")),
+    )
+    CAPTURE_SINK.start()
+    print(f"📼 요청 캡처 시작: {directory}")
+    return CAPTURE_SINK
+
+
+def start_model_watcher():
+    """MODEL_WATCH_INTERVAL(초)이 설정되어 있으면 자동 리로드 감시 시작"""
+    global MODEL_WATCHER
+
+    interval = float(os.getenv("MODEL_WATCH_INTERVAL", "0"))
+    if interval <= 0:
+        return None
+
+    MODEL_WATCHER = ModelWatcher(
+        resolve_fingerprint=resolve_model_fingerprint,
+        loaded_fingerprint=lambda: LOADED_FINGERPRINT,
+        reload=refresh_model,
+        interval_s=interval,
+    )
+    MODEL_WATCHER.start()
+    print(f"👀 모델 자동 감시 시작: {interval:g}초 간격")
+    return MODEL_WATCHER
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # Startup: 앱 시작 시 실행
-    load_model()
+    refresh_model()
+    start_model_watcher()
+    start_capture()
+    drift_interval = float(os.getenv("DRIFT_INTERVAL", "30"))
+    if drift_interval > 0:
+        DRIFT_MONITOR.start(drift_interval)
     yield
     # Shutdown: 앱 종료 시 실행 (필요시 정리 작업)
+    if MODEL_WATCHER is not None:
+        MODEL_WATCHER.stop()
+    DRIFT_MONITOR.stop()
+    if CAPTURE_SINK is not None:
+        CAPTURE_SINK.close()
+    INFERENCE_EXECUTOR.shutdown()
+    ADMIN_EXECUTOR.shutdown()
 
 
 app = FastAPI(
@@ -166,6 +550,17 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
 )
+app.add_middleware(ProfilingMiddleware, profiler=PROFILER)
+
+
+@app.exception_handler(Rejected)
+async def rejected_handler(request: Request, exc: Rejected):
+    """승인 제어로 거절된 요청은 Retry-After와 함께 빠르게 응답"""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 
 class PredictionInput(BaseModel):
@@ -187,10 +582,74 @@ class PredictionOutput(BaseModel):
     prediction_name: str
     probability: List[float]
     model_version: str
+    trees_used: Optional[int] = None
+
+    # 예측한 모델의 classes_ (topk 응답 모드가 확률 위치를 클래스로 바꿀 때 사용, 응답에는 없음)
+    _classes: Optional[List] = PrivateAttr(None)
+
+    model_config = {"protected_namespaces": ()}
+
+
+class ClassPredictionOutput(BaseModel):
+    """response_mode=class 응답"""
+
+    prediction: int
+
+
+class TopKPredictionOutput(BaseModel):
+    """response_mode=topk[:k] 응답 (확률 내림차순 상위 k개 클래스와 확률)"""
+
+    prediction: int
+    top_k: List[int]
+    probability: List[float]
+    model_version: str
 
     model_config = {"protected_namespaces": ()}
 
 
+class BatchPredictionInput(BaseModel):
+    """배치 예측 입력 데이터 모델"""
+
+    instances: List[List[float]]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"instances": [[5.1, 3.5, 1.4, 0.2], [6.2, 3.4, 5.4, 2.3]]},
+        }
+    )
+
+
+class PredictionResult(BaseModel):
+    """배치 예측의 행별 결과"""
+
+    prediction: float
+    prediction_name: str
+    probability: List[float]
+
+
+class BatchPredictionOutput(BaseModel):
+    """배치 예측 결과 모델"""
+
+    predictions: List[PredictionResult]
+    model_version: str
+
+    model_config = {"protected_namespaces": ()}
+
+
+class ProfilingConfig(BaseModel):
+    """프로파일러 설정 변경 (지정한 항목만 변경)"""
+
+    enabled: Optional[bool] = None
+    sample_rate: Optional[float] = None
+    interval_ms: Optional[float] = None
+
+
+class TracemallocConfig(BaseModel):
+    """tracemalloc 켜기/끄기"""
+
+    enabled: bool
+
+
 @app.get("/")
 def read_root():
     """API 루트 엔드포인트"""
@@ -210,9 +669,23 @@ def health_check():
         "status": "healthy" if model_healthy else "degraded",
         "service": "ml-api",
         "model_loaded": model_healthy,
+        "executors": {
+            "inference": INFERENCE_EXECUTOR.stats(),
+            "admin": ADMIN_EXECUTOR.stats(),
+        },
+        "model_watcher": MODEL_WATCHER.stats() if MODEL_WATCHER else None,
+        "capture": CAPTURE_SINK.stats() if CAPTURE_SINK else None,
     }
 
 
+@app.get("/ready")
+def readiness_check():
+    """레디니스 체크 - 모델 로드와 워밍업이 끝나야 트래픽을 받을 수 있음"""
+    ready = MODEL is not None and WARMUP_INFO is not None
+    content = {"ready": ready, "warmup": WARMUP_INFO}
+    return JSONResponse(status_code=200 if ready else 503, content=content)
+
+
 @app.get("/model/info")
 def model_info():
     """모델 정보 조회 - 버전, 메트릭, 특성"""
@@ -239,27 +712,114 @@ def model_info():
     if "params" in MODEL_INFO:
         response["hyperparameters"] = MODEL_INFO["params"]
 
+    response["memory"] = {
+        **MEMORY_TRACKER.model_memory(MODEL),
+        "process_rss_bytes": process_rss_bytes(),
+    }
+    if EARLY_EXIT_INFO is not None:
+        response["early_exit"] = EARLY_EXIT_INFO
+    table = lookup_table()
+    if table is not None:
+        response["lookup_table"] = table.stats()
+    if FAST_MODEL_INFO is not None:
+        response["fast_tier"] = {
+            "model_version": FAST_MODEL_INFO["version"],
+            "metrics": FAST_MODEL_INFO["metrics"],
+        }
+
     return response
 
 
 @app.post("/model/reload")
-def reload_model():
+async def reload_model():
     """모델 리로드 - MLflow에서 최신 프로덕션 모델 로드"""
     try:
-        load_model()
+        await ADMIN_EXECUTOR.run(refresh_model)
         return {
             "status": "success",
             "message": "모델이 성공적으로 리로드되었습니다",
             "model_version": MODEL_INFO["version"],
             "source": MODEL_INFO.get("source", "unknown"),
+            "warmup_ms": WARMUP_INFO["duration_ms"],
         }
+    except Rejected:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"모델 리로드 실패: {str(e)}")
 
 
+@app.get("/monitoring/drift")
+def drift_report():
+    """입력 특성 드리프트 (최근 입력 vs 학습 데이터 기준 통계, 특성별 PSI/KS)"""
+    if DRIFT_MONITOR.reference is None:
+        return {
+            "enabled": False,
+            "reason": "기준 통계(reference_stats.json)가 없습니다",
+        }
+
+    # 백그라운드 계산이 꺼져 있으면 요청 시 계산
+    if DRIFT_MONITOR.latest is None or not DRIFT_MONITOR.running:
+        DRIFT_MONITOR.update()
+    return {"enabled": True, **DRIFT_MONITOR.latest}
+
+
+@app.get("/admin/profiling")
+def profiling_status():
+    """프로파일러 상태 조회"""
+    return PROFILER.stats()
+
+
+@app.post("/admin/profiling")
+def configure_profiling(config: ProfilingConfig):
+    """프로파일러 켜기/끄기, 샘플링 비율과 간격 변경"""
+    try:
+        PROFILER.configure(**config.model_dump())
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return PROFILER.stats()
+
+
+@app.get("/admin/profiling/collapsed", response_class=PlainTextResponse)
+def profiling_collapsed():
+    """누적 프로파일을 collapsed stack 형식으로 반환 (flamegraph.pl, speedscope)"""
+    return PROFILER.collapsed()
+
+
+@app.delete("/admin/profiling")
+def reset_profiling():
+    """누적 프로파일 초기화"""
+    PROFILER.reset()
+    return PROFILER.stats()
+
+
+@app.get("/admin/memory")
+def memory_status(top: int = 10):
+    """프로세스/모델 메모리와 리로드별 기록, tracemalloc 상위 할당 위치 조회"""
+    return {
+        "process_rss_bytes": process_rss_bytes(),
+        "model": MEMORY_TRACKER.model_memory(MODEL) if MODEL is not None else None,
+        "reloads": MEMORY_TRACKER.summary(),
+        "tracemalloc": tracemalloc_top(top),
+    }
+
+
+@app.post("/admin/memory/tracemalloc")
+def configure_tracemalloc(config: TracemallocConfig):
+    """tracemalloc 켜기/끄기 (켜져 있는 동안 할당마다 추가 비용 발생)"""
+    if config.enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not config.enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return {"tracing": tracemalloc.is_tracing()}
+
+
 @app.get("/model/experiments")
-def list_experiments():
+async def list_experiments():
     """MLflow 실험 목록 조회"""
+    return await ADMIN_EXECUTOR.run(_list_experiments)
+
+
+def _list_experiments():
     try:
         client = MlflowClient()
         experiments = client.search_experiments()
@@ -280,8 +840,12 @@ def list_experiments():
 
 
 @app.get("/model/versions")
-def list_model_versions():
+async def list_model_versions():
     """모델 버전 목록 조회"""
+    return await ADMIN_EXECUTOR.run(_list_model_versions)
+
+
+def _list_model_versions():
     try:
         client = MlflowClient()
         versions = client.get_latest_versions("iris-classifier")
@@ -302,22 +866,292 @@ def list_model_versions():
         return {"error": str(e)}
 
 
-@app.post("/predict", response_model=PredictionOutput)
-def predict(input_data: PredictionInput):
-    """실제 ML 모델로 예측"""
+@app.post(
+    "/predict",
+    response_model=Union[PredictionOutput, ClassPredictionOutput, TopKPredictionOutput],
+    response_model_exclude_none=True,
+    responses={
+        200: {
+            "description": "full/round 모드는 PredictionOutput, class 모드는 "
+            "ClassPredictionOutput, topk 모드는 TopKPredictionOutput"
+        }
+    },
+)
+async def predict(
+    input_data: PredictionInput,
+    early_exit: Optional[Literal["exact", "budget"]] = None,
+    budget_ms: Optional[float] = Query(None, ge=0),
+    tier: Literal["full", "fast"] = "full",
+    response_mode: Optional[str] = None,
+    x_response_mode: Optional[str] = Header(None),
+):
+    """실제 ML 모델로 예측 (추론 전용 스레드풀에서 실행)
+
+    tier=fast면 포레스트를 증류한 얕은 결정 트리로 예측합니다 (더 빠르지만 근사,
+    원본 대비 일치율은 /model/info의 fast_tier 참고).
+
+    early_exit를 지정하면 트리를 나눠 평가하다가 결과가 정해지면 멈추고,
+    응답의 trees_used에 사용한 트리 수를 담습니다.
+    - exact: 남은 트리로 1위가 바뀔 수 없을 때 멈춤 (예측 클래스는 전체 모델과 같음)
+    - budget: exact 조건 + 추론 시간 예산(budget_ms, 기본 EARLY_EXIT_BUDGET_MS) 초과 시 멈춤
+      (근사, 일치율은 /model/info의 early_exit 참고)
+
+    response_mode(쿼리) 또는 X-Response-Mode 헤더로 응답 필드를 줄일 수 있습니다
+    (full, class, topk[:k], round[:p] - app/response_modes.py 참고, 쿼리가 우선).
+    """
 
     # 입력 검증
     if len(input_data.features) != 4:
         raise HTTPException(400, "4개 특성 필요")
+    try:
+        serialize = serializer(response_mode or x_response_mode)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    _check_tier(tier)
+    if tier == "fast" and early_exit is not None:
+        raise HTTPException(400, "fast 티어에서는 조기 종료를 사용할 수 없습니다")
+
+    start = time.perf_counter()
+    if early_exit is None:
+        output = await INFERENCE_EXECUTOR.run(
+            _tracked_predict, input_data.features, tier
+        )
+    else:
+        # FlatForest 생성은 이벤트 루프를 막지 않도록 추론 스레드(_predict_early_exit)에서
+        if not hasattr(MODEL, "estimators_"):
+            raise HTTPException(400, "조기 종료는 포레스트 모델에서만 지원합니다")
+        output = await INFERENCE_EXECUTOR.run(
+            _tracked_predict_early_exit,
+            input_data.features,
+            early_exit,
+            EARLY_EXIT_BUDGET_MS if budget_ms is None else budget_ms,
+        )
+    _capture(
+        "/predict",
+        {
+            "tier": tier,
+            "early_exit": early_exit,
+            "budget_ms": budget_ms,
+            "response_mode": response_mode or x_response_mode,
+        },
+        input_data,
+        output,
+        start,
+    )
+    if serialize is None:
+        return output
+    return Response(serialize(output, output._classes), media_type="application/json")
+
+
+@app.post("/predict/batch", response_model=BatchPredictionOutput)
+async def predict_batch(
+    input_data: BatchPredictionInput, tier: Literal["full", "fast"] = "full"
+):
+    """여러 행을 한 번에 예측 (클라이언트 SDK의 요청 묶음 전송에 사용)"""
+    rows = input_data.instances
+    if not 1 <= len(rows) <= PREDICT_MAX_BATCH:
+        raise HTTPException(400, f"1~{PREDICT_MAX_BATCH}개 행 필요")
+    if any(len(row) != 4 for row in rows):
+        raise HTTPException(400, "4개 특성 필요")
+    _check_tier(tier)
+
+    start = time.perf_counter()
+    results, model_version = await INFERENCE_EXECUTOR.run(
+        _tracked_score_batch, rows, tier
+    )
+    output = BatchPredictionOutput(predictions=results, model_version=model_version)
+    _capture("/predict/batch", {"tier": tier}, input_data, output, start)
+    return output
+
+
+def _check_tier(tier):
+    if tier == "fast" and FAST_MODEL is None:
+        raise HTTPException(400, "fast 티어 모델이 로드되지 않았습니다")
+
+
+def _capture(path, query, input_data, output, start):
+    """CAPTURE_DIR이 설정되어 있으면 요청/응답을 캡처 큐에 넣음
+
+    query에는 요청의 쿼리 파라미터(헤더로 받은 응답 모드 포함)를 넣고, 값이 없는 것은 뺍니다.
+    response는 응답 모드를 적용하기 전의 전체 응답입니다.
+    """
+    if CAPTURE_SINK is None:
+        return
+    CAPTURE_SINK.record(
+        {
+            "timestamp": time.time(),
+            "path": path,
+            "query": {
+                name: value for name, value in query.items() if value is not None
+            },
+            "request": input_data.model_dump(),
+            "response": output.model_dump(exclude_none=True),
+            "model_version": output.model_version,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+    )
+
+
+def _serving_model(tier="full"):
+    """서빙 중인 (모델, 모델 정보, 조회 테이블)
+
+    예측 도중 리로드되어도 같은 모델/정보를 쓰도록 한 번에 읽습니다.
+    """
+    if tier == "fast":
+        return FAST_MODEL, FAST_MODEL_INFO, None
+    return MODEL, MODEL_INFO, LOOKUP_TABLE
+
+
+def _score_batch(rows, tier="full"):
+    """여러 행을 한 번에 예측 (HTTP/WebSocket 공용)
+
+    Returns:
+        (예측 결과 dict 목록, 모델 버전)
+    """
+    model, model_info, table = _serving_model(tier)
+    return _score(rows, model, model_info, table), model_info["version"]
+
+
+def _score(rows, model, model_info, table=None):
+    """predict_proba 한 번으로 확률과 예측 클래스를 함께 구함
+
+    (트리 모델의 predict와 같은 argmax 규칙)
+    """
+    X = np.asarray(rows, dtype=np.float64).reshape(len(rows), -1)
+    DRIFT_MONITOR.observe(X)
+    if table is not None and table[0] is model:
+        # 격자 안의 행은 배열 조회, 밖의 행만 모델로 계산 (확률은 모델과 동일)
+        probabilities = table[1].predict_proba(X, model)
+    else:
+        probabilities = model.predict_proba(X)
+    predictions = model.classes_.take(probabilities.argmax(axis=1))
+
+    target_names = model_info["target_names"]
+    return [
+        {
+            "prediction": int(prediction),
+            "prediction_name": target_names[prediction],
+            "probability": probability,
+        }
+        for prediction, probability in zip(predictions, probabilities.tolist())
+    ]
+
 
-    # 예측
-    features = np.array(input_data.features).reshape(1, -1)
-    prediction = MODEL.predict(features)[0]
-    probabilities = MODEL.predict_proba(features)[0]
+def _predict(features, tier="full"):
+    model, model_info, table = _serving_model(tier)
+    (result,) = _score([features], model, model_info, table)
+    output = PredictionOutput(**result, model_version=model_info["version"])
+    output._classes = model.classes_
+    return output
 
-    return PredictionOutput(
+
+def _predict_early_exit(features, mode, budget_ms):
+    model_info = MODEL_INFO
+    forest = flat_forest()
+    X = np.asarray(features, dtype=np.float64).reshape(1, -1)
+    DRIFT_MONITOR.observe(X)
+    probabilities, trees_used = forest.predict_proba(X, mode, budget_ms)
+    prediction = forest.classes_[probabilities[0].argmax()]
+
+    output = PredictionOutput(
         prediction=int(prediction),
-        prediction_name=MODEL_INFO["target_names"][prediction],
-        probability=probabilities.tolist(),
-        model_version=MODEL_INFO["version"],
+        prediction_name=model_info["target_names"][prediction],
+        probability=probabilities[0].tolist(),
+        model_version=model_info["version"],
+        trees_used=int(trees_used[0]),
     )
+    output._classes = forest.classes_
+    return output
+
+
+# 프로파일링 대상 요청이면 추론 스레드도 샘플링
+_tracked_predict = PROFILER.wrap(_predict)
+_tracked_predict_early_exit = PROFILER.wrap(_predict_early_exit)
+_tracked_score_batch = PROFILER.wrap(_score_batch)
+
+
+def _parse_ws_message(message):
+    """WebSocket 메시지에서 요청 ID와 입력 행 목록 추출
+
+    {"id": ..., "features": [4개]} 또는 {"id": ..., "instances": [[4개], ...]}
+    """
+    if not isinstance(message, dict):
+        raise TypeError("JSON 객체가 필요합니다")
+    if "instances" in message:
+        rows = message["instances"]
+    elif "features" in message:
+        rows = [message["features"]]
+    else:
+        raise ValueError("features 또는 instances가 필요합니다")
+
+    if not isinstance(rows, list) or not 1 <= len(rows) <= WS_MAX_BATCH:
+        raise ValueError(f"1~{WS_MAX_BATCH}개 행이 필요합니다")
+    for row in rows:
+        if not isinstance(row, list) or len(row) != 4:
+            raise ValueError("4개 특성 필요")
+        if not all(isinstance(v, (int, float)) for v in row):
+            raise ValueError("특성은 숫자여야 합니다")
+    return rows
+
+
+@app.websocket("/ws/predict")
+async def predict_websocket(websocket: WebSocket):
+    """하나의 연결로 여러 예측을 주고받는 WebSocket 채널
+
+    응답에는 요청의 id가 그대로 들어가므로 응답을 기다리지 않고 연속으로 보낼 수 있으며,
+    응답 순서는 요청 순서와 다를 수 있습니다. 연결당 WS_MAX_IN_FLIGHT개를 넘으면
+    다음 메시지를 읽지 않고 기다립니다.
+    """
+    await websocket.accept()
+    in_flight = asyncio.Semaphore(WS_MAX_IN_FLIGHT)
+    send_lock = asyncio.Lock()
+    tasks = set()
+
+    async def send(payload):
+        async with send_lock:
+            await websocket.send_json(payload)
+
+    async def score(request_id, message):
+        try:
+            rows = _parse_ws_message(message)
+            results, model_version = await INFERENCE_EXECUTOR.run(
+                _tracked_score_batch, rows
+            )
+            if "instances" in message:
+                payload = {"predictions": results}
+            else:
+                payload = results[0]
+            await send({"id": request_id, **payload, "model_version": model_version})
+        except (TypeError, ValueError) as e:
+            await send({"id": request_id, "error": str(e), "status_code": 400})
+        except Rejected as e:
+            await send(
+                {
+                    "id": request_id,
+                    "error": e.detail,
+                    "status_code": e.status_code,
+                    "retry_after": e.retry_after,
+                }
+            )
+        finally:
+            in_flight.release()
+
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                await send({"id": None, "error": "JSON 형식 오류", "status_code": 400})
+                continue
+
+            await in_flight.acquire()
+            request_id = message.get("id") if isinstance(message, dict) else None
+            task = asyncio.create_task(score(request_id, message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,121 @@
+"""로드된 모델과 서빙 프로세스의 메모리 사용량 집계
+
+노드 당 워커/모델 수를 정할 수 있도록 모델의 트리 노드 수, 노드 배열 크기,
+직렬화 크기와 프로세스 RSS를 측정합니다. 리로드할 때마다 기록을 남겨
+반복된 `load_model` 호출로 RSS가 계속 늘어나는지(누수) 확인할 수 있습니다.
+"""
+
+import io
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+import joblib
+from sklearn.tree._tree import NODE_DTYPE
+
+PROC_STATUS = Path("/proc/self/status")
+
+
+def _trees(model):
+    if hasattr(model, "estimators_"):
+        return [estimator.tree_ for estimator in model.estimators_]
+    if hasattr(model, "tree_"):
+        return [model.tree_]
+    return []
+
+
+def model_memory(model):
+    """트리 수, 노드 수, 노드/값 배열 크기, 직렬화 크기 (bytes)"""
+    trees = _trees(model)
+    node_count = sum(tree.node_count for tree in trees)
+
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+
+    return {
+        "n_trees": len(trees),
+        "node_count": int(node_count),
+        "node_array_bytes": int(node_count * NODE_DTYPE.itemsize),
+        "value_array_bytes": int(sum(tree.value.nbytes for tree in trees)),
+        "pickled_size_bytes": buffer.getbuffer().nbytes,
+    }
+
+
+def process_rss_bytes():
+    """현재 프로세스 RSS (bytes), 측정할 수 없으면 None"""
+    try:
+        for line in PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def tracemalloc_top(limit=10):
+    """tracemalloc이 켜져 있으면 할당량 상위 위치 목록, 꺼져 있으면 None"""
+    if not tracemalloc.is_tracing():
+        return None
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "top": [
+            {
+                "location": str(stat.traceback[0]),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[:limit]
+        ],
+    }
+
+
+class MemoryTracker:
+    """모델별 메모리 집계를 캐시하고, 리로드마다 RSS 기록을 남김"""
+
+    def __init__(self, history_size=50):
+        self.history = deque(maxlen=history_size)
+        self._cached_model = None
+        self._cached = None
+
+    def model_memory(self, model):
+        """model_memory 결과를 모델이 바뀔 때까지 캐시
+
+        id()는 해제된 모델의 주소를 새 모델이 재사용하면 같아질 수 있으므로, 약한 참조로
+        같은 객체인지 확인합니다 (캐시가 이전 모델을 붙잡아 두지 않음).
+        """
+        cached = self._cached_model() if self._cached_model is not None else None
+        if cached is not model:
+            self._cached = model_memory(model)
+            self._cached_model = weakref.ref(model)
+        return self._cached
+
+    def record_load(self, model, model_version):
+        """모델 로드 직후 상태를 기록 (모델 크기도 여기서 계산해 캐시)"""
+        start = time.perf_counter()
+        memory = self.model_memory(model)
+        self.history.append(
+            {
+                "loaded_at": datetime.now().isoformat(),
+                "model_version": model_version,
+                "rss_bytes": process_rss_bytes(),
+                "node_count": memory["node_count"],
+                "pickled_size_bytes": memory["pickled_size_bytes"],
+                "accounting_ms": round((time.perf_counter() - start) * 1000, 3),
+            }
+        )
+
+    def summary(self):
+        """리로드 기록과 첫 로드 대비 RSS 증가량"""
+        history = list(self.history)
+        rss = [entry["rss_bytes"] for entry in history if entry["rss_bytes"]]
+        return {
+            "loads": len(history),
+            "rss_growth_bytes": rss[-1] - rss[0] if len(rss) >= 2 else 0,
+            "history": history,
+        }
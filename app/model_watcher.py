@@ -0,0 +1,94 @@
+"""모델 레지스트리/파일 변경 감시 (자동 핫 리로드)
+
+가벼운 조회(레지스트리 버전, 파일 mtime)로 현재 모델의 지문을 주기적으로 확인하고,
+로드된 모델과 달라졌을 때만 리로드합니다. 여러 레플리카가 동시에 트래킹 서버를
+조회하지 않도록 주기에 jitter를 주고, 실패하면 지수적으로 간격을 늘립니다.
+"""
+
+import random
+import threading
+
+
+class ModelWatcher:
+    """백그라운드 스레드에서 모델 지문을 폴링하고 바뀌면 리로드"""
+
+    def __init__(
+        self,
+        resolve_fingerprint,
+        loaded_fingerprint,
+        reload,
+        interval_s,
+        jitter=0.2,
+        max_backoff_s=300.0,
+    ):
+        """
+        Args:
+            resolve_fingerprint: 현재 배포되어야 할 모델의 지문을 반환 (가벼운 조회)
+            loaded_fingerprint: 지금 로드된 모델의 지문을 반환
+            reload: 모델을 다시 로드하는 함수
+            interval_s: 기본 폴링 간격 (초)
+            jitter: 간격에 곱할 무작위 비율 (0.2면 ±20%)
+            max_backoff_s: 연속 실패 시 최대 폴링 간격 (초)
+        """
+        self.resolve_fingerprint = resolve_fingerprint
+        self.loaded_fingerprint = loaded_fingerprint
+        self.reload = reload
+        self.interval_s = interval_s
+        self.jitter = jitter
+        self.max_backoff_s = max_backoff_s
+        self.failures = 0
+        self.reloads = 0
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll_once(self):
+        """지문을 한 번 확인하고, 바뀌었으면 리로드 (리로드했으면 True)"""
+        try:
+            fingerprint = self.resolve_fingerprint()
+            changed = fingerprint is not None and fingerprint != (
+                self.loaded_fingerprint()
+            )
+            if changed:
+                print(f"🔄 새 모델 감지: {fingerprint} → 리로드")
+                self.reload()
+                self.reloads += 1
+        except Exception as e:  # noqa: BLE001
+            # 리로드는 어떤 오류(손상된 파일, 레지스트리 장애 등)로도 실패할 수 있으므로
+            # 모두 기록하고 기존 모델로 계속 서빙 (감시 스레드가 멈추지 않게 함)
+            self.failures += 1
+            self.last_error = str(e)
+            print(f"⚠️ 모델 감시 실패 ({self.failures}회 연속): {e}")
+            return False
+
+        self.failures = 0
+        self.last_error = None
+        return changed
+
+    def next_delay(self):
+        """다음 폴링까지 대기 시간 (실패 시 지수 backoff, 항상 jitter 적용)"""
+        delay = min(self.interval_s * 2**self.failures, self.max_backoff_s)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _run(self):
+        while not self._stop.wait(self.next_delay()):
+            self.poll_once()
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="model-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def stats(self):
+        return {
+            "interval_s": self.interval_s,
+            "reloads": self.reloads,
+            "consecutive_failures": self.failures,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,181 @@
+"""요청 단위 샘플링 프로파일러
+
+관리 API로 켜면 요청 중 일부(sample_rate, 또는 `X-Profile: 1` 헤더)를 골라
+그 요청을 처리하는 스레드(이벤트 루프 + 추론 스레드)의 스택을 주기적으로 샘플링합니다.
+여러 요청의 샘플을 합쳐 flame graph 도구(flamegraph.pl, speedscope)가 읽는
+collapsed stack 형식으로 제공합니다. 꺼져 있으면 샘플링 스레드도 없고
+미들웨어는 요청을 그대로 통과시킵니다.
+"""
+
+import contextvars
+import os
+import random
+import sys
+import threading
+from collections import Counter
+
+PROFILE_HEADER = b"x-profile"
+
+# 현재 요청이 프로파일링 대상인지 (추론 스레드로 전달됨)
+_PROFILED = contextvars.ContextVar("profiled", default=False)
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame):
+    """프레임을 바깥쪽부터 ';'로 이은 문자열로 변환"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    """프로파일링 대상 요청을 처리 중인 스레드의 스택을 샘플링해 누적"""
+
+    def __init__(self, sample_rate=0.01, interval_ms=5):
+        self.enabled = False
+        self.sample_rate = sample_rate
+        self.interval_ms = interval_ms
+        self.profiled_requests = 0
+        self.samples = Counter()
+        self._lock = threading.Lock()
+        self._threads = Counter()
+        self._stop = threading.Event()
+        self._sampler = None
+
+    def configure(self, enabled=None, sample_rate=None, interval_ms=None):
+        """설정 변경 (켜면 샘플링 스레드 시작, 끄면 종료)"""
+        if sample_rate is not None:
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError("sample_rate는 0~1 사이여야 합니다")
+            self.sample_rate = sample_rate
+        if interval_ms is not None:
+            if interval_ms <= 0:
+                raise ValueError("interval_ms는 0보다 커야 합니다")
+            self.interval_ms = interval_ms
+        if enabled is True and not self.enabled:
+            self._start()
+        elif enabled is False and self.enabled:
+            self._shutdown()
+
+    def _start(self):
+        self._stop.clear()
+        self._sampler = threading.Thread(
+            target=self._run, name="profiler-sampler", daemon=True
+        )
+        self.enabled = True
+        self._sampler.start()
+
+    def _shutdown(self):
+        self.enabled = False
+        self._stop.set()
+        self._sampler.join(timeout=5)
+        self._sampler = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval_ms / 1000):
+            self.sample()
+
+    def sample(self):
+        """추적 중인 스레드의 현재 스택을 한 번 기록"""
+        with self._lock:
+            thread_ids = list(self._threads)
+        if not thread_ids:
+            return
+        frames = sys._current_frames()
+        stacks = [collapse_stack(frames[tid]) for tid in thread_ids if tid in frames]
+        with self._lock:
+            self.samples.update(stacks)
+
+    def should_profile(self, headers):
+        """이번 요청을 프로파일링할지 결정 (헤더는 켜져 있을 때만 유효)"""
+        if not self.enabled:
+            return False
+        if (PROFILE_HEADER, b"1") in headers:
+            return True
+        return random.random() < self.sample_rate
+
+    def attach(self):
+        """현재 스레드를 샘플링 대상으로 등록"""
+        with self._lock:
+            self._threads[threading.get_ident()] += 1
+
+    def detach(self):
+        tid = threading.get_ident()
+        with self._lock:
+            self._threads[tid] -= 1
+            if self._threads[tid] <= 0:
+                del self._threads[tid]
+
+    def wrap(self, fn):
+        """다른 스레드에서 실행될 fn을 프로파일링 대상 요청일 때만 추적하도록 감쌈"""
+
+        def tracked(*args, **kwargs):
+            if not _PROFILED.get():
+                return fn(*args, **kwargs)
+            self.attach()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.detach()
+
+        return tracked
+
+    def record_request(self):
+        with self._lock:
+            self.profiled_requests += 1
+
+    def collapsed(self):
+        """누적 샘플을 collapsed stack 형식 문자열로 반환"""
+        with self._lock:
+            items = sorted(self.samples.items())
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def reset(self):
+        with self._lock:
+            self.samples.clear()
+            self.profiled_requests = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "sample_rate": self.sample_rate,
+                "interval_ms": self.interval_ms,
+                "profiled_requests": self.profiled_requests,
+                "samples": sum(self.samples.values()),
+                "unique_stacks": len(self.samples),
+            }
+
+
+class ProfilingMiddleware:
+    """선택된 HTTP 요청을 처리하는 동안 이벤트 루프 스레드를 샘플링 대상으로 등록
+
+    BaseHTTPMiddleware 대신 순수 ASGI로 구현해 꺼져 있을 때 추가 비용이 없습니다.
+    """
+
+    def __init__(self, app, profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.profiler.should_profile(
+            scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        token = _PROFILED.set(True)
+        self.profiler.attach()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.detach()
+            _PROFILED.reset(token)
+            self.profiler.record_request()
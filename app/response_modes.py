@@ -0,0 +1,114 @@
+"""/predict 응답 모드: 필요한 필드만 담은 작은 응답을 미리 만든 직렬화 함수로 생성
+
+모드는 `이름[:인자]` 문자열로 지정합니다.
+- full: 기존 응답 (prediction, prediction_name, probability, model_version)
+- class: 예측 클래스만 `{"prediction":0}`
+- topk[:k]: 확률 상위 k개 클래스(모델의 classes_ 값)와 확률 (기본 k=1)
+- round[:p]: 기존 응답의 확률을 소수점 p자리로 반올림 (기본 p=3)
+
+full이 아닌 모드는 pydantic 응답 검증과 jsonable_encoder를 거치지 않고, 모드/인자마다
+한 번 만든 직렬화 함수가 JSON bytes를 바로 만듭니다.
+"""
+
+import json
+from functools import cache
+
+DEFAULT_MODE = "full"
+DEFAULT_TOP_K = 1
+DEFAULT_PRECISION = 3
+MAX_TOP_K = 100
+MAX_PRECISION = 10
+
+
+def parse_mode(spec):
+    """`이름[:인자]` → (이름, 인자) (잘못된 값이면 ValueError)"""
+    name, _, arg = (spec or DEFAULT_MODE).strip().lower().partition(":")
+    if name in ("full", "class"):
+        if arg:
+            raise ValueError(f"{name} 모드는 인자를 받지 않습니다")
+        return name, None
+
+    if name == "topk":
+        limits, default = (1, MAX_TOP_K), DEFAULT_TOP_K
+    elif name == "round":
+        limits, default = (0, MAX_PRECISION), DEFAULT_PRECISION
+    else:
+        raise ValueError(
+            f"알 수 없는 응답 모드: {name} (full, class, topk[:k], round[:p])"
+        )
+    try:
+        value = int(arg) if arg else default
+    except ValueError:
+        raise ValueError(f"{name} 모드의 인자는 정수여야 합니다: {arg}") from None
+    if not limits[0] <= value <= limits[1]:
+        raise ValueError(f"{name} 모드의 인자는 {limits[0]}~{limits[1]}이어야 합니다")
+    return name, value
+
+
+def _class_serializer():
+    def serialize(output, classes=None):
+        return b'{"prediction":%d}' % int(output.prediction)
+
+    return serialize
+
+
+def _topk_serializer(k):
+    def serialize(output, classes=None):
+        probability = output.probability
+        top = sorted(range(len(probability)), key=probability.__getitem__, reverse=True)
+        top = top[:k]
+        # 확률은 모델의 classes_ 순서이므로 위치를 클래스 값으로 바꿈 (classes가 없으면 위치)
+        labels = ",".join(str(i if classes is None else int(classes[i])) for i in top)
+        values = ",".join(repr(probability[i]) for i in top)
+        return (
+            f'{{"prediction":{int(output.prediction)},"top_k":[{labels}],'
+            f'"probability":[{values}],'
+            f'"model_version":{json.dumps(output.model_version)}}}'
+        ).encode()
+
+    return serialize
+
+
+def _round_serializer(precision):
+    def number(value):
+        # 고정 자릿수("0.800")가 아니라 가장 짧은 표현("0.8")으로 써서 응답이 커지지 않게 함
+        return repr(round(value, precision))
+
+    def serialize(output, classes=None):
+        values = ",".join(map(number, output.probability))
+        trees_used = (
+            "" if output.trees_used is None else f',"trees_used":{output.trees_used}'
+        )
+        return (
+            f'{{"prediction":{int(output.prediction)},'
+            f'"prediction_name":{json.dumps(output.prediction_name)},'
+            f'"probability":[{values}],'
+            f'"model_version":{json.dumps(output.model_version)}{trees_used}}}'
+        ).encode()
+
+    return serialize
+
+
+_BUILDERS = {
+    "class": _class_serializer,
+    "topk": _topk_serializer,
+    "round": _round_serializer,
+}
+
+
+@cache
+def _build(name, arg):
+    return _BUILDERS[name]() if arg is None else _BUILDERS[name](arg)
+
+
+def serializer(spec=DEFAULT_MODE):
+    """모드 문자열의 직렬화 함수 ((output, classes) → JSON bytes), full 모드면 None
+
+    classes는 확률 위치별 클래스 값(모델의 classes_)이며, 없으면 위치를 클래스로 씁니다.
+
+    인자 범위가 제한되어 있으므로 모드/인자 조합마다 한 번만 만들어 캐시합니다.
+    """
+    name, arg = parse_mode(spec)
+    if name == "full":
+        return None
+    return _build(name, arg)
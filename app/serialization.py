@@ -0,0 +1,182 @@
+"""모델 아티팩트 직렬화: 압축 코덱/레벨, pickle protocol 5 out-of-band 버퍼, 체크섬 검증
+
+파일 구성은 `MAGIC | 헤더 길이(4바이트) | JSON 헤더 | 저장 본문`입니다.
+본문은 pickle 스트림과 out-of-band 버퍼(트리 노드/값 배열 등 numpy 배열)를 각각 코덱으로 압축해
+이어 붙인 것이고, 헤더에 코덱, 각 구간의 원본/저장 크기, 저장 본문의 blake2b 체크섬을 기록합니다.
+구간마다 따로 압축하므로 저장할 때 버퍼를 하나로 합치는 복사가 없고, 로드할 때도 버퍼마다 압축을
+풀어 그대로 pickle에 넘깁니다. 로드할 때는 압축을 풀기 전에 체크섬을 확인합니다.
+
+"none" 코덱은 읽은 본문을 잘라 복사 없이 넘기므로 배열도 쓰기 가능합니다. 압축 코덱은 버퍼마다
+압축을 푼 bytes를 쓰므로 (버퍼당 복사 한 번) 복원된 배열이 읽기 전용입니다.
+MAGIC으로 시작하지 않는 파일은 기존 joblib 파일로 보고 joblib.load로 읽습니다.
+
+lz4/zstd 코덱은 각각 lz4, zstandard 패키지가 있어야 합니다.
+"""
+
+import bz2
+import hashlib
+import json
+import lzma
+import os
+import pickle
+import struct
+import zlib
+from pathlib import Path
+
+import joblib
+
+MAGIC = b"OPSART\x01\n"
+FORMAT_VERSION = 1
+DEFAULT_CODEC = "zlib"
+DEFAULT_PROTOCOL = 5
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+class ChecksumError(ValueError):
+    """저장 본문의 체크섬이 헤더와 다름 (파일 손상 또는 전송 중 잘림)"""
+
+
+def _lz4():
+    try:
+        import lz4.frame
+    except ImportError as e:
+        raise ImportError("lz4 코덱을 쓰려면 lz4 패키지가 필요합니다") from e
+    return lz4.frame
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd 코덱을 쓰려면 zstandard 패키지가 필요합니다") from e
+    return zstandard
+
+
+# 코덱 이름: (압축 함수, 해제 함수, 기본 레벨)
+CODECS = {
+    "none": (lambda data, level: data, lambda data: data, None),
+    "zlib": (lambda data, level: zlib.compress(data, level), zlib.decompress, 3),
+    "bz2": (lambda data, level: bz2.compress(data, level), bz2.decompress, 9),
+    "lzma": (
+        lambda data, level: lzma.compress(data, preset=level),
+        lzma.decompress,
+        6,
+    ),
+    "lz4": (
+        lambda data, level: _lz4().compress(data, compression_level=level),
+        lambda data: _lz4().decompress(data),
+        0,
+    ),
+    "zstd": (
+        lambda data, level: _zstd().ZstdCompressor(level=level).compress(data),
+        lambda data: _zstd().ZstdDecompressor().decompress(data),
+        3,
+    ),
+}
+
+
+def _checksum(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def dump_artifact(
+    obj,
+    path,
+    codec=DEFAULT_CODEC,
+    level=None,
+    protocol=DEFAULT_PROTOCOL,
+    out_of_band=True,
+):
+    """obj를 path에 저장하고 헤더(dict) 반환
+
+    Args:
+        codec: CODECS의 이름 ("none"이면 압축하지 않음)
+        level: 압축 레벨 (None이면 코덱 기본값)
+        out_of_band: protocol 5에서 큰 버퍼를 pickle 스트림 밖에 따로 저장
+    """
+    if codec not in CODECS:
+        raise ValueError(f"알 수 없는 코덱: {codec} (사용 가능: {sorted(CODECS)})")
+    compress, _, default_level = CODECS[codec]
+    level = default_level if level is None else level
+
+    buffers = []
+    use_buffers = out_of_band and protocol >= 5
+    stream = pickle.dumps(
+        obj, protocol=protocol, buffer_callback=buffers.append if use_buffers else None
+    )
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    # 구간마다 따로 압축해 큰 버퍼를 pickle 스트림과 합치는 복사를 피함
+    parts = [compress(part, level) for part in [stream, *raw_buffers]]
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part)
+
+    header = {
+        "format": FORMAT_VERSION,
+        "codec": codec,
+        "level": level,
+        "protocol": protocol,
+        "pickle_bytes": len(stream),
+        "buffer_bytes": [buffer.nbytes for buffer in raw_buffers],
+        "part_bytes": [len(part) for part in parts],
+        "stored_bytes": sum(len(part) for part in parts),
+        "checksum": digest.hexdigest(),
+    }
+    header_bytes = json.dumps(header).encode()
+
+    # 네트워크 스토리지에서 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for part in parts:
+            f.write(part)
+    tmp_path.replace(path)
+    return header
+
+
+def _read_header(f):
+    if f.read(len(MAGIC)) != MAGIC:
+        return None
+    (length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+    header = json.loads(f.read(length))
+    if header["format"] != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 아티팩트 형식: {header['format']}")
+    return header
+
+
+def artifact_header(path):
+    """본문을 읽지 않고 헤더만 반환 (기존 joblib 파일이면 None)"""
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def load_artifact(path, verify=True):
+    """dump_artifact로 저장한 객체 (기존 joblib 파일도 읽음)
+
+    verify=True면 압축을 풀기 전에 체크섬을 확인하고, 다르면 ChecksumError를 냅니다.
+    "none" 코덱이 아니면 복원된 numpy 배열은 읽기 전용입니다.
+    """
+    with open(path, "rb") as f:
+        header = _read_header(f)
+        if header is None:
+            return joblib.load(path)
+        stored = bytearray(header["stored_bytes"])
+        if f.readinto(stored) != len(stored):
+            raise ChecksumError(f"아티팩트 본문이 잘렸습니다: {path}")
+
+    if verify and _checksum(stored) != header["checksum"]:
+        raise ChecksumError(f"아티팩트 체크섬이 일치하지 않습니다: {path}")
+
+    _, decompress, _ = CODECS[header["codec"]]
+    # "none" 코덱은 읽은 bytearray의 조각을 그대로 쓰므로 버퍼도 복사 없이 쓰기 가능한 배열이 됨
+    body = memoryview(stored)
+    parts, offset = [], 0
+    for size in header["part_bytes"]:
+        parts.append(decompress(body[offset : offset + size]))
+        offset += size
+    stream, *buffers = parts
+    return pickle.loads(stream, buffers=buffers)
@@ -0,0 +1,36 @@
+"""벤치마크 결과에 함께 기록하는 실행 환경 정보"""
+
+import os
+import platform
+import subprocess
+from datetime import datetime
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_info():
+    """Python/라이브러리 버전, CPU, 커밋 등 결과 비교에 필요한 환경 정보"""
+    import numpy
+    import sklearn
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "scikit_learn": sklearn.__version__,
+    }
@@ -0,0 +1,315 @@
+"""학습 파이프라인 단계별 성능 벤치마크와 회귀 검사
+
+`IrisMLPipeline.run_pipeline`과 `IrisMLPipelineWithMLflow.run_pipeline`을 데이터 크기
+(Iris, 합성 데이터)와 하이퍼파라미터 조합마다 실행해 단계별 wall/CPU 시간과 메모리 peak를 기록합니다.
+MLflow는 임시 디렉토리의 로컬 파일 저장소를 사용하므로 서버가 필요 없습니다.
+시간이 tracemalloc 오버헤드로 부풀려지지 않도록 tracemalloc peak는 측정하지 않으며(메모리는 peak RSS),
+케이스마다 repeats번 실행해 단계별 최솟값을 사용하고(잡음 제거), 기준 결과(baseline)보다
+threshold 비율 이상 느려진 단계를 회귀로 표시합니다. 기준 결과는 실행 환경에 따라 달라지므로
+저장소에 넣지 않고 머신마다 만들며, 기준과 실행 환경(Python/라이브러리 버전, CPU 등)이 다르면 경고합니다.
+
+```bash
+# 기준 결과 저장
+python -m benchmarks.pipeline_benchmark --update-baseline
+# 기준과 비교 (회귀가 있으면 종료 코드 1, 기준 결과가 없으면 종료 코드 2)
+python -m benchmarks.pipeline_benchmark --fail-on-regression
+```
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.environment import environment_info
+
+DEFAULT_BASELINE = Path("benchmarks/baselines/pipeline_benchmark.json")
+DEFAULT_SIZES = (None, 10_000, 100_000)
+DEFAULT_PARAMS = ({"n_estimators": 100, "max_depth": 5},)
+DEFAULT_THRESHOLD = 0.2
+
+# 이보다 짧은 단계의 차이는 측정 잡음으로 보고 회귀로 표시하지 않음
+MIN_REGRESSION_SECONDS = 0.05
+
+# tracemalloc peak는 켜면 시간이 부풀려지므로 벤치마크에서는 측정하지 않음
+TIMING_KEYS = ("wall_time_s", "cpu_time_s", "peak_rss_mb")
+
+# 값이 다르면 기준 결과와 시간을 직접 비교할 수 없는 환경 정보
+ENVIRONMENT_KEYS = (
+    "python",
+    "platform",
+    "machine",
+    "processor",
+    "cpu_count",
+    "numpy",
+    "scikit_learn",
+)
+
+
+def build_cases(sizes=DEFAULT_SIZES, param_grid=DEFAULT_PARAMS, pipelines=None):
+    """(파이프라인, 데이터 크기, 하이퍼파라미터) 케이스 목록
+
+    IrisMLPipeline은 하이퍼파라미터가 고정이라 데이터 크기만 바꿉니다.
+    """
+    pipelines = pipelines or ("IrisMLPipeline", "IrisMLPipelineWithMLflow")
+    cases = []
+    for rows in sizes:
+        if "IrisMLPipeline" in pipelines:
+            cases.append({"pipeline": "IrisMLPipeline", "rows": rows, "params": {}})
+        if "IrisMLPipelineWithMLflow" in pipelines:
+            for params in param_grid:
+                cases.append(
+                    {
+                        "pipeline": "IrisMLPipelineWithMLflow",
+                        "rows": rows,
+                        "params": dict(params),
+                    }
+                )
+    return cases
+
+
+def case_id(case):
+    """결과 비교에 쓰는 케이스 식별자"""
+    parts = [case["pipeline"], f"rows={case['rows'] or 'iris'}"]
+    parts += [f"{key}={value}" for key, value in sorted(case["params"].items())]
+    return "/".join(parts)
+
+
+def _run_once(case, workdir):
+    """작업 디렉토리에서 파이프라인을 한 번 실행하고 단계별 측정값 반환 (tracemalloc 없이)"""
+    if case["pipeline"] == "IrisMLPipeline":
+        from scripts.train_pipeline import IrisMLPipeline
+
+        pipeline = IrisMLPipeline()
+        pipeline.trace_malloc = False
+        pipeline.run_pipeline(synthetic_rows=case["rows"])
+    else:
+        import mlflow
+
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        mlflow.set_tracking_uri(f"file:{Path(workdir) / 'mlruns'}")
+        pipeline = IrisMLPipelineWithMLflow()
+        pipeline.trace_malloc = False
+        pipeline.run_pipeline(synthetic_rows=case["rows"], **case["params"])
+    return pipeline.stage_profile.results
+
+
+def run_case(case, repeats=3, verbose=False):
+    """케이스를 repeats번 실행해 단계별 최솟값(메모리는 최댓값)을 반환"""
+    runs = []
+    original_cwd = Path.cwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # 파이프라인이 models/, mlruns/에 쓰는 파일은 임시 디렉토리에 남김
+        os.chdir(workdir)
+        try:
+            for _ in range(repeats):
+                output = sys.stdout if verbose else io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    runs.append(_run_once(case, workdir))
+        finally:
+            os.chdir(original_cwd)
+
+    stages = {}
+    for run in runs:
+        for result in run:
+            merged = stages.setdefault(result["stage"], {})
+            for key in TIMING_KEYS:
+                value = result[key]
+                if value is None:
+                    continue
+                pick = max if key.endswith("_mb") else min
+                merged[key] = value if key not in merged else pick(merged[key], value)
+    return {"id": case_id(case), **case, "repeats": repeats, "stages": stages}
+
+
+def run_benchmark(cases, repeats=3, verbose=False):
+    results = []
+    for case in cases:
+        print(f"  → {case_id(case)} ({repeats}회)")
+        results.append(run_case(case, repeats=repeats, verbose=verbose))
+    return {"environment": environment_info(), "results": results}
+
+
+def load_baseline(path):
+    """기준 결과 JSON (없으면 FileNotFoundError)"""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"기준 결과가 없습니다: {path} (--update-baseline으로 생성)"
+        )
+    return json.loads(path.read_text())
+
+
+def environment_mismatches(environment, baseline_environment):
+    """기준 결과와 다른 환경 정보 [(키, 기준 값, 현재 값), ...]"""
+    return [
+        (key, baseline_environment.get(key), environment.get(key))
+        for key in ENVIRONMENT_KEYS
+        if baseline_environment.get(key) != environment.get(key)
+    ]
+
+
+def compare_to_baseline(
+    report, baseline, threshold=DEFAULT_THRESHOLD, min_seconds=MIN_REGRESSION_SECONDS
+):
+    """기준 결과 대비 단계별 wall time 변화와 회귀 목록
+
+    Returns:
+        (비교 행 목록, 회귀 행 목록) - 기준에 없는 케이스/단계는 건너뜀
+    """
+    baseline_results = {result["id"]: result for result in baseline["results"]}
+    rows, regressions = [], []
+    for result in report["results"]:
+        reference = baseline_results.get(result["id"])
+        if reference is None:
+            continue
+        for stage, timing in result["stages"].items():
+            before = reference["stages"].get(stage, {}).get("wall_time_s")
+            after = timing.get("wall_time_s")
+            if before is None or after is None:
+                continue
+            change = (after - before) / before if before > 0 else 0.0
+            row = {
+                "id": result["id"],
+                "stage": stage,
+                "baseline_s": before,
+                "current_s": after,
+                "change": change,
+                "regression": change > threshold and after - before > min_seconds,
+            }
+            rows.append(row)
+            if row["regression"]:
+                regressions.append(row)
+    return rows, regressions
+
+
+def format_comparison(rows):
+    """기준 대비 변화 표"""
+    width = max([len(row["id"]) for row in rows] + [4]) + 2
+    header = f"{'Case':<{width}}{'Stage':<12}{'Base(s)':>9}{'Now(s)':>9}{'Change':>9}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        flag = "  ⚠️" if row["regression"] else ""
+        lines.append(
+            f"{row['id']:<{width}}{row['stage']:<12}"
+            f"{row['baseline_s']:>9.3f}{row['current_s']:>9.3f}"
+            f"{row['change']:>+9.1%}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def _write_json(path, payload):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="학습 파이프라인 벤치마크")
+    parser.add_argument(
+        "--sizes",
+        type=str,
+        nargs="+",
+        default=["iris", "1e4", "1e5"],
+        help="데이터 크기 목록 (iris 또는 합성 데이터 행 수, 기본값: iris 1e4 1e5)",
+    )
+    parser.add_argument(
+        "--params",
+        type=str,
+        nargs="+",
+        default=["100:5"],
+        help="MLflow 파이프라인 하이퍼파라미터 n_estimators:max_depth 목록 (기본값: 100:5)",
+    )
+    parser.add_argument(
+        "--pipelines",
+        type=str,
+        nargs="+",
+        choices=["IrisMLPipeline", "IrisMLPipelineWithMLflow"],
+        default=None,
+        help="측정할 파이프라인 (기본값: 둘 다)",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="케이스별 반복 횟수")
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=str(DEFAULT_BASELINE),
+        help=f"기준 결과 JSON (기본값: {DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="회귀로 볼 wall time 증가 비율 (기본값: 0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="이번 결과를 기준 결과로 저장",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="회귀가 있으면 종료 코드 1 (CI용)",
+    )
+    parser.add_argument("--output", type=str, default=None, help="결과 JSON 경로")
+    parser.add_argument("--verbose", action="store_true", help="파이프라인 출력 표시")
+
+    args = parser.parse_args()
+    sizes = [None if size == "iris" else int(float(size)) for size in args.sizes]
+    param_grid = [
+        {"n_estimators": int(n), "max_depth": int(d)}
+        for n, d in (value.split(":") for value in args.params)
+    ]
+
+    baseline = None
+    if not args.update_baseline:
+        try:
+            baseline = load_baseline(args.baseline)
+        except FileNotFoundError as e:
+            # CI에서 비교를 요청했는데 기준이 없으면 통과로 보지 않음 (측정 전에 확인)
+            if args.fail_on_regression:
+                print(f"  ❌ {e}", file=sys.stderr)
+                sys.exit(2)
+            print(f"  ⚠️  {e}")
+
+    report = run_benchmark(
+        build_cases(sizes, param_grid, args.pipelines),
+        repeats=args.repeats,
+        verbose=args.verbose,
+    )
+    if args.output:
+        print(f"  → 측정 결과 저장: {_write_json(args.output, report)}")
+
+    if args.update_baseline:
+        print(f"  → 기준 결과 저장: {_write_json(args.baseline, report)}")
+    elif baseline is not None:
+        rows, regressions = compare_to_baseline(report, baseline, args.threshold)
+        print()
+        print(
+            f"기준: {baseline['environment'].get('git_commit')} "
+            f"({baseline['environment'].get('timestamp')})"
+        )
+        mismatches = environment_mismatches(
+            report["environment"], baseline["environment"]
+        )
+        for key, before, after in mismatches:
+            print(f"  ⚠️  환경이 기준과 다릅니다 - {key}: {before} → {after}")
+        if mismatches:
+            print(
+                "     (같은 환경에서 만든 기준 결과와 비교해야 시간 차이가 의미 있습니다)"
+            )
+        print(format_comparison(rows))
+        if regressions:
+            print(
+                f"\n⚠️  {len(regressions)}개 단계가 {args.threshold:.0%} 이상 느려졌습니다"
+            )
+            if args.fail_on_regression:
+                sys.exit(1)
+        else:
+            print("\n✅ 회귀 없음")
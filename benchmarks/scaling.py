@@ -0,0 +1,200 @@
+"""합성 데이터 규모별 학습/전처리/추론 비용 측정 (scaling curve)
+
+데이터 크기마다 합성 데이터를 청크 단위로 파일에 쓰고, 전처리·학습·추론 단계의
+wall/CPU 시간과 메모리 peak(StageProfiler), 처리량을 측정합니다.
+in_memory_max_rows 이하는 메모리에 올려 학습하고, 그보다 크면 out-of-core로 학습합니다.
+
+```bash
+python -m benchmarks.scaling --sizes 1e4 1e5 1e6 1e7 --output benchmarks/results/scaling.json
+```
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.environment import environment_info
+from scripts.model_budget import benchmark_model
+from scripts.out_of_core import (
+    ChunkedDataSource,
+    fit_forest_in_chunks,
+    head_of_split,
+    iter_split_chunks,
+)
+from scripts.stage_profiler import StageProfiler
+from scripts.synthetic_data import DEFAULT_SEED, write_synthetic_dataset
+from scripts.train_pipeline import IrisMLPipeline
+
+DEFAULT_SIZES = (10**4, 10**5, 10**6)
+
+
+def _preprocess(X):
+    return IrisMLPipeline().preprocess_data(X, verbose=False)
+
+
+def run_size(
+    n_rows,
+    data_dir,
+    chunk_size=1_000_000,
+    n_estimators=100,
+    max_depth=5,
+    in_memory_max_rows=1_000_000,
+    trace_malloc=True,
+    seed=DEFAULT_SEED,
+):
+    """데이터 크기 하나에 대한 단계별 측정 결과"""
+    from sklearn.ensemble import RandomForestClassifier
+
+    profiler = StageProfiler(trace_malloc=trace_malloc)
+    path = Path(data_dir) / f"synthetic_{n_rows}.npy"
+    in_memory = n_rows <= in_memory_max_rows
+
+    with profiler.stage("generate"):
+        write_synthetic_dataset(path, n_rows, chunk_size=chunk_size, seed=seed)
+    source = ChunkedDataSource(path, chunk_size=chunk_size)
+
+    with profiler.stage("preprocess"):
+        for X, _ in source:
+            _preprocess(X)
+
+    with profiler.stage("train"):
+        train_chunks = iter_split_chunks(source, "train", preprocess=_preprocess)
+        if in_memory:
+            parts = list(train_chunks)
+            X_train = np.concatenate([X for X, _ in parts])
+            y_train = np.concatenate([y for _, y in parts])
+            model = RandomForestClassifier(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                random_state=42,
+                n_jobs=-1,
+            ).fit(X_train, y_train)
+            del parts, X_train, y_train
+        else:
+            # 청크당 트리 수는 전체 트리 수가 비슷하도록 맞춤
+            n_chunks = -(-n_rows // chunk_size)
+            model = fit_forest_in_chunks(
+                train_chunks,
+                classes=range(3),
+                trees_per_chunk=max(n_estimators // n_chunks, 1),
+                max_depth=max_depth,
+            )
+
+    n_test = 0
+    with profiler.stage("inference"):
+        for X, _ in iter_split_chunks(source, "test", preprocess=_preprocess):
+            model.predict_proba(X)
+            n_test += len(X)
+
+    X_sample, _ = head_of_split(source, "test", max_rows=1000)
+    latency = benchmark_model(model, X_sample, repeats=20)
+    path.unlink()
+
+    stages = {result["stage"]: result for result in profiler.results}
+    n_train = n_rows - n_test
+    return {
+        "n_rows": n_rows,
+        "training_mode": "in_memory" if in_memory else "out_of_core",
+        "n_estimators": model.n_estimators,
+        "stages": profiler.results,
+        "train_rows_per_s": n_train / stages["train"]["wall_time_s"],
+        "inference_rows_per_s": n_test / stages["inference"]["wall_time_s"],
+        "single_row_latency_p50_ms": latency["single_row_latency_p50_ms"],
+        "batch_latency_p50_ms": latency["batch_latency_p50_ms"],
+    }
+
+
+def run_scaling(sizes=DEFAULT_SIZES, data_dir=None, **kwargs):
+    """여러 데이터 크기를 차례로 측정 (data_dir이 없으면 임시 디렉토리 사용)"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n_rows in sizes:
+            print(f"  → {n_rows:,}행 측정 중...")
+            results.append(run_size(int(n_rows), data_dir or tmpdir, **kwargs))
+    return {"environment": environment_info(), "results": results}
+
+
+def format_table(results):
+    """크기별 주요 측정값 표"""
+    header = (
+        f"{'Rows':>12}{'Mode':>13}{'Train(s)':>10}{'TrainMB':>9}"
+        f"{'Infer(rows/s)':>15}{'p50(ms)':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        train = next(s for s in result["stages"] if s["stage"] == "train")
+        peak = train["peak_rss_mb"]
+        lines.append(
+            f"{result['n_rows']:>12,}"
+            f"{result['training_mode']:>13}"
+            f"{train['wall_time_s']:>10.2f}"
+            f"{'n/a' if peak is None else f'{peak:.0f}':>9}"
+            f"{result['inference_rows_per_s']:>15,.0f}"
+            f"{result['single_row_latency_p50_ms']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="합성 데이터 규모별 비용 측정")
+    parser.add_argument(
+        "--sizes",
+        type=float,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="측정할 행 수 목록 (기본값: 1e4 1e5 1e6, 최대 1e8)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1_000_000,
+        help="생성/읽기 청크 크기 (기본값: 1000000)",
+    )
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--max-depth", type=int, default=5)
+    parser.add_argument(
+        "--in-memory-max-rows",
+        type=float,
+        default=1e6,
+        help="이 크기 이하만 메모리에 올려 학습, 넘으면 out-of-core (기본값: 1e6)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=str,
+        default=None,
+        help="합성 데이터를 쓸 디렉토리 (기본값: 임시 디렉토리)",
+    )
+    parser.add_argument(
+        "--no-tracemalloc",
+        action="store_true",
+        help="tracemalloc 측정을 끔 (할당이 많은 단계의 오버헤드 제거)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="결과를 저장할 JSON 경로",
+    )
+
+    args = parser.parse_args()
+
+    report = run_scaling(
+        sizes=[int(size) for size in args.sizes],
+        data_dir=args.data_dir,
+        chunk_size=args.chunk_size,
+        n_estimators=args.n_estimators,
+        max_depth=args.max_depth,
+        in_memory_max_rows=int(args.in_memory_max_rows),
+        trace_malloc=not args.no_tracemalloc,
+    )
+    print()
+    print(format_table(report["results"]))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"  → 측정 결과 저장: {output}")
@@ -0,0 +1,223 @@
+"""모델 아티팩트 직렬화 옵션별 파일 크기, 쓰기 시간, 로드 시간 비교
+
+save_model과 같은 구성의 아티팩트(모델 + 메타데이터)를 옵션마다 저장하고 다시 읽습니다.
+로드 시간은 load_model이 로컬 모델 파일을 읽을 때 쓰는 load_artifact 기준이며,
+같은 파일을 반복해서 읽으므로 OS 페이지 캐시에 올라간 상태의 값입니다.
+--bandwidth-mbps를 주면 네트워크 스토리지에서 파일을 받는 시간(크기 / 대역폭)을 더한
+콜드 스타트 추정치를 함께 계산합니다.
+
+```bash
+python -m benchmarks.serialization --rows 1e5 --bandwidth-mbps 200 --output benchmarks/results/serialization.json
+```
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+
+from app.serialization import dump_artifact, load_artifact
+from benchmarks.environment import environment_info
+from scripts.synthetic_data import load_synthetic
+
+# (codec, level) - "joblib"은 기존 joblib.dump 기본 설정 (비교 기준)
+DEFAULT_OPTIONS = (
+    ("joblib", None),
+    ("none", None),
+    ("zlib", 1),
+    ("zlib", 3),
+    ("zlib", 6),
+    ("bz2", 9),
+    ("lzma", 6),
+    ("lz4", 0),
+    ("zstd", 3),
+)
+
+
+def build_artifact(n_rows=100_000, n_estimators=100, max_depth=None):
+    """합성 데이터로 학습한 save_model 구성의 아티팩트"""
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = load_synthetic(n_rows)
+    model = RandomForestClassifier(
+        n_estimators=n_estimators, max_depth=max_depth, random_state=42, n_jobs=-1
+    ).fit(X, y)
+    return {
+        "model": model,
+        "version": "benchmark",
+        "metrics": {},
+        "feature_names": ["sepal_length", "sepal_width", "petal_length", "petal_width"],
+        "target_names": ["setosa", "versicolor", "virginica"],
+        "framework": "scikit-learn",
+    }
+
+
+def _best_time_ms(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def measure_option(artifact, path, codec, level=None, repeats=5, out_of_band=True):
+    """옵션 하나의 파일 크기와 쓰기/로드 시간 (반복 중 최솟값)"""
+
+    def write():
+        if codec == "joblib":
+            joblib.dump(artifact, path)
+        else:
+            dump_artifact(
+                artifact, path, codec=codec, level=level, out_of_band=out_of_band
+            )
+
+    write_ms = _best_time_ms(write, repeats)
+    size_bytes = Path(path).stat().st_size
+    load_ms = _best_time_ms(lambda: load_artifact(path), repeats)
+    Path(path).unlink()
+    return {
+        "codec": codec,
+        "level": level,
+        "out_of_band": out_of_band and codec != "joblib",
+        "size_bytes": size_bytes,
+        "write_time_ms": write_ms,
+        "load_time_ms": load_ms,
+    }
+
+
+def run_benchmark(
+    options=DEFAULT_OPTIONS,
+    n_rows=100_000,
+    n_estimators=100,
+    max_depth=None,
+    repeats=5,
+    bandwidth_mbps=None,
+):
+    """옵션별 측정 (lz4/zstd처럼 패키지가 없는 코덱은 건너뜀)"""
+    artifact = build_artifact(n_rows, n_estimators, max_depth)
+    results, skipped = [], []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for codec, level in options:
+            print(f"  → {codec} (level={level}) 측정 중...")
+            try:
+                result = measure_option(
+                    artifact, Path(tmpdir) / "model.pkl", codec, level, repeats
+                )
+            except ImportError as e:
+                print(f"     건너뜀: {e}")
+                skipped.append(codec)
+                continue
+            if bandwidth_mbps:
+                result["transfer_time_ms"] = (
+                    result["size_bytes"] * 8 / (bandwidth_mbps * 1e6) * 1000
+                )
+                result["cold_start_ms"] = (
+                    result["transfer_time_ms"] + result["load_time_ms"]
+                )
+            results.append(result)
+
+    return {
+        "environment": environment_info(),
+        "config": {
+            "n_rows": n_rows,
+            "n_estimators": n_estimators,
+            "max_depth": max_depth,
+            "repeats": repeats,
+            "bandwidth_mbps": bandwidth_mbps,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def format_table(results):
+    """옵션별 크기/시간 표 (콜드 스타트 추정치가 있으면 함께 표시)"""
+    with_cold = any("cold_start_ms" in result for result in results)
+    header = (
+        f"{'Codec':>8}{'Level':>7}{'Size(MB)':>10}{'Write(ms)':>11}{'Load(ms)':>10}"
+    )
+    if with_cold:
+        header += f"{'Cold(ms)':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        level = "-" if result["level"] is None else result["level"]
+        line = (
+            f"{result['codec']:>8}{level:>7}"
+            f"{result['size_bytes'] / 1e6:>10.2f}"
+            f"{result['write_time_ms']:>11.1f}"
+            f"{result['load_time_ms']:>10.1f}"
+        )
+        if with_cold:
+            line += f"{result['cold_start_ms']:>10.1f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _parse_option(value):
+    codec, _, level = value.partition(":")
+    return codec, int(level) if level else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="모델 아티팩트 직렬화 옵션 비교")
+    parser.add_argument(
+        "--options",
+        type=_parse_option,
+        nargs="+",
+        default=list(DEFAULT_OPTIONS),
+        help="비교할 codec[:level] 목록 (예: joblib none zlib:3 lzma:6)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=float,
+        default=1e5,
+        help="모델 학습에 쓸 합성 데이터 행 수 (기본값: 1e5)",
+    )
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=None,
+        help="트리 최대 깊이 (기본값: 제한 없음, 큰 모델)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="옵션마다 쓰기/로드를 반복할 횟수 (최솟값 사용, 기본값: 5)",
+    )
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=float,
+        default=None,
+        help="네트워크 스토리지 대역폭 (Mbps, 주면 전송 시간을 더한 콜드 스타트 추정)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="결과를 저장할 JSON 경로",
+    )
+
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        options=args.options,
+        n_rows=int(args.rows),
+        n_estimators=args.n_estimators,
+        max_depth=args.max_depth,
+        repeats=args.repeats,
+        bandwidth_mbps=args.bandwidth_mbps,
+    )
+    print()
+    print(format_table(report["results"]))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"  → 측정 결과 저장: {output}")
@@ -0,0 +1,346 @@
+"""학습된 RandomForest를 서빙용으로 압축 (트리 제거, 서브트리 가지치기, 임계값 float32 정규화)
+
+압축된 모델도 같은 RandomForestClassifier이므로 `app.main.load_model`에서 그대로 로드됩니다.
+
+- 기준 데이터의 앙상블 예측(클래스와 확률)을 크게 바꾸지 않는 트리를 제거 (최소 트리 수는 유지)
+- 도달할 수 없는 서브트리와, 모든 리프가 같은 클래스를 예측하는 서브트리를 리프로 축약
+- 임계값을 float32 격자로 내림: sklearn은 예측 시 입력을 float32로 변환하므로
+  `x <= t`와 `x <= floor32(t)`의 결과가 같아 예측은 바뀌지 않습니다.
+  sklearn Tree의 노드 dtype은 float64로 고정이라 저장 크기는 줄지 않지만,
+  압축 후 임계값이 float32 값과 정확히 일치해 float32 기반 추론 경로에서 그대로 쓸 수 있습니다.
+
+트리 선택과 적용 판단은 학습에서 떼어 낸 검증 데이터로 하며, 검증 데이터가 MIN_VALIDATION_ROWS보다
+적으면 (예: Iris) 판단을 믿을 수 없으므로 압축하지 않습니다.
+"""
+
+import copy
+import io
+import math
+import time
+
+import joblib
+import numpy as np
+from sklearn.model_selection import train_test_split
+from sklearn.tree._tree import Tree
+
+TREE_LEAF = -1
+TREE_UNDEFINED = -2
+
+# 학습 데이터에서 압축 검증용으로 떼어 낼 비율
+VALIDATION_SIZE = 0.2
+# 검증 데이터가 이보다 적으면 압축하지 않음 (트리 선택 기준/적용 판단에 반씩 사용)
+MIN_VALIDATION_ROWS = 200
+
+# 압축 후에도 남기는 최소 트리 수: max(MIN_TREES, 원래 트리 수 * MIN_TREE_FRACTION)
+MIN_TREES = 10
+MIN_TREE_FRACTION = 0.2
+# 트리 제거로 바뀌는 기준 데이터 앙상블 확률의 최대 변화 (가지치기로 생기는 변화의 여유를 남김)
+SELECTION_PROBA_SHIFT = 0.05
+# 적용 판단 시 허용하는 압축 전후 predict_proba의 최대 변화 (행, 클래스별 절댓값)
+MAX_PROBA_SHIFT = 0.15
+
+
+def snap_thresholds_to_float32(thresholds):
+    """각 임계값 이하의 가장 큰 float32 값으로 내림"""
+    snapped = thresholds.astype(np.float32)
+    too_big = snapped.astype(np.float64) > thresholds
+    snapped[too_big] = np.nextafter(snapped[too_big], np.float32(-np.inf))
+    return snapped.astype(np.float64)
+
+
+def prune_tree(tree):
+    """도달 불가/단일 클래스 서브트리를 축약한 새 Tree 반환"""
+    state = tree.__getstate__()
+    nodes = state["nodes"]
+    values = state["values"]
+    left = nodes["left_child"]
+    right = nodes["right_child"]
+    feature = nodes["feature"]
+    threshold = nodes["threshold"]
+
+    # 각 노드 서브트리의 리프 예측 클래스 (하나면 그 클래스, 여러 개면 -1)
+    # sklearn은 자식 노드를 부모보다 뒤에 번호 매기므로 역순으로 돌면 자식이 먼저 계산됨
+    leaf_class = np.full(len(nodes), -1, dtype=np.int64)
+    for node in range(len(nodes) - 1, -1, -1):
+        if left[node] == TREE_LEAF:
+            leaf_class[node] = int(np.argmax(values[node, 0]))
+        else:
+            left_class = leaf_class[left[node]]
+            same = left_class == leaf_class[right[node]] and left_class >= 0
+            leaf_class[node] = left_class if same else -1
+
+    # 특성별 (하한, 상한] 구간을 따라 내려가며 도달 가능한 노드만 새로 번호 매김
+    # (깊은 트리에서도 재귀 한도에 걸리지 않도록 스택으로 전위 순회)
+    kept = []
+    new_left = []
+    new_right = []
+
+    n_features = tree.n_features
+    stack = [(0, np.full(n_features, -np.inf), np.full(n_features, np.inf), -1, None)]
+    while stack:
+        node, lower, upper, parent, children = stack.pop()
+        # 한쪽 자식에만 도달할 수 있으면 분기 노드를 건너뜀
+        while left[node] != TREE_LEAF and leaf_class[node] < 0:
+            f, t = feature[node], threshold[node]
+            if t >= upper[f]:
+                node = left[node]
+            elif t < lower[f]:
+                node = right[node]
+            else:
+                break
+
+        index = len(kept)
+        kept.append(node)
+        new_left.append(TREE_LEAF)
+        new_right.append(TREE_LEAF)
+        if children is not None:
+            children[parent] = index
+
+        if left[node] != TREE_LEAF and leaf_class[node] < 0:
+            f, t = feature[node], threshold[node]
+            left_upper = upper.copy()
+            left_upper[f] = t
+            right_lower = lower.copy()
+            right_lower[f] = t
+            # 왼쪽 서브트리가 먼저 번호를 받도록 오른쪽을 먼저 쌓음
+            stack.append((right[node], right_lower, upper, index, new_right))
+            stack.append((left[node], lower, left_upper, index, new_left))
+
+    kept = np.asarray(kept)
+    new_nodes = nodes[kept].copy()
+    new_nodes["left_child"] = new_left
+    new_nodes["right_child"] = new_right
+    is_leaf = new_nodes["left_child"] == TREE_LEAF
+    new_nodes["feature"][is_leaf] = TREE_UNDEFINED
+    new_nodes["threshold"][is_leaf] = TREE_UNDEFINED
+    new_nodes["threshold"][~is_leaf] = snap_thresholds_to_float32(
+        new_nodes["threshold"][~is_leaf]
+    )
+
+    pruned = Tree(n_features, np.asarray(tree.n_classes, dtype=np.intp), tree.n_outputs)
+    pruned.__setstate__(
+        {
+            "max_depth": _depth(new_nodes),
+            "node_count": len(new_nodes),
+            "nodes": new_nodes,
+            "values": np.ascontiguousarray(values[kept]),
+        }
+    )
+    return pruned
+
+
+def _depth(nodes):
+    depth = np.zeros(len(nodes), dtype=np.int64)
+    for node in range(len(nodes)):
+        for child in (nodes["left_child"][node], nodes["right_child"][node]):
+            if child != TREE_LEAF:
+                depth[child] = depth[node] + 1
+    return int(depth.max())
+
+
+def min_tree_count(n_trees, min_tree_fraction=MIN_TREE_FRACTION):
+    """압축 후 남길 최소 트리 수 (원래 트리 수를 넘지 않음)"""
+    return min(n_trees, max(MIN_TREES, math.ceil(n_trees * min_tree_fraction)))
+
+
+def select_trees(
+    model,
+    X_ref,
+    max_rows=10_000,
+    random_state=42,
+    min_tree_fraction=MIN_TREE_FRACTION,
+    max_proba_shift=SELECTION_PROBA_SHIFT,
+):
+    """기준 데이터의 앙상블 예측을 유지하는 트리 인덱스 선택 (greedy)
+
+    트리를 하나씩 빼 보면서 기준 데이터의 예측 클래스가 그대로이고, 원래 앙상블 대비 확률 변화가
+    max_proba_shift 이하일 때만 제거하며, min_tree_count개보다 적게 남기지 않습니다.
+    트리별 확률을 (트리 수, 행 수, 클래스 수) 배열로 들고 있어야 하므로,
+    X_ref가 max_rows보다 크면 max_rows개 행만 무작위로 뽑아 기준으로 씁니다.
+    """
+    X_ref = np.asarray(X_ref, dtype=np.float32)
+    if len(X_ref) > max_rows:
+        rng = np.random.default_rng(random_state)
+        X_ref = X_ref[np.sort(rng.choice(len(X_ref), max_rows, replace=False))]
+    # np.stack처럼 트리별 결과와 합친 배열을 동시에 들고 있지 않도록 미리 할당해 채움
+    first = model.estimators_[0].predict_proba(X_ref)
+    per_tree = np.empty((len(model.estimators_), *first.shape))
+    per_tree[0] = first
+    for index, tree in enumerate(model.estimators_[1:], start=1):
+        per_tree[index] = tree.predict_proba(X_ref)
+    total = per_tree.sum(axis=0)
+    reference = total.argmax(axis=1)
+    reference_proba = total / len(per_tree)
+    min_trees = min_tree_count(len(per_tree), min_tree_fraction)
+
+    # 앙상블과 가장 자주 어긋나는 트리부터 제거 시도
+    agreement = (per_tree.argmax(axis=2) == reference).mean(axis=1)
+    kept = np.ones(len(per_tree), dtype=bool)
+    n_kept = len(per_tree)
+    for index in np.argsort(agreement, kind="stable"):
+        if n_kept <= min_trees:
+            break
+        candidate = total - per_tree[index]
+        shift = np.abs(candidate / (n_kept - 1) - reference_proba).max()
+        if shift <= max_proba_shift and np.array_equal(
+            candidate.argmax(axis=1), reference
+        ):
+            total = candidate
+            kept[index] = False
+            n_kept -= 1
+    return np.flatnonzero(kept)
+
+
+def split_validation(X, y, validation_size=VALIDATION_SIZE, random_state=42):
+    """학습 데이터에서 압축용 검증 데이터를 떼어 냄: (X_fit, X_val, y_fit, y_val)
+
+    압축 여부를 test 데이터로 정하면 test 메트릭이 낙관적으로 치우치므로,
+    학습에 쓰지 않은 검증 데이터로 트리를 고르고 적용 여부를 판단합니다.
+    """
+    return train_test_split(X, y, test_size=validation_size, random_state=random_state)
+
+
+def validation_rows(n_rows, validation_size=VALIDATION_SIZE):
+    """n_rows개 학습 데이터에서 split_validation이 떼어 낼 검증 데이터 행 수"""
+    return math.ceil(n_rows * validation_size)
+
+
+def skipped_report(n_validation_rows, tolerance=0.0):
+    """검증 데이터가 부족해 압축하지 않았을 때의 리포트"""
+    return {
+        "applied": False,
+        "skipped": True,
+        "validation_rows": n_validation_rows,
+        "tolerance": tolerance,
+    }
+
+
+def validation_sets(X_val, y_val):
+    """검증 데이터를 반씩 나눠 (트리 선택 기준 X_ref, 적용 판단용 X_check, y_check) 반환
+
+    트리 선택은 기준 데이터의 예측을 유지하므로, 같은 데이터로 적용 여부를 판단하지 않습니다.
+    """
+    half = len(y_val) // 2
+    return X_val[:half], X_val[half:], y_val[half:]
+
+
+def _serialized(model):
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.getvalue()
+
+
+def _load_time_ms(payload, repeats=3):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        joblib.load(io.BytesIO(payload))
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def _latency_ms(model, row, repeats=20):
+    model.predict_proba(row)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict_proba(row)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def _profile(model, X_check, y_check):
+    payload = _serialized(model)
+    return {
+        "n_trees": len(model.estimators_),
+        "node_count": int(sum(t.tree_.node_count for t in model.estimators_)),
+        "size_bytes": len(payload),
+        "load_time_ms": _load_time_ms(payload),
+        "latency_ms": _latency_ms(model, np.asarray(X_check)[:1]),
+        "accuracy": float((model.predict(X_check) == y_check).mean()),
+    }
+
+
+def compact_forest(
+    model,
+    X_ref,
+    X_check,
+    y_check,
+    tolerance=0.0,
+    max_proba_shift=MAX_PROBA_SHIFT,
+    min_validation_rows=MIN_VALIDATION_ROWS,
+):
+    """RandomForest를 압축하고 전후 비교 리포트와 함께 반환
+
+    X_ref의 앙상블 예측을 기준으로 트리를 제거하고, X_check/y_check 정확도가
+    tolerance보다 많이 떨어지거나 X_check의 predict_proba가 max_proba_shift보다 많이 바뀌면
+    원본 모델을 그대로 반환합니다. 두 데이터 모두 학습·평가에 쓰지 않은 검증 데이터여야 하며
+    (`split_validation`), 합쳐서 min_validation_rows행보다 적으면 압축하지 않습니다.
+
+    Returns:
+        (model, report): report["applied"]가 False면 원본 모델
+            (검증 데이터가 부족해 건너뛰면 report["skipped"]가 True)
+    """
+    n_validation_rows = len(X_ref) + len(X_check)
+    if n_validation_rows < min_validation_rows:
+        return model, skipped_report(n_validation_rows, tolerance)
+
+    compacted = copy.deepcopy(model)
+    compacted.estimators_ = [
+        compacted.estimators_[i] for i in select_trees(model, X_ref)
+    ]
+    compacted.n_estimators = len(compacted.estimators_)
+    for estimator in compacted.estimators_:
+        estimator.tree_ = prune_tree(estimator.tree_)
+
+    before = _profile(model, X_check, y_check)
+    after = _profile(compacted, X_check, y_check)
+    proba_shift = float(
+        np.abs(compacted.predict_proba(X_check) - model.predict_proba(X_check)).max()
+    )
+    applied = (
+        after["accuracy"] >= before["accuracy"] - tolerance
+        and proba_shift <= max_proba_shift
+    )
+
+    report = {
+        "applied": applied,
+        "tolerance": tolerance,
+        "proba_shift": proba_shift,
+        "max_proba_shift": max_proba_shift,
+    }
+    for key in before:
+        report[f"{key}_before"] = before[key]
+        report[f"{key}_after"] = after[key]
+    return (compacted if applied else model), report
+
+
+def format_report(report):
+    """압축 전후 비교를 파이프라인 출력 형식의 문자열로 변환"""
+    if report.get("skipped"):
+        return (
+            f"     검증 데이터 {report['validation_rows']}행 "
+            f"(최소 {MIN_VALIDATION_ROWS}행 필요) - 압축 건너뜀"
+        )
+    return "\n".join(
+        [
+            (
+                f"     트리: {report['n_trees_before']} → {report['n_trees_after']}개, "
+                f"노드: {report['node_count_before']} → {report['node_count_after']}개"
+            ),
+            (
+                f"     크기: {report['size_bytes_before'] / 1024:.1f} → "
+                f"{report['size_bytes_after'] / 1024:.1f}KB, "
+                f"로드: {report['load_time_ms_before']:.2f} → "
+                f"{report['load_time_ms_after']:.2f}ms, "
+                f"단건 지연: {report['latency_ms_before']:.2f} → "
+                f"{report['latency_ms_after']:.2f}ms"
+            ),
+            (
+                f"     정확도: {report['accuracy_before']:.4f} → "
+                f"{report['accuracy_after']:.4f} (허용 오차 {report['tolerance']}), "
+                f"확률 최대 변화: {report['proba_shift']:.4f} "
+                f"(허용 {report['max_proba_shift']})"
+            ),
+        ]
+    )
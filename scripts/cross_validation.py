@@ -0,0 +1,159 @@
+"""병렬 k-fold 교차 검증과 재사용 가능한 fold 인덱스
+
+80/20 분할 하나로 평가하면 분할에 따라 메트릭이 흔들리므로, 같은 하이퍼파라미터로
+k개 fold를 학습/평가해 평균과 표준편차를 봅니다.
+
+- fold 인덱스: 데이터 해시 + k + seed를 키로 디스크(.cache/folds)에 저장해 두고,
+  같은 데이터로 다시 실행하면 StratifiedKFold를 다시 돌리지 않고 불러옵니다.
+  행마다 속한 fold 번호 하나만 저장하므로 크기는 행 수 바이트 정도입니다.
+- 병렬 실행: fold들을 프로세스(joblib loky)로 나눠 학습하며, 전체 코어 예산(max_cores)을
+  넘지 않도록 worker 수 * 포레스트 n_jobs <= max_cores로 맞춥니다.
+  큰 배열은 joblib이 memmap으로 worker에 넘기므로 fold마다 데이터를 복사하지 않습니다.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from joblib import Parallel, delayed
+
+DEFAULT_CACHE_DIR = Path(".cache/folds")
+DEFAULT_N_SPLITS = 5
+
+METRIC_NAMES = ("accuracy", "f1_score", "precision", "recall")
+
+
+def data_fingerprint(X, y):
+    """X, y의 내용 해시 (fold 캐시 키)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (np.asarray(X), np.asarray(y)):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array)
+    return digest.hexdigest()
+
+
+def fold_indices(
+    X, y, n_splits=DEFAULT_N_SPLITS, random_state=42, cache_dir=DEFAULT_CACHE_DIR
+):
+    """층화 k-fold (train 인덱스, test 인덱스) 목록 (디스크 캐시 재사용)
+
+    Returns:
+        (fold 목록, 캐시에서 불러왔는지 여부)
+    """
+    path = None
+    if cache_dir is not None:
+        key = f"{data_fingerprint(X, y)}-k{n_splits}-s{random_state}"
+        path = Path(cache_dir) / f"{key}.npy"
+
+    if path is not None and path.exists():
+        assignment = np.load(path)
+        cached = True
+    else:
+        from sklearn.model_selection import StratifiedKFold
+
+        splitter = StratifiedKFold(
+            n_splits=n_splits, shuffle=True, random_state=random_state
+        )
+        assignment = np.empty(len(y), dtype=np.int16)
+        for fold, (_, test_index) in enumerate(splitter.split(np.zeros(len(y)), y)):
+            assignment[test_index] = fold
+        cached = False
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(path, assignment)
+
+    folds = [
+        (np.flatnonzero(assignment != fold), np.flatnonzero(assignment == fold))
+        for fold in range(n_splits)
+    ]
+    return folds, cached
+
+
+def plan_workers(n_folds, max_cores=None):
+    """코어 예산 안에서 (worker 프로세스 수, worker당 포레스트 n_jobs)"""
+    max_cores = max_cores or os.cpu_count() or 1
+    workers = max(1, min(n_folds, max_cores))
+    return workers, max(1, max_cores // workers)
+
+
+def _fit_and_score(params, X, y, train_index, test_index):
+    """fold 하나 학습 후 test 부분 메트릭 (worker 프로세스에서 실행)"""
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+
+    start = time.perf_counter()
+    model = RandomForestClassifier(**params)
+    model.fit(X[train_index], y[train_index])
+    fit_time = time.perf_counter() - start
+
+    y_test = y[test_index]
+    y_pred = model.predict(X[test_index])
+    return {
+        "accuracy": accuracy_score(y_test, y_pred),
+        "f1_score": f1_score(y_test, y_pred, average="weighted"),
+        "precision": precision_score(
+            y_test, y_pred, average="weighted", zero_division=0
+        ),
+        "recall": recall_score(y_test, y_pred, average="weighted", zero_division=0),
+        "fit_time_s": fit_time,
+    }
+
+
+def cross_validate(
+    params,
+    X,
+    y,
+    n_splits=DEFAULT_N_SPLITS,
+    max_cores=None,
+    random_state=42,
+    cache_dir=DEFAULT_CACHE_DIR,
+):
+    """RandomForestClassifier(**params)의 병렬 k-fold 교차 검증
+
+    params의 n_jobs는 코어 예산에 맞춰 덮어씁니다.
+
+    Returns:
+        fold별 메트릭(folds), 메트릭별 평균(mean)/표준편차(std), 실행 정보를 담은 dict
+    """
+    X, y = np.asarray(X), np.asarray(y)
+    folds, cached = fold_indices(X, y, n_splits, random_state, cache_dir)
+    workers, n_jobs = plan_workers(len(folds), max_cores)
+
+    start = time.perf_counter()
+    fold_params = {**params, "n_jobs": n_jobs}
+    results = Parallel(n_jobs=workers)(
+        delayed(_fit_and_score)(fold_params, X, y, train_index, test_index)
+        for train_index, test_index in folds
+    )
+    elapsed = time.perf_counter() - start
+
+    names = METRIC_NAMES + ("fit_time_s",)
+    return {
+        "folds": results,
+        "mean": {name: float(np.mean([r[name] for r in results])) for name in names},
+        "std": {name: float(np.std([r[name] for r in results])) for name in names},
+        "n_splits": n_splits,
+        "workers": workers,
+        "n_jobs_per_worker": n_jobs,
+        "fold_cache_hit": cached,
+        "wall_time_s": elapsed,
+    }
+
+
+def format_report(result, metric_names=METRIC_NAMES):
+    """교차 검증 결과를 파이프라인 출력 형식의 문자열로 변환"""
+    cache = "캐시 재사용" if result["fold_cache_hit"] else "새로 생성"
+    lines = [
+        (
+            f"     {result['n_splits']}-fold (fold 인덱스 {cache}), "
+            f"worker {result['workers']}개 x n_jobs {result['n_jobs_per_worker']}, "
+            f"{result['wall_time_s']:.2f}초"
+        )
+    ]
+    for i, fold in enumerate(result["folds"]):
+        scores = ", ".join(f"{name} {fold[name]:.4f}" for name in metric_names)
+        lines.append(f"     fold {i}: {scores}")
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+"""RandomForest → 얕은 결정 트리 증류 (저지연 fast 티어)
+
+학생 결정 트리가 교사 포레스트의 predict_proba를 흉내 내도록 학습합니다.
+각 입력 행을 클래스 수만큼 복제하고 클래스 k 행의 가중치를 교사의 클래스 k 확률로 주면
+(soft label), 가중 Gini 분할이 하드 라벨 대신 교사의 확률 분포를 따라갑니다.
+학습 입력 주변의 합성 입력(가우시안 지터)도 교사로 라벨링해 결정 경계 근처를 더 촘촘히 학습합니다.
+"""
+
+import numpy as np
+from sklearn.tree import DecisionTreeClassifier
+
+from scripts.model_budget import benchmark_model, count_nodes
+
+FAST_MODEL_NAME = "iris-classifier-fast"
+FAST_MODEL_ARTIFACT_PATH = "fast_model"
+FAST_MODEL_FILENAME = "fast_model.pkl"
+
+
+def augment_inputs(X, n_samples, scale=0.1, random_state=42):
+    """학습 입력 주변의 합성 입력 (특성별 표준편차 * scale 크기의 가우시안 지터)"""
+    X = np.asarray(X, dtype=np.float64)
+    rng = np.random.default_rng(random_state)
+    base = X[rng.integers(0, len(X), size=n_samples)]
+    noise = rng.normal(0.0, 1.0, size=base.shape) * X.std(axis=0) * scale
+    return base + noise
+
+
+def distill_forest(teacher, X, max_depth=4, n_synthetic=2000, random_state=42):
+    """교사 포레스트의 predict_proba를 soft label로 얕은 결정 트리 학습"""
+    X = np.asarray(X, dtype=np.float64)
+    if n_synthetic:
+        X = np.vstack([X, augment_inputs(X, n_synthetic, random_state=random_state)])
+
+    proba = teacher.predict_proba(X)
+    n_classes = proba.shape[1]
+    X_repeated = np.repeat(X, n_classes, axis=0)
+    y_repeated = np.tile(teacher.classes_, len(X))
+
+    student = DecisionTreeClassifier(max_depth=max_depth, random_state=random_state)
+    student.fit(X_repeated, y_repeated, sample_weight=proba.ravel())
+    return student
+
+
+def distillation_report(teacher, student, X_check, y_check=None):
+    """학생 모델의 교사 대비 일치율, 확률 오차, 지연시간 비교"""
+    X_check = np.asarray(X_check, dtype=np.float64)
+    X_nearby = augment_inputs(X_check, 2000, random_state=0)
+
+    report = {
+        "agreement_rate": float(
+            np.mean(student.predict(X_check) == teacher.predict(X_check))
+        ),
+        "nearby_agreement_rate": float(
+            np.mean(student.predict(X_nearby) == teacher.predict(X_nearby))
+        ),
+        "proba_mae": float(
+            np.mean(
+                np.abs(student.predict_proba(X_check) - teacher.predict_proba(X_check))
+            )
+        ),
+        "node_count": count_nodes(student),
+    }
+    if y_check is not None:
+        report["accuracy"] = float(np.mean(student.predict(X_check) == y_check))
+
+    student_bench = benchmark_model(student, X_check)
+    teacher_bench = benchmark_model(teacher, X_check)
+    report["single_row_latency_p50_ms"] = student_bench["single_row_latency_p50_ms"]
+    report["single_row_latency_p99_ms"] = student_bench["single_row_latency_p99_ms"]
+    report["speedup"] = (
+        teacher_bench["single_row_latency_p50_ms"]
+        / student_bench["single_row_latency_p50_ms"]
+    )
+    return report
+
+
+def format_report(report):
+    """증류 결과를 파이프라인 출력 형식의 문자열로 변환"""
+    lines = [
+        (
+            f"     일치율: {report['agreement_rate']:.2%} "
+            f"(주변 합성 입력 {report['nearby_agreement_rate']:.2%}), "
+            f"확률 MAE: {report['proba_mae']:.4f}"
+        ),
+        (
+            f"     단건 p50: {report['single_row_latency_p50_ms']:.3f}ms "
+            f"(포레스트 대비 {report['speedup']:.1f}배), "
+            f"노드: {report['node_count']}개"
+        ),
+    ]
+    if "accuracy" in report:
+        lines.append(f"     정확도: {report['accuracy']:.4f}")
+    return "\n".join(lines)
@@ -0,0 +1,111 @@
+"""새로 라벨링된 데이터로 기존 포레스트에 트리를 추가하는 증분 재학습
+
+전체 데이터로 처음부터 다시 학습하는 대신, 현재 모델에 warm_start로 트리를 더 키웁니다.
+새 트리는 새 데이터로만 학습하고 기존 트리는 그대로 두므로, 학습 비용은 새 데이터 크기와
+추가 트리 수에만 비례합니다. 오래된 트리를 앞에서부터 retire_oldest개 빼면
+포레스트 크기를 유지하면서 최근 데이터 쪽으로 옮겨 갈 수 있습니다.
+"""
+
+import copy
+from pathlib import Path
+
+import numpy as np
+
+from app.serialization import load_artifact
+from scripts.cross_validation import data_fingerprint
+from scripts.out_of_core import ChunkedDataSource
+from scripts.synthetic_data import load_synthetic
+
+DEFAULT_MODEL_PATH = Path("models/model.pkl")
+DEFAULT_NEW_TREES = 20
+
+
+def load_local_model(model_path=DEFAULT_MODEL_PATH):
+    """로컬 모델 파일에서 (모델, 부모 정보) 로드"""
+    model_path = Path(model_path)
+    if not model_path.exists():
+        raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {model_path}")
+    artifact = load_artifact(model_path)
+    return artifact["model"], {
+        "version": artifact.get("version"),
+        "run_id": artifact.get("mlflow_run_id"),
+        "source": "local",
+    }
+
+
+def load_new_data(data_path=None, synthetic_rows=None, chunk_size=100_000):
+    """새 데이터 (X, y) - 파일(.csv/.parquet/.npy) 또는 합성 데이터"""
+    if data_path:
+        chunks = list(ChunkedDataSource(data_path, chunk_size))
+        if not chunks:
+            raise ValueError(f"새 데이터가 비어있습니다: {data_path}")
+        return (
+            np.concatenate([X for X, _ in chunks]),
+            np.concatenate([y for _, y in chunks]),
+        )
+    if synthetic_rows:
+        return load_synthetic(synthetic_rows)
+    raise ValueError("data_path 또는 synthetic_rows가 필요합니다")
+
+
+def split_holdout(X, y, test_size=0.2, random_state=42):
+    """새 데이터를 학습/평가(held-out)로 분할 (가능하면 클래스 비율 유지)"""
+    from sklearn.model_selection import train_test_split
+
+    counts = np.unique(y, return_counts=True)[1]
+    stratify = y if counts.min() >= 2 else None
+    return train_test_split(
+        X, y, test_size=test_size, random_state=random_state, stratify=stratify
+    )
+
+
+def grow_forest(model, X, y, n_new_trees=DEFAULT_NEW_TREES, retire_oldest=0):
+    """model에 새 데이터로 학습한 트리 n_new_trees개를 추가한 복사본
+
+    Args:
+        retire_oldest: 추가 후 앞에서부터 제거할 (가장 오래된) 트리 수
+
+    새 트리의 random_state는 새 데이터 해시로 정하므로, 트리를 제거한 뒤 다시 키워도
+    남아 있는 트리와 같은 난수열을 재사용하지 않습니다.
+    """
+    if n_new_trees < 1:
+        raise ValueError("n_new_trees는 1 이상이어야 합니다")
+    if retire_oldest < 0:
+        raise ValueError("retire_oldest는 0 이상이어야 합니다")
+    # warm_start 학습은 새 데이터의 클래스로 classes_를 다시 정하므로 구성이 같아야 함
+    if not np.array_equal(np.unique(y), model.classes_):
+        raise ValueError(
+            f"새 데이터의 클래스 {np.unique(y).tolist()}가 "
+            f"모델의 클래스 {model.classes_.tolist()}와 다릅니다"
+        )
+
+    updated = copy.deepcopy(model)
+    n_trees = len(updated.estimators_)
+    if retire_oldest >= n_trees + n_new_trees:
+        raise ValueError("retire_oldest가 전체 트리 수보다 작아야 합니다")
+
+    updated.set_params(
+        warm_start=True,
+        n_estimators=n_trees + n_new_trees,
+        random_state=int(data_fingerprint(X, y)[:8], 16),
+    )
+    updated.fit(X, y)
+    updated.set_params(warm_start=False)
+
+    if retire_oldest:
+        updated.estimators_ = updated.estimators_[retire_oldest:]
+        updated.n_estimators = len(updated.estimators_)
+    return updated
+
+
+def evaluate(model, X, y):
+    """held-out 세트의 accuracy 및 weighted f1/precision/recall"""
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+
+    y_pred = model.predict(X)
+    return {
+        "accuracy": accuracy_score(y, y_pred),
+        "f1_score": f1_score(y, y_pred, average="weighted"),
+        "precision": precision_score(y, y_pred, average="weighted", zero_division=0),
+        "recall": recall_score(y, y_pred, average="weighted", zero_division=0),
+    }
@@ -0,0 +1,107 @@
+"""MLflow 기록을 모아서 한 번에 보내는 로거
+
+원격 트래킹 서버에서는 `log_metric`/`log_params`/`set_tag` 호출 하나하나가 블로킹 왕복이므로,
+파라미터·메트릭·태그를 버퍼에 모았다가 `log_batch` 한 번으로 전송합니다.
+모델 업로드처럼 오래 걸리는 작업은 백그라운드 스레드에서 동시에 실행하고,
+`close()`에서 모든 작업과 버퍼가 끝날 때까지 기다립니다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from mlflow.entities import Metric, Param, RunTag
+
+# MLflow log_batch 요청 한 번의 최대 크기 (종류별 제한과 별개로 전체 합계도 제한됨)
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+MAX_TAGS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+
+class BatchedRunLogger:
+    """한 MLflow run의 파라미터/메트릭/태그를 모아서 배치로 기록"""
+
+    def __init__(self, client, run_id, max_workers=2):
+        self.client = client
+        self.run_id = run_id
+        self._params = {}
+        self._metrics = []
+        self._tags = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mlflow-upload"
+        )
+        self._futures = []
+
+    def log_param(self, key, value):
+        self._params[key] = str(value)
+
+    def log_params(self, params):
+        for key, value in params.items():
+            self.log_param(key, value)
+
+    def log_metric(self, key, value, step=0):
+        timestamp = int(time.time() * 1000)
+        self._metrics.append(Metric(key, float(value), timestamp, step))
+
+    def log_metrics(self, metrics, step=0):
+        for key, value in metrics.items():
+            self.log_metric(key, value, step=step)
+
+    def set_tag(self, key, value):
+        self._tags[key] = str(value)
+
+    def set_tags(self, tags):
+        for key, value in tags.items():
+            self.set_tag(key, value)
+
+    def submit(self, fn, *args, **kwargs):
+        """업로드/파일 쓰기 같은 작업을 백그라운드에서 실행"""
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def wait(self):
+        """백그라운드 작업이 모두 끝날 때까지 대기 (첫 번째 예외를 다시 발생)"""
+        futures, self._futures = self._futures, []
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    def flush(self):
+        """버퍼에 모인 기록을 log_batch로 전송"""
+        metrics = self._metrics
+        params = [Param(k, v) for k, v in self._params.items()]
+        tags = [RunTag(k, v) for k, v in self._tags.items()]
+        self._metrics, self._params, self._tags = [], {}, {}
+
+        while metrics or params or tags:
+            batch_params = params[:MAX_PARAMS_PER_BATCH]
+            batch_tags = tags[:MAX_TAGS_PER_BATCH]
+            # 파라미터/태그를 먼저 담고 남은 자리만큼 메트릭을 담음
+            n_metrics = min(
+                MAX_METRICS_PER_BATCH,
+                MAX_ENTITIES_PER_BATCH - len(batch_params) - len(batch_tags),
+            )
+            self.client.log_batch(
+                self.run_id,
+                metrics=metrics[:n_metrics],
+                params=batch_params,
+                tags=batch_tags,
+            )
+            metrics = metrics[n_metrics:]
+            params = params[len(batch_params) :]
+            tags = tags[len(batch_tags) :]
+
+    def close(self):
+        """백그라운드 작업 완료를 기다린 뒤 버퍼를 모두 전송"""
+        try:
+            self.wait()
+        finally:
+            self.flush()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,108 @@
+"""서빙 예산(추론 지연시간, 모델 크기) 측정 및 검사
+
+등록 전에 모델의 단건/배치 추론 지연시간과 직렬화 크기, 트리 노드 수를 측정하고
+설정한 예산을 넘는 모델은 레지스트리에 등록하지 않도록 합니다.
+"""
+
+import gc
+import io
+import time
+
+import joblib
+import numpy as np
+
+# 기본 예산 (None이면 검사하지 않음)
+DEFAULT_BUDGETS = {
+    "max_single_row_p99_ms": 50.0,
+    "max_batch_p99_ms": 500.0,
+    "max_serialized_size_mb": 10.0,
+    "max_node_count": None,
+}
+
+# 예산 항목 → 측정 항목
+BUDGET_METRICS = {
+    "max_single_row_p99_ms": "single_row_latency_p99_ms",
+    "max_batch_p99_ms": "batch_latency_p99_ms",
+    "max_serialized_size_mb": "serialized_size_mb",
+    "max_node_count": "node_count",
+}
+
+
+def count_nodes(model):
+    """트리 기반 모델의 전체 노드 수"""
+    if hasattr(model, "estimators_"):
+        return int(sum(tree.tree_.node_count for tree in model.estimators_))
+    if hasattr(model, "tree_"):
+        return int(model.tree_.node_count)
+    return 0
+
+
+def serialized_size_bytes(model):
+    """joblib 직렬화 크기 (저장되는 아티팩트와 같은 방식)"""
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.getbuffer().nbytes
+
+
+def _latencies_ms(fn, X, repeats, warmup):
+    for _ in range(warmup):
+        fn(X)
+    latencies = np.empty(repeats)
+    # timeit처럼 측정 중에는 GC를 꺼서, 프로세스 힙 크기에 따라 달라지는
+    # 전체 GC 정지 시간이 모델의 p99 지연시간에 섞이지 않도록 함
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(repeats):
+            start = time.perf_counter()
+            fn(X)
+            latencies[i] = (time.perf_counter() - start) * 1000
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return latencies
+
+
+def benchmark_model(model, X_sample, batch_size=1000, repeats=50, warmup=5):
+    """단건/배치 추론 지연시간과 크기 측정
+
+    서빙 API와 같이 한 번의 요청을 `predict` + `predict_proba` 호출로 측정합니다.
+    """
+    X_sample = np.asarray(X_sample)
+    repeat_count = -(-batch_size // len(X_sample))
+    X_batch = np.tile(X_sample, (repeat_count, 1))[:batch_size]
+
+    def serve(X):
+        model.predict(X)
+        model.predict_proba(X)
+
+    single = _latencies_ms(serve, X_sample[:1], repeats, warmup)
+    batch = _latencies_ms(serve, X_batch, max(repeats // 5, 1), 1)
+
+    return {
+        "single_row_latency_p50_ms": float(np.percentile(single, 50)),
+        "single_row_latency_p99_ms": float(np.percentile(single, 99)),
+        "batch_latency_p50_ms": float(np.percentile(batch, 50)),
+        "batch_latency_p99_ms": float(np.percentile(batch, 99)),
+        "batch_size": batch_size,
+        "serialized_size_mb": serialized_size_bytes(model) / (1024 * 1024),
+        "node_count": count_nodes(model),
+    }
+
+
+def check_budgets(report, budgets=None):
+    """예산을 초과한 항목의 설명 목록 반환 (빈 목록이면 통과)"""
+    unknown = set(budgets or {}) - set(BUDGET_METRICS)
+    if unknown:
+        raise ValueError(f"알 수 없는 예산 항목: {sorted(unknown)}")
+
+    budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+    violations = []
+    for budget_name, limit in budgets.items():
+        if limit is None:
+            continue
+        metric_name = BUDGET_METRICS[budget_name]
+        value = report[metric_name]
+        if value > limit:
+            violations.append(f"{metric_name}={value:.4g} > {budget_name}={limit:.4g}")
+    return violations
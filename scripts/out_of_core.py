@@ -0,0 +1,270 @@
+"""메모리에 올릴 수 없는 대용량 데이터셋을 위한 out-of-core 학습 도구
+
+디스크의 데이터를 청크 단위로 읽어 전처리 → 학습 → 평가까지 스트리밍으로 처리합니다.
+학습은 청크마다 작은 RandomForest를 만들어 하나의 RandomForestClassifier로 합치므로,
+결과 모델은 기존 `save_model`/MLflow 경로와 `app.main.load_model`에서 그대로 사용됩니다.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FEATURE_NAMES = [
+    "sepal_length",
+    "sepal_width",
+    "petal_length",
+    "petal_width",
+]
+TARGET_COLUMN = "target"
+
+# 병합한 포레스트의 최대 트리 수 (청크 수가 많아도 모델 크기/추론 지연시간이 늘지 않도록)
+DEFAULT_MAX_TREES = 200
+
+
+class ChunkedDataSource:
+    """디스크의 데이터셋을 청크 단위로 읽는 데이터 소스
+
+    지원 형식:
+      - .csv: 특성 4개 컬럼 + target 컬럼
+      - .parquet: CSV와 같은 컬럼 구성 (pyarrow 필요)
+      - .npy: (n, 5) 배열, 마지막 열이 target (memory-map으로 읽음)
+    """
+
+    SUPPORTED_SUFFIXES = (".csv", ".parquet", ".npy")
+
+    def __init__(self, path, chunk_size=100_000):
+        self.path = Path(path)
+        self.chunk_size = int(chunk_size)
+
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+        if self.path.suffix not in self.SUPPORTED_SUFFIXES:
+            raise ValueError(
+                f"지원하지 않는 형식입니다: {self.path.suffix} "
+                f"(지원: {', '.join(self.SUPPORTED_SUFFIXES)})"
+            )
+        if not self.path.exists():
+            raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {self.path}")
+
+    def __iter__(self):
+        """(X, y) 청크를 순서대로 반환"""
+        if self.path.suffix == ".csv":
+            yield from self._iter_csv()
+        elif self.path.suffix == ".parquet":
+            yield from self._iter_parquet()
+        else:
+            yield from self._iter_npy()
+
+    def _split_frame(self, df):
+        missing = [c for c in FEATURE_NAMES + [TARGET_COLUMN] if c not in df.columns]
+        if missing:
+            raise ValueError(f"필수 컬럼이 없습니다: {missing}")
+        X = df[FEATURE_NAMES].to_numpy(dtype=np.float64)
+        y = df[TARGET_COLUMN].to_numpy(dtype=np.int64)
+        return X, y
+
+    def _iter_csv(self):
+        for df in pd.read_csv(self.path, chunksize=self.chunk_size):
+            yield self._split_frame(df)
+
+    def _iter_parquet(self):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet 데이터를 읽으려면 pyarrow가 필요합니다") from e
+
+        parquet_file = pq.ParquetFile(self.path)
+        for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+            yield self._split_frame(batch.to_pandas())
+
+    def _iter_npy(self):
+        data = np.load(self.path, mmap_mode="r")
+        if data.ndim != 2 or data.shape[1] != len(FEATURE_NAMES) + 1:
+            raise ValueError(
+                f"npy 데이터는 (n, {len(FEATURE_NAMES) + 1}) 형태여야 합니다: "
+                f"{data.shape}"
+            )
+        for start in range(0, data.shape[0], self.chunk_size):
+            # memory-map 슬라이스를 복사해 청크만 메모리에 올림
+            chunk = np.array(data[start : start + self.chunk_size])
+            yield chunk[:, :-1].astype(np.float64), chunk[:, -1].astype(np.int64)
+
+
+def split_masks(
+    chunk_index, n_rows, test_size=0.2, random_state=42, validation_size=0.0
+):
+    """청크별 (test 마스크, validation 마스크) (같은 청크는 항상 같은 분할)"""
+    rng = np.random.default_rng([random_state, chunk_index])
+    draws = rng.random(n_rows)
+    test_mask = draws < test_size
+    return test_mask, ~test_mask & (draws < test_size + validation_size)
+
+
+def iter_split_chunks(
+    source,
+    subset,
+    preprocess=None,
+    test_size=0.2,
+    random_state=42,
+    validation_size=0.0,
+):
+    """청크를 읽어 전처리한 뒤 train, test 또는 validation 부분만 반환
+
+    validation_size를 주면 train 부분에서 그 비율만큼을 validation으로 떼어 내고,
+    train에서는 제외합니다 (test 분할은 validation_size와 상관없이 같음).
+    """
+    if subset not in ("train", "test", "validation"):
+        raise ValueError("subset은 'train', 'test' 또는 'validation'이어야 합니다")
+
+    for chunk_index, (X, y) in enumerate(source):
+        if preprocess is not None:
+            X = preprocess(X)
+        test_mask, validation_mask = split_masks(
+            chunk_index, len(y), test_size, random_state, validation_size
+        )
+        if subset == "test":
+            mask = test_mask
+        elif subset == "validation":
+            mask = validation_mask
+        else:
+            mask = ~(test_mask | validation_mask)
+        if mask.any():
+            yield X[mask], y[mask]
+
+
+def head_of_split(
+    source, subset, max_rows=10_000, preprocess=None, validation_size=0.0
+):
+    """train, test 또는 validation 분할의 앞쪽에서 최대 max_rows개 샘플을 모음
+
+    모델 압축·서빙 예산 검사처럼 메모리에 올릴 수 있는 표본이 필요한 단계에서 사용합니다.
+    """
+    X_parts, y_parts = [], []
+    n_rows = 0
+    for X, y in iter_split_chunks(
+        source, subset, preprocess=preprocess, validation_size=validation_size
+    ):
+        X_parts.append(X[: max_rows - n_rows])
+        y_parts.append(y[: max_rows - n_rows])
+        n_rows += len(y_parts[-1])
+        if n_rows >= max_rows:
+            break
+    if not X_parts:
+        raise ValueError(f"{subset} 분할에 샘플이 없습니다")
+    return np.concatenate(X_parts), np.concatenate(y_parts)
+
+
+def fit_forest_in_chunks(
+    chunks,
+    classes,
+    trees_per_chunk=10,
+    max_depth=5,
+    random_state=42,
+    n_jobs=-1,
+    max_trees=DEFAULT_MAX_TREES,
+):
+    """청크마다 RandomForest를 학습해 하나의 RandomForestClassifier로 병합
+
+    모든 트리가 같은 클래스 구성을 갖도록, 전체 클래스가 모이지 않은 청크는
+    다음 청크와 합쳐서 학습합니다. 전체 트리가 max_trees를 넘으면 지금까지 만든
+    트리 중 max_trees개를 균등하게 표본 추출(reservoir sampling)해 유지하므로,
+    데이터 크기와 상관없이 메모리와 모델 크기가 제한되고 모든 청크가 고르게 반영됩니다.
+    """
+    from sklearn.ensemble import RandomForestClassifier
+
+    classes = np.asarray(classes)
+    forest = None
+    pending_X, pending_y = [], []
+    n_fits = 0
+    n_seen = 0
+    rng = np.random.default_rng(random_state)
+
+    def fit_pending():
+        nonlocal forest, n_fits, n_seen
+        X = np.concatenate(pending_X)
+        y = np.concatenate(pending_y)
+        pending_X.clear()
+        pending_y.clear()
+
+        chunk_forest = RandomForestClassifier(
+            n_estimators=trees_per_chunk,
+            max_depth=max_depth,
+            random_state=random_state + n_fits,
+            n_jobs=n_jobs,
+        )
+        chunk_forest.fit(X, y)
+        n_fits += 1
+
+        trees = chunk_forest.estimators_
+        if forest is None:
+            forest = chunk_forest
+            forest.estimators_ = []
+        for tree in trees:
+            n_seen += 1
+            if max_trees is None or len(forest.estimators_) < max_trees:
+                forest.estimators_.append(tree)
+            else:
+                slot = rng.integers(n_seen)
+                if slot < max_trees:
+                    forest.estimators_[slot] = tree
+        forest.n_estimators = len(forest.estimators_)
+
+    for X, y in chunks:
+        pending_X.append(X)
+        pending_y.append(y)
+        if np.isin(classes, np.concatenate(pending_y)).all():
+            fit_pending()
+
+    if pending_y:
+        if np.isin(classes, np.concatenate(pending_y)).all():
+            fit_pending()
+        else:
+            skipped = sum(len(y) for y in pending_y)
+            print(f"  ⚠️  마지막 {skipped}개 샘플은 모든 클래스를 포함하지 않아 제외")
+
+    if forest is None:
+        raise ValueError("모든 클래스를 포함하는 학습 데이터가 없습니다")
+
+    return forest
+
+
+def confusion_in_chunks(model, chunks, n_classes):
+    """청크 단위로 예측해 혼동 행렬을 누적"""
+    confusion = np.zeros((n_classes, n_classes), dtype=np.int64)
+    for X, y in chunks:
+        y_pred = model.predict(X)
+        np.add.at(confusion, (y, y_pred.astype(np.int64)), 1)
+    return confusion
+
+
+def metrics_from_confusion(confusion):
+    """혼동 행렬에서 accuracy 및 weighted f1/precision/recall 계산
+
+    sklearn의 `average="weighted"`, `zero_division=0`과 같은 값을 반환합니다.
+    """
+    confusion = np.asarray(confusion, dtype=np.float64)
+    total = confusion.sum()
+    if total == 0:
+        raise ValueError("평가할 샘플이 없습니다")
+
+    true_positive = np.diag(confusion)
+    support = confusion.sum(axis=1)
+    predicted = confusion.sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(predicted > 0, true_positive / predicted, 0.0)
+        recall = np.where(support > 0, true_positive / support, 0.0)
+        f1 = np.where(
+            precision + recall > 0,
+            2 * precision * recall / (precision + recall),
+            0.0,
+        )
+
+    weights = support / total
+    return {
+        "accuracy": float(true_positive.sum() / total),
+        "f1_score": float((f1 * weights).sum()),
+        "precision": float((precision * weights).sum()),
+        "recall": float((recall * weights).sum()),
+    }
@@ -0,0 +1,48 @@
+"""드리프트 감시용 학습 데이터 기준 통계
+
+특성별 분위수 구간 경계와 구간별 비율을 계산해 모델 옆(models/reference_stats.json,
+MLflow run 아티팩트)에 저장합니다. 서빙 쪽(`app.drift`)은 같은 구간 경계로 실시간 입력의
+분포를 계산해 PSI/KS로 비교합니다.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+REFERENCE_STATS_FILENAME = "reference_stats.json"
+
+FEATURE_NAMES = ["sepal_length", "sepal_width", "petal_length", "petal_width"]
+
+
+def compute_reference_stats(X, feature_names=None, n_bins=10):
+    """특성별 분위수 구간 경계와 구간별 비율 계산
+
+    구간 경계는 내부 경계만 저장하며(양 끝은 ±무한대), 값이 겹치는 분위수는 하나로 합칩니다.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+
+    bin_edges = []
+    bin_fractions = []
+    for column in X.T:
+        edges = np.unique(np.quantile(column, quantiles))
+        counts = np.bincount(
+            np.searchsorted(edges, column, side="right"), minlength=len(edges) + 1
+        )
+        bin_edges.append(edges.tolist())
+        bin_fractions.append((counts / len(column)).tolist())
+
+    return {
+        "feature_names": list(feature_names or FEATURE_NAMES),
+        "n_samples": len(X),
+        "bin_edges": bin_edges,
+        "bin_fractions": bin_fractions,
+    }
+
+
+def save_reference_stats(stats, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(stats, indent=2))
+    return path
@@ -0,0 +1,323 @@
+"""메모이즈되는 단계 그래프(DAG) 실행기와 두 학습 파이프라인이 공유하는 데이터 단계
+
+파이프라인을 data → preprocess → split → train → evaluate → package 같은 선언된 단계로
+나타내고, 각 단계의 출력을 디스크에 저장해 둡니다. 캐시 키는 단계 이름, 함수 코드(바이트코드,
+상수, 참조하는 이름, 기본 인자), 단계 버전, 파라미터, 입력 단계들의 키를 합친 해시라서 어떤 단계의
+파라미터나 함수가 바뀌면 그 단계와 하위 단계만 다시 실행됩니다. 예를 들어 평가 설정(cv_folds)만 바꾸면 학습은 캐시에서 불러옵니다.
+서로 의존하지 않는 단계(학습과 기준 통계 계산 등)는 스레드 풀에서 동시에 실행합니다.
+
+함수 코드는 그 함수(와 클로저로 감싼 함수)만 해시하므로, 호출하는 다른 모듈의 코드가 바뀌면
+add(..., version=)으로 단계 버전을 올리거나 캐시 디렉토리를 지우세요.
+"""
+
+import hashlib
+import json
+import os
+import time
+import types
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import joblib
+import pandas as pd
+
+from scripts.out_of_core import FEATURE_NAMES
+from scripts.synthetic_data import load_synthetic
+
+DEFAULT_CACHE_DIR = Path(".cache/stages")
+
+
+class Stage:
+    """그래프의 단계 하나: fn(*입력 단계 출력, **params)"""
+
+    def __init__(self, name, fn, inputs=(), params=None, cache=True, version=None):
+        self.name = name
+        self.fn = fn
+        self.inputs = tuple(inputs)
+        self.params = dict(params or {})
+        self.cache = cache
+        self.version = version
+
+
+def _const_identity(value):
+    # 중첩 함수/람다의 코드 객체는 repr에 메모리 주소가 들어가므로 내용으로 식별
+    if isinstance(value, types.CodeType):
+        return _code_identity(value)
+    if isinstance(value, tuple):
+        return b"(" + b",".join(map(_const_identity, value)) + b")"
+    if isinstance(value, frozenset):
+        return b"{" + b",".join(sorted(map(_const_identity, value))) + b"}"
+    return repr(value).encode()
+
+
+def _code_identity(code):
+    """바이트코드 + 상수 + 참조하는 이름 (상수나 호출하는 함수 이름만 바뀌어도 달라짐)"""
+    return b"|".join(
+        [
+            code.co_code,
+            _const_identity(code.co_consts),
+            ",".join(code.co_names).encode(),
+        ]
+    )
+
+
+def _fn_identity(fn):
+    """캐시 키에 넣는 함수 식별 정보 (이름, 코드, 기본 인자, 클로저로 감싼 함수)"""
+    name = getattr(fn, "__qualname__", repr(fn))
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return name.encode()
+
+    parts = [name.encode(), _code_identity(code)]
+    defaults = [getattr(fn, "__defaults__", None), getattr(fn, "__kwdefaults__", None)]
+    parts.append(json.dumps(defaults, sort_keys=True, default=repr).encode())
+    # 데코레이터/래퍼가 감싼 함수도 반영 (다른 클로저 값은 실행 중 바뀔 수 있어 제외)
+    for cell in getattr(fn, "__closure__", None) or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(value, types.MethodType):
+            # 인스턴스 메서드를 감싼 경우 (하위 클래스에서 재정의한 전처리 등)
+            value = value.__func__
+        if isinstance(value, types.FunctionType) and value is not fn:
+            parts.append(_fn_identity(value))
+    return b"\x00".join(parts)
+
+
+class StageGraph:
+    """단계 출력을 디스크에 메모이즈하고 독립 단계를 동시에 실행하는 DAG 실행기
+
+    cache_dir가 None이면 디스크에 저장하지 않고 한 번의 실행 안에서만 출력을 재사용합니다.
+    """
+
+    def __init__(self, cache_dir=None, max_workers=4):
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        self.max_workers = max_workers
+        self.stages = {}
+        self.outputs = {}
+        self.results = []
+        self._keys = {}
+
+    def add(self, name, fn, inputs=(), params=None, cache=True, version=None):
+        """단계 추가 (입력 단계는 먼저 추가되어 있어야 하므로 순환이 생기지 않음)
+
+        cache=False인 단계(모델 저장/등록처럼 부수 효과가 목적인 단계)는 항상 실행합니다.
+        version은 캐시 키에 들어가므로, 함수 밖(호출하는 모듈 등)의 변경으로 출력이 달라질 때
+        올려서 그 단계와 하위 단계를 다시 실행하게 합니다.
+        """
+        if name in self.stages:
+            raise ValueError(f"이미 있는 단계입니다: {name}")
+        unknown = [i for i in inputs if i not in self.stages]
+        if unknown:
+            raise ValueError(f"알 수 없는 입력 단계: {unknown}")
+        self.stages[name] = Stage(name, fn, inputs, params, cache, version)
+        return self
+
+    def key(self, name):
+        """단계 이름, 함수, 버전, 파라미터, 입력 단계 키의 해시"""
+        if name not in self._keys:
+            stage = self.stages[name]
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(name.encode())
+            digest.update(_fn_identity(stage.fn))
+            digest.update(repr(stage.version).encode())
+            digest.update(
+                json.dumps(stage.params, sort_keys=True, default=repr).encode()
+            )
+            for input_name in stage.inputs:
+                digest.update(self.key(input_name).encode())
+            self._keys[name] = digest.hexdigest()
+        return self._keys[name]
+
+    def _required(self, targets):
+        """targets와 그 입력 단계 중 아직 실행하지 않은 단계"""
+        required, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in self.stages:
+                raise KeyError(f"알 수 없는 단계: {name}")
+            if name in required or name in self.outputs:
+                continue
+            required.add(name)
+            stack.extend(self.stages[name].inputs)
+        return required
+
+    def run(self, targets=None):
+        """targets(기본값: 모든 단계)까지 실행하고 {단계: 출력} 반환"""
+        targets = list(targets or self.stages)
+        pending = {
+            name: {i for i in self.stages[name].inputs if i not in self.outputs}
+            for name in self._required(targets)
+        }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while pending or running:
+                ready = [name for name, deps in pending.items() if not deps]
+                if len(ready) == 1 and not running:
+                    # 동시에 실행할 단계가 없으면 호출한 스레드에서 실행
+                    # (MLflow 활성 run처럼 스레드별 상태를 쓰는 단계도 그대로 동작)
+                    del pending[ready[0]]
+                    self._finish(ready[0], self._execute(ready[0]), pending)
+                    continue
+                for name in ready:
+                    del pending[name]
+                    running[executor.submit(self._execute, name)] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    self._finish(name, future.result(), pending)
+
+        return {name: self.outputs[name] for name in targets}
+
+    def _finish(self, name, output, pending):
+        self.outputs[name] = output
+        for deps in pending.values():
+            deps.discard(name)
+
+    def _cache_path(self, stage):
+        if self.cache_dir is None or not stage.cache:
+            return None
+        return self.cache_dir / f"{stage.name}-{self.key(stage.name)}.joblib"
+
+    def _execute(self, name):
+        stage = self.stages[name]
+        path = self._cache_path(stage)
+        start = time.perf_counter()
+
+        cached = path is not None and path.exists()
+        if cached:
+            output = joblib.load(path)
+            print(f"  → [캐시] {name} ({self.key(name)[:12]})")
+        else:
+            output = stage.fn(*(self.outputs[i] for i in stage.inputs), **stage.params)
+            if path is not None:
+                # 중간에 실패해도 깨진 캐시 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+                joblib.dump(output, tmp_path)
+                tmp_path.replace(path)
+
+        self.results.append(
+            {
+                "stage": name,
+                "key": self.key(name),
+                "cached": cached,
+                "wall_time_s": time.perf_counter() - start,
+            }
+        )
+        return output
+
+    def cached_stages(self):
+        return [result["stage"] for result in self.results if result["cached"]]
+
+    def executed_stages(self):
+        return [result["stage"] for result in self.results if not result["cached"]]
+
+
+# --- 두 파이프라인이 공유하는 데이터 단계 ---
+
+
+def load_dataset(synthetic_rows=None):
+    """데이터 수집 및 검증 (Iris 또는 Iris 분포 합성 데이터)
+
+    Returns:
+        (X, y)
+    """
+    if synthetic_rows:
+        X, y = load_synthetic(synthetic_rows)
+        print(f"  → 데이터 수집 (합성 데이터 {synthetic_rows:,}행)")
+    else:
+        # 데이터 수집 (sklearn 내장 데이터셋)
+        from sklearn.datasets import load_iris
+
+        iris = load_iris()
+        X, y = iris.data, iris.target
+        print("  → 데이터 수집 (Iris dataset)")
+    print(f"  → 데이터 검증: {X.shape[0]}개 샘플, {X.shape[1]}개 특성")
+    assert X.shape[0] > 0, "데이터가 비어있습니다"
+    assert not pd.DataFrame(X).isnull().any().any(), "결측치 발견"
+    return X, y
+
+
+def preprocess_features(X, verbose=True):
+    """Iris 데이터셋 전처리: 이상치 탐지 및 선택적 스케일링"""
+    # DataFrame으로 변환 (이상치 탐지용)
+    df = pd.DataFrame(X, columns=FEATURE_NAMES)
+
+    # 이상치 탐지 (IQR 방법)
+    if verbose:
+        print("  → 이상치 탐지 중...")
+    Q1 = df.quantile(0.25)
+    Q3 = df.quantile(0.75)
+    IQR = Q3 - Q1
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+
+    # 이상치가 있는 행 찾기
+    outliers = ((df < lower_bound) | (df > upper_bound)).any(axis=1)
+    outlier_count = outliers.sum()
+
+    if verbose and outlier_count > 0:
+        print(
+            f"  → 이상치 {outlier_count}개 발견 "
+            "(제거하지 않음 - Iris 데이터는 정상 범위)"
+        )
+    elif verbose:
+        print("  → 이상치 없음")
+
+    # 특성 스케일링은 생략: RandomForest는 스케일링이 필요 없고
+    # Iris 데이터는 이미 정규화가 잘 되어있음
+    if verbose:
+        print("  → 전처리 완료 (Iris 데이터는 추가 스케일링 불필요)")
+
+    return X
+
+
+def preprocess_dataset(data, preprocess=preprocess_features):
+    """(X, y)의 특성만 preprocess(X)로 전처리"""
+    X, y = data
+    print("  → 데이터 전처리")
+    return preprocess(X), y
+
+
+def split_dataset(data, test_size=0.2, random_state=42):
+    """(X, y)를 train/test로 분할
+
+    Returns:
+        (X_train, X_test, y_train, y_test)
+    """
+    from sklearn.model_selection import train_test_split
+
+    X, y = data
+    print(f"  → 데이터 분할 (Train: {1 - test_size:.0%}, Test: {test_size:.0%})")
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state
+    )
+    print(f"     Train: {X_train.shape[0]}개, Test: {X_test.shape[0]}개")
+    return X_train, X_test, y_train, y_test
+
+
+def reference_stats_stage(split):
+    """학습 분할의 드리프트 기준 통계"""
+    from scripts.reference_stats import compute_reference_stats
+
+    return compute_reference_stats(split[0])
+
+
+def add_data_stages(graph, synthetic_rows=None, preprocess=preprocess_features):
+    """data → preprocess → split → reference_stats 단계 추가
+
+    preprocess는 특성 전처리 함수로, 파이프라인의 preprocess_data 메서드를 넘기면 하위 클래스에서
+    재정의한 전처리가 그래프에도 쓰입니다 (감싼 함수 코드가 캐시 키에 들어감).
+    """
+
+    def preprocess_stage(data):
+        return preprocess_dataset(data, preprocess)
+
+    graph.add("data", load_dataset, params={"synthetic_rows": synthetic_rows})
+    graph.add("preprocess", preprocess_stage, inputs=("data",))
+    graph.add("split", split_dataset, inputs=("preprocess",))
+    graph.add("reference_stats", reference_stats_stage, inputs=("split",))
+    return graph
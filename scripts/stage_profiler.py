@@ -0,0 +1,146 @@
+"""파이프라인 단계별 비용 측정 도구
+
+각 단계의 wall time, CPU time, peak RSS, tracemalloc peak를 기록해
+데이터/학습/평가/저장 중 어느 단계가 병목인지 확인할 수 있게 합니다.
+tracemalloc은 모든 Python 할당을 추적하므로 켜져 있으면 할당이 많은 단계의 시간이 부풀려집니다.
+실행 간 시간을 비교할 때(벤치마크, 회귀 검사)는 trace_malloc=False로 측정하세요.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROC_STATUS = Path("/proc/self/status")
+PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def _reset_peak_rss():
+    """프로세스의 peak RSS(VmHWM)를 현재 RSS로 초기화 (Linux 전용)
+
+    초기화할 수 없으면 False를 반환하며, 이때 peak RSS는 프로세스 전체 기준입니다.
+    """
+    try:
+        PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_bytes():
+    """현재까지의 peak RSS (bytes), 측정할 수 없으면 None"""
+    try:
+        for line in PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageProfiler:
+    """파이프라인 단계별 wall/CPU 시간과 메모리 peak 측정
+
+    trace_malloc=True면 tracemalloc peak도 기록하지만, 그 단계의 wall/CPU 시간에 추적 오버헤드가
+    포함됩니다 (peak RSS는 tracemalloc 없이도 측정).
+    """
+
+    def __init__(self, trace_malloc=True):
+        self.trace_malloc = trace_malloc
+        self.results = []
+
+    @contextmanager
+    def stage(self, name):
+        """with 블록 하나를 한 단계로 측정"""
+        started_tracing = False
+        if self.trace_malloc:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+
+        peak_rss_scoped = _reset_peak_rss()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            peak_rss = _peak_rss_bytes()
+
+            tracemalloc_peak = None
+            if self.trace_malloc:
+                tracemalloc_peak = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+
+            self.results.append(
+                {
+                    "stage": name,
+                    "wall_time_s": wall_time,
+                    "cpu_time_s": cpu_time,
+                    "peak_rss_mb": _to_mb(peak_rss),
+                    "peak_rss_scope": "stage" if peak_rss_scoped else "process",
+                    "tracemalloc_peak_mb": _to_mb(tracemalloc_peak),
+                }
+            )
+
+    def as_metrics(self):
+        """MLflow 메트릭 형식으로 변환 (stage_<단계>_<항목>)"""
+        metrics = {}
+        for result in self.results:
+            for key in (
+                "wall_time_s",
+                "cpu_time_s",
+                "peak_rss_mb",
+                "tracemalloc_peak_mb",
+            ):
+                if result[key] is not None:
+                    metrics[f"stage_{result['stage']}_{key}"] = result[key]
+        return metrics
+
+    def summary_table(self):
+        """단계별 측정 결과를 표 형태의 문자열로 반환"""
+        header = (
+            f"{'Stage':<12}{'Wall(s)':>10}{'CPU(s)':>10}"
+            f"{'PeakRSS(MB)':>14}{'PyPeak(MB)':>13}"
+        )
+        lines = [header, "-" * len(header)]
+        for result in self.results:
+            lines.append(
+                f"{result['stage']:<12}"
+                f"{result['wall_time_s']:>10.3f}"
+                f"{result['cpu_time_s']:>10.3f}"
+                f"{_format_mb(result['peak_rss_mb']):>14}"
+                f"{_format_mb(result['tracemalloc_peak_mb']):>13}"
+            )
+        return "\n".join(lines)
+
+    def write_json(self, path, **extra):
+        """CI 회귀 추적용 JSON 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = dict(extra, stages=self.results)
+        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+        return path
+
+
+def _to_mb(value):
+    return None if value is None else value / (1024 * 1024)
+
+
+def _format_mb(value):
+    return "n/a" if value is None else f"{value:.1f}"
@@ -0,0 +1,200 @@
+"""Iris 클래스 분포 기반 합성 데이터 생성기 (규모 확장 벤치마크용)
+
+Iris 150행에서 클래스별 평균/공분산을 추정해 다변량 정규분포로 샘플을 만듭니다.
+청크마다 (seed, 청크 번호)로 난수 생성기를 만들기 때문에 같은 seed와 chunk_size면
+몇 번을 만들어도, 어느 청크부터 만들어도 같은 데이터가 나옵니다.
+10^8행처럼 메모리에 올릴 수 없는 크기는 청크 단위로 디스크(.npy/.csv/.parquet)에 씁니다.
+
+```bash
+python -m scripts.synthetic_data --rows 100000000 --output data/synthetic_1e8.npy
+python -m scripts.train_pipeline --data-path data/synthetic_1e8.npy
+```
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.out_of_core import FEATURE_NAMES, TARGET_COLUMN
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+DEFAULT_SEED = 42
+
+# 꽃받침/꽃잎 길이가 음수가 되지 않도록 하는 하한 (cm)
+MIN_FEATURE_VALUE = 0.1
+
+
+def fit_class_distributions():
+    """Iris 데이터의 클래스별 (평균, 공분산의 Cholesky 인수, 비율)"""
+    from sklearn.datasets import load_iris
+
+    X, y = load_iris(return_X_y=True)
+    classes = np.unique(y)
+    covariances = [np.cov(X[y == c], rowvar=False) for c in classes]
+    return {
+        "classes": classes,
+        "means": np.array([X[y == c].mean(axis=0) for c in classes]),
+        "cholesky": np.array([np.linalg.cholesky(cov) for cov in covariances]),
+        "priors": np.array([np.mean(y == c) for c in classes]),
+    }
+
+
+def generate_chunk(n_rows, chunk_index=0, seed=DEFAULT_SEED, distributions=None):
+    """청크 하나 생성 (같은 seed/chunk_index면 항상 같은 값)
+
+    Returns:
+        (X (n_rows, 4) float64, y (n_rows,) int64)
+    """
+    distributions = distributions or fit_class_distributions()
+    rng = np.random.default_rng([seed, chunk_index])
+
+    classes = distributions["classes"]
+    y = rng.choice(classes, size=n_rows, p=distributions["priors"])
+    # 표준정규 표본에 클래스별 Cholesky 인수를 곱해 공분산을 맞춤
+    X = rng.standard_normal((n_rows, len(FEATURE_NAMES)))
+    for i, c in enumerate(classes):
+        mask = y == c
+        X[mask] = X[mask] @ distributions["cholesky"][i].T + distributions["means"][i]
+    np.maximum(X, MIN_FEATURE_VALUE, out=X)
+    return X, y.astype(np.int64)
+
+
+def iter_synthetic_chunks(n_rows, chunk_size=DEFAULT_CHUNK_SIZE, seed=DEFAULT_SEED):
+    """n_rows행을 chunk_size씩 (X, y)로 생성"""
+    distributions = fit_class_distributions()
+    for chunk_index, start in enumerate(range(0, n_rows, chunk_size)):
+        yield generate_chunk(
+            min(chunk_size, n_rows - start), chunk_index, seed, distributions
+        )
+
+
+class SyntheticDataSource:
+    """디스크 없이 합성 데이터를 청크 단위로 반환하는 데이터 소스
+
+    `ChunkedDataSource`와 같은 인터페이스라 out-of-core 학습/평가에 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, n_rows, chunk_size=DEFAULT_CHUNK_SIZE, seed=DEFAULT_SEED):
+        if n_rows <= 0 or chunk_size <= 0:
+            raise ValueError("n_rows와 chunk_size는 1 이상이어야 합니다")
+        self.n_rows = int(n_rows)
+        self.chunk_size = int(chunk_size)
+        self.seed = seed
+        self.path = f"synthetic://{self.n_rows}?seed={seed}"
+
+    def __iter__(self):
+        yield from iter_synthetic_chunks(self.n_rows, self.chunk_size, self.seed)
+
+
+def load_synthetic(n_rows, seed=DEFAULT_SEED, chunk_size=DEFAULT_CHUNK_SIZE):
+    """합성 데이터를 메모리에 한 번에 생성 (in-memory 파이프라인용)"""
+    chunks = list(iter_synthetic_chunks(n_rows, chunk_size, seed))
+    return (
+        np.concatenate([X for X, _ in chunks]),
+        np.concatenate([y for _, y in chunks]),
+    )
+
+
+def write_synthetic_dataset(
+    path,
+    n_rows,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    seed=DEFAULT_SEED,
+    dtype=np.float32,
+):
+    """합성 데이터를 청크 단위로 파일에 기록 (메모리 사용량은 청크 크기에 비례)
+
+    형식은 확장자로 정하며 `ChunkedDataSource`가 읽는 형식과 같습니다.
+      - .npy: (n_rows, 5) 배열, 마지막 열이 target (dtype, 기본 float32)
+      - .csv: 특성 4개 컬럼 + target 컬럼
+      - .parquet: CSV와 같은 컬럼 구성 (pyarrow 필요)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    chunks = iter_synthetic_chunks(n_rows, chunk_size, seed)
+
+    if path.suffix == ".npy":
+        data = np.lib.format.open_memmap(
+            path, mode="w+", dtype=dtype, shape=(n_rows, len(FEATURE_NAMES) + 1)
+        )
+        start = 0
+        for X, y in chunks:
+            data[start : start + len(y), :-1] = X
+            data[start : start + len(y), -1] = y
+            start += len(y)
+        data.flush()
+        del data
+    elif path.suffix == ".csv":
+        with path.open("w", newline="") as f:
+            for chunk_index, (X, y) in enumerate(chunks):
+                _frame(X, y).to_csv(
+                    f, index=False, header=chunk_index == 0, float_format="%.4f"
+                )
+    elif path.suffix == ".parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet로 쓰려면 pyarrow가 필요합니다") from e
+
+        writer = None
+        try:
+            for X, y in chunks:
+                table = pa.Table.from_pandas(_frame(X, y), preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        raise ValueError(f"지원하지 않는 형식입니다: {path.suffix}")
+
+    return path
+
+
+def _frame(X, y):
+    df = pd.DataFrame(X, columns=FEATURE_NAMES)
+    df[TARGET_COLUMN] = y
+    return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Iris 분포 기반 합성 데이터 생성")
+    parser.add_argument(
+        "--rows",
+        type=float,
+        required=True,
+        help="생성할 행 수 (예: 1e6, 100000000)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="저장 경로 (.npy/.csv/.parquet)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"한 번에 생성해 쓰는 행 수 (기본값: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"난수 seed (기본값: {DEFAULT_SEED})",
+    )
+
+    args = parser.parse_args()
+    n_rows = int(args.rows)
+
+    print(f"  → 합성 데이터 생성: {n_rows:,}행 (청크 {args.chunk_size:,}행)")
+    start = time.perf_counter()
+    path = write_synthetic_dataset(args.output, n_rows, args.chunk_size, args.seed)
+    elapsed = time.perf_counter() - start
+    size_mb = path.stat().st_size / (1024 * 1024)
+    print(f"  ✅ 저장 완료: {path} ({size_mb:.1f}MB, {elapsed:.1f}초)")
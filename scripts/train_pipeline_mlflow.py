@@ -1,102 +1,154 @@
 import argparse
+import json
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
-import joblib
 import mlflow
 import mlflow.sklearn
-import pandas as pd
-from sklearn.model_selection import train_test_split
+from mlflow.exceptions import MlflowException
+
+from app.serialization import CODECS, DEFAULT_CODEC, dump_artifact
+from scripts.compaction import (
+    MIN_VALIDATION_ROWS,
+    VALIDATION_SIZE,
+    compact_forest,
+    format_report,
+    skipped_report,
+    split_validation,
+    validation_rows,
+    validation_sets,
+)
+from scripts.cross_validation import METRIC_NAMES, cross_validate
+from scripts.cross_validation import format_report as format_cv_report
+from scripts.distillation import (
+    FAST_MODEL_ARTIFACT_PATH,
+    FAST_MODEL_FILENAME,
+    FAST_MODEL_NAME,
+    distill_forest,
+    distillation_report,
+)
+from scripts.distillation import format_report as format_distillation_report
+from scripts.incremental import (
+    DEFAULT_NEW_TREES,
+    evaluate,
+    grow_forest,
+    load_local_model,
+    load_new_data,
+    split_holdout,
+)
+from scripts.mlflow_batch_logger import BatchedRunLogger
+from scripts.model_budget import DEFAULT_BUDGETS, benchmark_model, check_budgets
+from scripts.out_of_core import (
+    DEFAULT_MAX_TREES,
+    ChunkedDataSource,
+    confusion_in_chunks,
+    fit_forest_in_chunks,
+    head_of_split,
+    iter_split_chunks,
+    metrics_from_confusion,
+)
+from scripts.reference_stats import (
+    REFERENCE_STATS_FILENAME,
+    compute_reference_stats,
+    save_reference_stats,
+)
+from scripts.stage_graph import (
+    StageGraph,
+    add_data_stages,
+    load_dataset,
+    preprocess_dataset,
+    preprocess_features,
+    split_dataset,
+)
+from scripts.stage_profiler import StageProfiler
 
 
 class IrisMLPipelineWithMLflow:
     """MLflow 추적이 포함된 ML 파이프라인"""
 
+    # 로컬 백업 모델 파일 직렬화 옵션 (dump_artifact의 codec/level 등, 비우면 기본값)
+    # 인스턴스 간에 공유되므로 읽기 전용 - 바꿀 때는 인스턴스에 새 dict를 대입
+    artifact_options = MappingProxyType({})
+
+    # 단계별 tracemalloc peak 측정 여부 (켜면 할당이 많은 단계의 wall/CPU 시간이 부풀려지므로
+    # 시간을 비교하는 벤치마크에서는 인스턴스에 False를 대입)
+    trace_malloc = True
+
     def __init__(self):
         """MLflow 실험 설정"""
         mlflow.set_experiment("iris-classification")
+        self._tracker = None
 
-    def preprocess_data(self, X):
-        """Iris 데이터셋 전처리: 이상치 탐지 및 선택적 스케일링"""
-        # DataFrame으로 변환 (이상치 탐지용)
-        df = pd.DataFrame(
-            X,
-            columns=[
-                "sepal_length",
-                "sepal_width",
-                "petal_length",
-                "petal_width",
-            ],
-        )
+    @property
+    def tracker(self):
+        """파라미터/메트릭/태그를 모아서 한 번에 기록하는 배치 로거
 
-        # 이상치 탐지 (IQR 방법)
-        print("  → 이상치 탐지 중...")
-        Q1 = df.quantile(0.25)
-        Q3 = df.quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-
-        # 이상치가 있는 행 찾기
-        outliers = ((df < lower_bound) | (df > upper_bound)).any(axis=1)
-        outlier_count = outliers.sum()
-
-        if outlier_count > 0:
-            print(
-                f"  → 이상치 {outlier_count}개 발견 "
-                "(제거하지 않음 - Iris 데이터는 정상 범위)"
+        run_pipeline 밖에서 단계 메서드를 직접 호출하면 호출한 쪽이 연 활성 run에 연결되며,
+        기록은 `tracker.close()`를 호출할 때 전송됩니다.
+        run을 대신 열면 끝낼 곳이 없으므로, 활성 run이 없으면 RuntimeError를 냅니다.
+        """
+        if self._tracker is None:
+            run = mlflow.active_run()
+            if run is None:
+                raise RuntimeError(
+                    "활성 MLflow run이 없습니다 (mlflow.start_run() 안에서 호출하세요)"
+                )
+            self._tracker = BatchedRunLogger(
+                mlflow.tracking.MlflowClient(), run.info.run_id
             )
-        else:
-            print("  → 이상치 없음")
-
-        # Iris 데이터는 이미 정규화가 잘 되어있으므로 스케일링 생략
-        print("  → 전처리 완료 (Iris 데이터는 추가 스케일링 불필요)")
-
-        return X
-
-    def data_pipeline(self):
-        """데이터 파이프라인: 수집 → 검증 → 전처리 → 분할"""
+        return self._tracker
 
-        # 데이터 수집 (sklearn 내장 데이터셋)
-        from sklearn.datasets import load_iris
-
-        iris = load_iris()
-        X, y = iris.data, iris.target
+    @contextmanager
+    def _batched_logging(self, run):
+        """run이 끝나기 전에 백그라운드 작업과 버퍼를 모두 정리"""
+        self._tracker = BatchedRunLogger(
+            mlflow.tracking.MlflowClient(), run.info.run_id
+        )
+        try:
+            yield self._tracker
+        finally:
+            tracker, self._tracker = self._tracker, None
+            tracker.close()
 
-        print("  → 데이터 수집 (Iris dataset)")
-        print(f"  → 데이터 검증: {X.shape[0]}개 샘플, {X.shape[1]}개 특성")
-        assert X.shape[0] > 0, "데이터가 비어있습니다"
-        assert not pd.DataFrame(X).isnull().any().any(), "결측치 발견"
+    def preprocess_data(self, X, verbose=True):
+        """Iris 데이터셋 전처리: 이상치 탐지 및 선택적 스케일링"""
+        return preprocess_features(X, verbose=verbose)
 
-        # 전처리
-        print("  → 데이터 전처리")
-        X = self.preprocess_data(X)
+    def data_pipeline(self, synthetic_rows=None):
+        """데이터 파이프라인: 수집 → 검증 → 전처리 → 분할
 
-        # 데이터 분할
-        print("  → 데이터 분할 (Train: 80%, Test: 20%)")
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42
-        )
-
-        print(f"     Train: {X_train.shape[0]}개, Test: {X_test.shape[0]}개")
-        return X_train, X_test, y_train, y_test
+        synthetic_rows를 주면 Iris 대신 Iris 클래스 분포로 만든 합성 데이터를 사용합니다.
+        """
+        data = load_dataset(synthetic_rows)
+        return split_dataset(preprocess_dataset(data, self.preprocess_data))
 
     def training_pipeline_with_tracking(
         self, X_train, y_train, n_estimators=100, max_depth=5
     ):
         """MLflow 추적이 포함된 훈련 파이프라인"""
-        from sklearn.ensemble import RandomForestClassifier
+        params = self._model_params(n_estimators, max_depth)
 
-        # 하이퍼파라미터 정의
-        params = {
+        # MLflow에 파라미터 기록
+        self.tracker.log_params(params)
+
+        model = self._fit_forest(X_train, y_train, params)
+        print("  → 학습 완료! (MLflow에 파라미터 기록됨)")
+
+        return model, params
+
+    def _model_params(self, n_estimators, max_depth):
+        """하이퍼파라미터 정의"""
+        return {
             "n_estimators": n_estimators,
             "max_depth": max_depth,
             "random_state": 42,
             "n_jobs": -1,
         }
 
-        # MLflow에 파라미터 기록
-        mlflow.log_params(params)
+    def _fit_forest(self, X_train, y_train, params):
+        from sklearn.ensemble import RandomForestClassifier
 
         print("  → 모델 훈련 (RandomForestClassifier)")
         print(f"  → 하이퍼파라미터: {params}")
@@ -104,12 +156,15 @@ class IrisMLPipelineWithMLflow:
         model = RandomForestClassifier(**params)
         print("  → 학습 시작...")
         model.fit(X_train, y_train)
-        print("  → 학습 완료! (MLflow에 파라미터 기록됨)")
-
-        return model, params
+        return model
 
     def evaluate_model_with_tracking(self, model, X_test, y_test):
         """MLflow 추적이 포함된 모델 평가"""
+        return self._log_and_validate_metrics(
+            self._holdout_metrics(model, X_test, y_test)
+        )
+
+    def _holdout_metrics(self, model, X_test, y_test):
         from sklearn.metrics import (
             accuracy_score,
             f1_score,
@@ -126,37 +181,277 @@ class IrisMLPipelineWithMLflow:
             "precision": precision_score(y_test, y_pred, average="weighted"),
             "recall": recall_score(y_test, y_pred, average="weighted"),
         }
+        return metrics
+
+    def cross_validate_with_tracking(self, X, y, params, n_splits=5, max_cores=None):
+        """MLflow 추적이 포함된 k-fold 교차 검증
+
+        fold별 메트릭은 cv_<메트릭>(step=fold 번호), 평균/표준편차는 cv_<메트릭>_mean/_std로
+        기록하고, 평균 메트릭을 evaluate_model_with_tracking과 같은 형태로 반환합니다.
+        """
+        print(f"  → {n_splits}-fold 교차 검증 (RandomForestClassifier)")
+        result = cross_validate(params, X, y, n_splits=n_splits, max_cores=max_cores)
+        return self._log_cross_validation(result)
+
+    def _log_cross_validation(self, result):
+        """교차 검증 결과를 기록하고 평균 메트릭 검증"""
+        print(format_cv_report(result))
 
+        self.tracker.log_params(
+            {
+                "cv_folds": result["n_splits"],
+                "cv_workers": result["workers"],
+                "cv_n_jobs_per_worker": result["n_jobs_per_worker"],
+            }
+        )
+        for fold, fold_metrics in enumerate(result["folds"]):
+            for name, value in fold_metrics.items():
+                self.tracker.log_metric(f"cv_{name}", value, step=fold)
+        for name in result["mean"]:
+            self.tracker.log_metric(f"cv_{name}_mean", result["mean"][name])
+            self.tracker.log_metric(f"cv_{name}_std", result["std"][name])
+        self.tracker.set_tag("evaluation", "cross_validation")
+        self.cv_result = result
+
+        return self._log_and_validate_metrics(
+            {name: result["mean"][name] for name in METRIC_NAMES}
+        )
+
+    def _log_and_validate_metrics(self, metrics):
+        """메트릭을 MLflow에 기록하고 정확도 기준으로 검증 태그 설정"""
         # MLflow에 메트릭 기록
         for metric_name, value in metrics.items():
-            mlflow.log_metric(metric_name, value)
+            self.tracker.log_metric(metric_name, value)
             print(f"  → {metric_name.capitalize()}: {value:.4f}")
 
         # 모델 검증
         if metrics["accuracy"] < 0.85:
-            mlflow.set_tag("validation", "failed")
+            self.tracker.set_tag("validation", "failed")
             print("  ⚠️  경고: 정확도가 85% 미만!")
             print("  → 재훈련 또는 하이퍼파라미터 조정 필요")
         else:
-            mlflow.set_tag("validation", "passed")
+            self.tracker.set_tag("validation", "passed")
             print("  ✅ 모델 검증 통과 (정확도 >= 85%)")
 
         return metrics
 
-    def register_model_with_mlflow(self, model, params, metrics):
-        """MLflow 모델 레지스트리에 등록"""
+    def out_of_core_data_pipeline(self, data_path, chunk_size=100_000):
+        """Out-of-core 데이터 파이프라인: 디스크 데이터를 청크 단위로 읽는 소스 생성"""
+        source = ChunkedDataSource(data_path, chunk_size=chunk_size)
+
+        print(f"  → 데이터 수집 (청크 단위: {source.path})")
+        print(f"  → 청크 크기: {source.chunk_size}개 샘플")
+        print("  → 데이터 분할 (청크별 Train: 80%, Test: 20%)")
+        return source
+
+    def out_of_core_training_with_tracking(
+        self,
+        source,
+        trees_per_chunk=10,
+        max_depth=5,
+        max_trees=DEFAULT_MAX_TREES,
+        validation_size=0.0,
+    ):
+        """MLflow 추적이 포함된 out-of-core 훈련 파이프라인 (최대 max_trees개 트리)
+
+        validation_size를 주면 train 분할에서 그 비율만큼은 학습에 쓰지 않습니다 (압축 검증용).
+        """
+        params = {
+            "training_mode": "out_of_core",
+            "data_path": str(source.path),
+            "chunk_size": source.chunk_size,
+            "trees_per_chunk": trees_per_chunk,
+            "max_trees": max_trees,
+            "max_depth": max_depth,
+            "validation_size": validation_size,
+            "random_state": 42,
+            "n_jobs": -1,
+        }
+
+        print("  → 모델 훈련 (청크별 RandomForestClassifier 병합)")
+        print(f"  → 하이퍼파라미터: {params}")
+        print("  → 학습 시작...")
+
+        chunks = iter_split_chunks(
+            source,
+            "train",
+            preprocess=lambda X: self.preprocess_data(X, verbose=False),
+            validation_size=validation_size,
+        )
+        model = fit_forest_in_chunks(
+            chunks,
+            classes=range(3),
+            trees_per_chunk=trees_per_chunk,
+            max_depth=max_depth,
+            max_trees=max_trees,
+        )
+
+        # 병합 후 실제 트리 개수도 함께 기록
+        params["n_estimators"] = model.n_estimators
+        self.tracker.log_params(params)
+        print(f"  → 학습 완료! (트리 {model.n_estimators}개, MLflow에 파라미터 기록됨)")
+
+        return model, params
+
+    def out_of_core_evaluate_with_tracking(self, model, source):
+        """MLflow 추적이 포함된 out-of-core 모델 평가"""
+        chunks = iter_split_chunks(
+            source,
+            "test",
+            preprocess=lambda X: self.preprocess_data(X, verbose=False),
+        )
+        confusion = confusion_in_chunks(model, chunks, n_classes=3)
+        print(f"  → Test 샘플: {confusion.sum()}개")
+
+        return self._log_and_validate_metrics(metrics_from_confusion(confusion))
+
+    def compact_model_with_tracking(
+        self, model, X_ref, X_check, y_check, tolerance=0.0
+    ):
+        """MLflow 추적이 포함된 모델 압축 (트리 제거, 가지치기, float32 임계값)"""
+        print("  → 모델 압축 (트리 제거 + 가지치기 + float32 임계값)")
+        compacted, report = compact_forest(
+            model, X_ref, X_check, y_check, tolerance=tolerance
+        )
+        self._log_compaction(report, tolerance)
+        return compacted
+
+    def _log_compaction(self, report, tolerance):
+        self.tracker.log_param("compaction_tolerance", tolerance)
+        self.tracker.log_param("compaction_validation_size", VALIDATION_SIZE)
+        print(format_report(report))
+        if report.get("skipped"):
+            self.tracker.log_metric(
+                "compaction_validation_rows", report["validation_rows"]
+            )
+            self.tracker.set_tag("compaction", "skipped")
+            print("  ⚠️  검증 데이터 부족 - 원본 모델 유지")
+            return
+
+        self.tracker.log_param("compaction_max_proba_shift", report["max_proba_shift"])
+        self.tracker.log_metrics(
+            {
+                f"compaction_{name}": float(value)
+                for name, value in report.items()
+                if name not in ("tolerance", "max_proba_shift")
+            }
+        )
+        if report["applied"]:
+            self.tracker.set_tag("compaction", "applied")
+            print("  ✅ 압축 모델 사용 (MLflow에 compaction_* 메트릭 기록됨)")
+        else:
+            self.tracker.set_tag("compaction", "reverted")
+            print("  ⚠️  정확도/확률 변화 허용 범위 초과 - 원본 모델 유지")
+
+    def distill_model_with_tracking(
+        self, model, X_ref, X_check, y_check=None, max_depth=4
+    ):
+        """MLflow 추적이 포함된 증류 (포레스트를 흉내 내는 얕은 결정 트리, fast 티어)"""
+        print(f"  → 모델 증류 (RandomForest → 결정 트리 max_depth={max_depth})")
+        student = distill_forest(model, X_ref, max_depth=max_depth)
+        report = distillation_report(model, student, X_check, y_check)
+        self._log_distillation(report, max_depth)
+        return student, report
+
+    def _log_distillation(self, report, max_depth):
+        self.tracker.log_param("fast_max_depth", max_depth)
+        self.tracker.log_metrics(
+            {f"fast_{name}": float(value) for name, value in report.items()}
+        )
+        print(format_distillation_report(report))
+        print("  ✅ fast 티어 모델 생성 (MLflow에 fast_* 메트릭 기록됨)")
+
+    def check_serving_budget_with_tracking(self, model, X_sample, budgets=None):
+        """추론 지연시간/모델 크기를 측정해 MLflow에 기록하고 예산 검사
+
+        Returns:
+            예산 통과 여부 (False면 레지스트리에 등록하지 않음)
+        """
+        print("  → 서빙 예산 검사 (추론 지연시간, 모델 크기)")
+        report = benchmark_model(model, X_sample)
+
+        self.tracker.log_metrics(
+            {
+                f"serving_{name}": value
+                for name, value in report.items()
+                if name != "batch_size"
+            }
+        )
+        print(
+            f"     단건 p99: {report['single_row_latency_p99_ms']:.2f}ms, "
+            f"배치({report['batch_size']}) p99: "
+            f"{report['batch_latency_p99_ms']:.2f}ms"
+        )
+        print(
+            f"     크기: {report['serialized_size_mb']:.2f}MB, "
+            f"노드: {report['node_count']}개"
+        )
+
+        violations = check_budgets(report, budgets)
+        if violations:
+            self.tracker.set_tag("serving_budget", "exceeded")
+            print("  ⚠️  서빙 예산 초과! 레지스트리 등록을 건너뜁니다")
+            for violation in violations:
+                print(f"     - {violation}")
+            return False
+
+        self.tracker.set_tag("serving_budget", "passed")
+        print("  ✅ 서빙 예산 통과")
+        return True
+
+    def register_model_with_mlflow(
+        self,
+        model,
+        params,
+        metrics,
+        reference_stats=None,
+        fast_model=None,
+        fast_report=None,
+        parent_info=None,
+    ):
+        """MLflow 모델 레지스트리에 등록
+
+        모델 업로드와 로컬 백업 저장은 백그라운드에서 동시에 실행되며,
+        `tracker.wait()`/`tracker.close()`에서 완료됩니다.
+        reference_stats(드리프트 감시용 기준 통계)는 run 아티팩트와 로컬 파일로 함께 저장합니다.
+        fast_model(증류 모델)은 같은 run의 fast_model 아티팩트로 올려
+        iris-classifier-fast로 등록하므로, run ID로 원본 모델과 짝을 찾을 수 있습니다.
+        parent_info(증분 재학습의 원본 모델 version/run_id)는 parent_version/parent_run_id
+        태그와 로컬 백업에 함께 기록합니다.
+        """
 
         model_name = "iris-classifier"
+        tracker = self.tracker
+        run_id = tracker.run_id
+
+        def upload_model():
+            # 백그라운드 스레드에는 활성 run이 없으므로 run_id를 직접 지정해 기록
+            # (start_run(run_id=...) 컨텍스트는 빠져나올 때 메인 스레드의 run을 종료시킴)
+            mlflow.models.Model.log(
+                artifact_path="model",
+                flavor=mlflow.sklearn,
+                sk_model=model,
+                registered_model_name=model_name,
+                run_id=run_id,
+            )
+            if reference_stats is not None:
+                tracker.client.log_dict(
+                    run_id, reference_stats, REFERENCE_STATS_FILENAME
+                )
+            if fast_model is not None:
+                mlflow.models.Model.log(
+                    artifact_path=FAST_MODEL_ARTIFACT_PATH,
+                    flavor=mlflow.sklearn,
+                    sk_model=fast_model,
+                    registered_model_name=FAST_MODEL_NAME,
+                    run_id=run_id,
+                )
 
         # 모델 저장 및 등록
-        mlflow.sklearn.log_model(
-            sk_model=model,
-            artifact_path="model",
-            registered_model_name=model_name,
-        )
+        tracker.submit(upload_model)
 
         # 추가 메타데이터
-        mlflow.set_tags(
+        self.tracker.set_tags(
             {
                 "framework": "scikit-learn",
                 "algorithm": "RandomForest",
@@ -165,8 +460,24 @@ class IrisMLPipelineWithMLflow:
                 "target_classes": 3,
             }
         )
+        if parent_info is not None:
+            self.tracker.set_tags(
+                {
+                    "parent_version": parent_info["version"],
+                    "parent_run_id": parent_info.get("run_id") or "",
+                }
+            )
+        if fast_model is not None:
+            self.tracker.set_tags(
+                {
+                    "fast_model": FAST_MODEL_NAME,
+                    "fast_model_artifact": FAST_MODEL_ARTIFACT_PATH,
+                }
+            )
 
         print(f"  → 모델 '{model_name}'로 MLflow 레지스트리에 등록")
+        if fast_model is not None:
+            print(f"  → fast 티어 모델 '{FAST_MODEL_NAME}'로 함께 등록 (같은 run)")
         print("  → 실험 추적 URL: http://localhost:5000")
 
         # 로컬 파일도 백업 저장 (기존 호환성)
@@ -175,7 +486,7 @@ class IrisMLPipelineWithMLflow:
             "version": datetime.now().strftime("v%Y%m%d-%H%M%S"),
             "metrics": metrics,
             "params": params,
-            "mlflow_run_id": mlflow.active_run().info.run_id,
+            "mlflow_run_id": run_id,
             "feature_names": [
                 "sepal_length",
                 "sepal_width",
@@ -186,49 +497,470 @@ class IrisMLPipelineWithMLflow:
             "target_names": ["setosa", "versicolor", "virginica"],
             "framework": "scikit-learn",
         }
+        if parent_info is not None:
+            model_artifact["parent_version"] = parent_info["version"]
+            model_artifact["parent_run_id"] = parent_info.get("run_id")
 
         model_dir = Path("models")
         model_dir.mkdir(exist_ok=True)
-        joblib.dump(model_artifact, model_dir / "model.pkl")
+        self.tracker.submit(
+            dump_artifact,
+            model_artifact,
+            model_dir / "model.pkl",
+            **self.artifact_options,
+        )
 
         print("  → 로컬 백업: models/model.pkl")
 
-    def run_pipeline(self, n_estimators=100, max_depth=5, run_name=None):
-        """MLflow 추적이 포함된 파이프라인 실행"""
-        with mlflow.start_run(run_name=run_name):
+        if reference_stats is not None:
+            self.tracker.submit(
+                save_reference_stats,
+                reference_stats,
+                model_dir / REFERENCE_STATS_FILENAME,
+            )
+            print(f"  → 기준 통계: models/{REFERENCE_STATS_FILENAME}")
+
+        if fast_model is not None:
+            # 원본 모델의 version으로 짝을 확인 (다른 학습의 fast 모델과 섞이지 않도록)
+            fast_artifact = {
+                "model": fast_model,
+                "teacher_version": model_artifact["version"],
+                "metrics": fast_report or {},
+            }
+            self.tracker.submit(
+                dump_artifact,
+                fast_artifact,
+                model_dir / FAST_MODEL_FILENAME,
+                **self.artifact_options,
+            )
+            print(f"  → fast 티어 백업: models/{FAST_MODEL_FILENAME}")
+
+    def training_graph(
+        self,
+        params,
+        synthetic_rows=None,
+        compact=True,
+        compaction_tolerance=0.0,
+        distill=True,
+        distill_max_depth=4,
+        cv_folds=None,
+        cv_max_cores=None,
+        budgets=None,
+        stage_cache=None,
+    ):
+        """in-memory 파이프라인의 단계 그래프
+
+        data → preprocess → split → (train, reference_stats) → (distill, evaluate) → package.
+        단계 함수는 MLflow에 기록하지 않고 결과만 반환하므로, 캐시에서 불러온 단계의 결과도
+        run_pipeline이 같은 방식으로 기록합니다. package(서빙 예산 검사 + 등록)는 캐시하지 않습니다.
+        """
+        graph = add_data_stages(
+            StageGraph(cache_dir=stage_cache), synthetic_rows, self.preprocess_data
+        )
+        graph.add(
+            "train",
+            self._train_stage,
+            inputs=("split",),
+            params={
+                "params": params,
+                "compact": compact,
+                "compaction_tolerance": compaction_tolerance,
+            },
+        )
+        graph.add(
+            "evaluate",
+            self._evaluate_stage,
+            inputs=("preprocess", "split", "train"),
+            params={
+                "params": params,
+                "cv_folds": cv_folds,
+                "cv_max_cores": cv_max_cores,
+            },
+        )
+        package_inputs = ("split", "train", "evaluate", "reference_stats")
+        if distill:
+            graph.add(
+                "distill",
+                self._distill_stage,
+                inputs=("split", "train"),
+                params={"max_depth": distill_max_depth},
+            )
+            package_inputs += ("distill",)
+        graph.add(
+            "package",
+            self._package_stage,
+            inputs=package_inputs,
+            params={"params": params, "budgets": budgets},
+            cache=False,
+        )
+        return graph
+
+    def _train_stage(self, split, params, compact, compaction_tolerance):
+        """학습(+압축) 단계: (모델, 압축 결과 또는 None)"""
+        X_train, _, y_train, _ = split
+        if not compact:
+            return self._fit_forest(X_train, y_train, params), None
+        n_validation = validation_rows(len(y_train))
+        if n_validation < MIN_VALIDATION_ROWS:
+            # 검증 데이터가 너무 적으면 압축 판단을 믿을 수 없으므로 떼어 내지 않고 전체로 학습
+            model = self._fit_forest(X_train, y_train, params)
+            return model, skipped_report(n_validation, compaction_tolerance)
+        # 압축 여부는 test가 아닌, 학습에서 떼어 낸 검증 데이터로 판단
+        X_fit, X_val, y_fit, y_val = split_validation(X_train, y_train)
+        model = self._fit_forest(X_fit, y_fit, params)
+        print("  → 모델 압축 (트리 제거 + 가지치기 + float32 임계값)")
+        return compact_forest(
+            model, *validation_sets(X_val, y_val), tolerance=compaction_tolerance
+        )
+
+    def _distill_stage(self, split, train, max_depth):
+        """증류 단계: (fast 티어 모델, 증류 결과)"""
+        X_train, X_test, _, y_test = split
+        print(f"  → 모델 증류 (RandomForest → 결정 트리 max_depth={max_depth})")
+        student = distill_forest(train[0], X_train, max_depth=max_depth)
+        return student, distillation_report(train[0], student, X_test, y_test)
+
+    def _evaluate_stage(self, data, split, train, params, cv_folds, cv_max_cores):
+        """평가 단계: (메트릭, 교차 검증 결과 또는 None)
+
+        cv_folds를 주면 전처리된 전체 데이터의 k-fold 교차 검증 평균을 메트릭으로 씁니다.
+        """
+        if cv_folds:
+            print(f"  → {cv_folds}-fold 교차 검증 (RandomForestClassifier)")
+            result = cross_validate(
+                params, *data, n_splits=cv_folds, max_cores=cv_max_cores
+            )
+            return {name: result["mean"][name] for name in METRIC_NAMES}, result
+        _, X_test, _, y_test = split
+        return self._holdout_metrics(train[0], X_test, y_test), None
+
+    def _package_stage(
+        self, split, train, evaluate, reference_stats, distill=None, **options
+    ):
+        """서빙 예산 검사 후 등록 (예산을 넘으면 등록하지 않음)"""
+        model = train[0]
+        fast_model, fast_report = distill or (None, None)
+        if not self.check_serving_budget_with_tracking(
+            model, split[1], options["budgets"]
+        ):
+            return False
+        self.register_model_with_mlflow(
+            model,
+            options["params"],
+            evaluate[0],
+            reference_stats,
+            fast_model=fast_model,
+            fast_report=fast_report,
+        )
+        # 업로드 시간도 이 단계 비용에 포함
+        self.tracker.wait()
+        return True
+
+    def run_pipeline(
+        self,
+        n_estimators=100,
+        max_depth=5,
+        run_name=None,
+        data_path=None,
+        chunk_size=100_000,
+        profile_output=None,
+        budgets=None,
+        compact=True,
+        compaction_tolerance=0.0,
+        distill=True,
+        distill_max_depth=4,
+        synthetic_rows=None,
+        cv_folds=None,
+        cv_max_cores=None,
+        stage_cache=None,
+    ):
+        """MLflow 추적이 포함된 파이프라인 실행
+
+        data_path를 주면 out-of-core 모드로 실행되며, 이때 n_estimators는
+        청크당 트리 개수로 사용됩니다. 단계별 비용은 MLflow 메트릭
+        (stage_<단계>_<항목>)으로 기록되고, profile_output을 주면 JSON으로도 저장됩니다.
+        budgets로 서빙 예산(model_budget.DEFAULT_BUDGETS 항목)을 덮어쓸 수 있으며,
+        예산을 넘는 모델은 레지스트리에 등록되지 않습니다.
+        compact가 True면 학습 데이터에서 검증 데이터를 떼어 내 학습 직후 모델을 압축하며,
+        검증 데이터 정확도가 compaction_tolerance보다 많이 떨어지거나 확률이 크게 바뀌면
+        원본 모델을 유지합니다 (검증 데이터가 MIN_VALIDATION_ROWS보다 적으면 압축하지 않음).
+        distill이 True면 포레스트를 흉내 내는 깊이 distill_max_depth의 결정 트리를
+        만들어 fast 티어(iris-classifier-fast)로 함께 등록합니다.
+        synthetic_rows를 주면 Iris 대신 그 크기의 합성 데이터로 학습합니다
+        (메모리에 올리기 어려운 크기는 scripts.synthetic_data로 파일을 만들어 data_path로 사용).
+        cv_folds를 주면 80/20 분할 대신 전체 데이터의 cv_folds-fold 교차 검증 평균으로
+        평가하고 fold별 메트릭도 기록합니다 (fold는 cv_max_cores 코어 안에서 병렬 학습,
+        in-memory 모드만 지원).
+        in-memory 모드는 `training_graph`의 단계 그래프로 실행되며, stage_cache 디렉토리를 주면
+        입력과 파라미터가 같은 단계는 저장된 출력을 재사용합니다 (평가 설정만 바꾸면 학습 생략).
+        """
+        if cv_folds and data_path:
+            raise ValueError("교차 검증은 in-memory 모드에서만 지원합니다")
+
+        profiler = StageProfiler(trace_malloc=self.trace_malloc)
+        self.stage_profile = profiler
+        graph = None
+        if not data_path:
+            params = self._model_params(n_estimators, max_depth)
+            graph = self.training_graph(
+                params,
+                synthetic_rows=synthetic_rows,
+                compact=compact,
+                compaction_tolerance=compaction_tolerance,
+                distill=distill,
+                distill_max_depth=distill_max_depth,
+                cv_folds=cv_folds,
+                cv_max_cores=cv_max_cores,
+                budgets=budgets,
+                stage_cache=stage_cache,
+            )
+        self.stage_graph = graph
+
+        with mlflow.start_run(run_name=run_name) as run, self._batched_logging(run):
             print("=" * 60)
             print("MLflow 추적이 포함된 ML Pipeline 시작")
             if run_name:
                 print(f"Run Name: {run_name}")
+            if data_path:
+                print(f"Out-of-core 모드: {data_path}")
             print("=" * 60)
 
             # 1. Data Pipeline (동일)
-            print("\n[1/4] 📊 Data Pipeline")
-            X_train, X_test, y_train, y_test = self.data_pipeline()
+            with profiler.stage("data"):
+                if data_path:
+                    print("\n[1/4] 📊 Data Pipeline (out-of-core)")
+                    source = self.out_of_core_data_pipeline(data_path, chunk_size)
+                    # 압축 검증/서빙 예산 검사 기준으로 쓸 표본 (앞쪽 청크에서 추출)
+                    # 압축하면 train 분할 일부를 검증용으로 떼어 냄
+                    validation_size = VALIDATION_SIZE if compact else 0.0
+                    X_ref, _ = head_of_split(
+                        source, "train", validation_size=validation_size
+                    )
+                    X_check, y_check = head_of_split(source, "test")
+                    if compact:
+                        X_val, y_val = head_of_split(
+                            source, "validation", validation_size=validation_size
+                        )
+                else:
+                    print("\n[1/4] 📊 Data Pipeline")
+                    graph.run(["split"])
+                    if synthetic_rows:
+                        self.tracker.log_param("synthetic_rows", synthetic_rows)
 
             # 2. Training Pipeline (MLflow 추적 추가)
-            print("\n[2/4] 🤖 Training Pipeline with MLflow")
-            model, params = self.training_pipeline_with_tracking(
-                X_train,
-                y_train,
-                n_estimators=n_estimators,
-                max_depth=max_depth,
-            )
+            with profiler.stage("training"):
+                if data_path:
+                    print("\n[2/4] 🤖 Training Pipeline with MLflow (out-of-core)")
+                    model, params = self.out_of_core_training_with_tracking(
+                        source,
+                        trees_per_chunk=n_estimators,
+                        max_depth=max_depth,
+                        validation_size=validation_size,
+                    )
+                    if compact:
+                        model = self.compact_model_with_tracking(
+                            model,
+                            *validation_sets(X_val, y_val),
+                            tolerance=compaction_tolerance,
+                        )
+
+                    fast_model, fast_report = None, None
+                    if distill:
+                        fast_model, fast_report = self.distill_model_with_tracking(
+                            model, X_ref, X_check, y_check, max_depth=distill_max_depth
+                        )
+                else:
+                    print("\n[2/4] 🤖 Training Pipeline with MLflow")
+                    # 기준 통계는 학습과 동시에, 증류는 학습 직후 계산
+                    targets = ["train", "reference_stats"] + (
+                        ["distill"] if distill else []
+                    )
+                    outputs = graph.run(targets)
+                    self.tracker.log_params(params)
+                    model, compaction = outputs["train"]
+                    if compaction is not None:
+                        self._log_compaction(compaction, compaction_tolerance)
+                    if distill:
+                        self._log_distillation(outputs["distill"][1], distill_max_depth)
 
             # 3. Evaluation (메트릭 자동 기록)
-            print("\n[3/4] 📈 Model Evaluation with MLflow")
-            metrics = self.evaluate_model_with_tracking(model, X_test, y_test)
+            with profiler.stage("evaluation"):
+                if data_path:
+                    print("\n[3/4] 📈 Model Evaluation with MLflow (out-of-core)")
+                    metrics = self.out_of_core_evaluate_with_tracking(model, source)
+                else:
+                    print("\n[3/4] 📈 Model Evaluation with MLflow")
+                    metrics, cv_result = graph.run(["evaluate"])["evaluate"]
+                    if cv_result is not None:
+                        metrics = self._log_cross_validation(cv_result)
+                    else:
+                        metrics = self._log_and_validate_metrics(metrics)
+
+            # 4. Model Registry (서빙 예산 검사 후 자동 버전 관리)
+            with profiler.stage("registry"):
+                print("\n[4/4] 🏪 MLflow Model Registry")
+                if graph is not None:
+                    graph.run(["package"])
+                elif self.check_serving_budget_with_tracking(model, X_check, budgets):
+                    self.register_model_with_mlflow(
+                        model,
+                        params,
+                        metrics,
+                        compute_reference_stats(X_ref),
+                        fast_model=fast_model,
+                        fast_report=fast_report,
+                    )
+                    # 업로드 시간도 이 단계 비용에 포함
+                    self.tracker.wait()
 
-            # 4. Model Registry (자동 버전 관리)
-            print("\n[4/4] 🏪 MLflow Model Registry")
-            self.register_model_with_mlflow(model, params, metrics)
+            # 단계별 비용 기록
+            self.tracker.log_metrics(profiler.as_metrics())
+            print("\n⏱️  단계별 비용 (MLflow 메트릭 stage_* 로 기록됨)")
+            print(profiler.summary_table())
+            if graph is not None and stage_cache:
+                cached = graph.cached_stages()
+                self.tracker.set_tag("stage_cache_hits", ",".join(cached) or "none")
+                print(f"  → 캐시에서 불러온 단계: {cached or '없음'}")
 
             run_id = mlflow.active_run().info.run_id
+            if profile_output:
+                profiler.write_json(
+                    profile_output,
+                    pipeline=type(self).__name__,
+                    run_id=run_id,
+                )
+                print(f"  → 측정 결과 저장: {profile_output}")
+
             print(f"\n✅ Pipeline 완료! MLflow Run ID: {run_id}")
             print("=" * 60)
 
             return model, metrics
 
+    def load_current_model(self, source="mlflow"):
+        """증분 재학습의 원본 모델 (MLflow 최신 버전 또는 로컬 models/model.pkl)
+
+        Returns:
+            (모델, {"version", "run_id", "source"})
+        """
+        if source == "mlflow":
+            client = mlflow.tracking.MlflowClient()
+            versions = client.search_model_versions("name='iris-classifier'")
+            if versions:
+                latest = max(versions, key=lambda v: int(v.version))
+                model = mlflow.sklearn.load_model(
+                    f"models:/iris-classifier/{latest.version}"
+                )
+                return model, {
+                    "version": f"mlflow-v{latest.version}",
+                    "run_id": latest.run_id,
+                    "source": "mlflow",
+                }
+            print("  ⚠️  MLflow에 등록된 모델이 없어 로컬 모델 사용")
+        return load_local_model()
+
+    def _parent_reference_stats(self, parent_info):
+        """원본 모델의 드리프트 기준 통계 (run 아티팩트 → 로컬 파일 순, 없으면 None)"""
+        if parent_info.get("run_id"):
+            try:
+                return mlflow.artifacts.load_dict(
+                    f"runs:/{parent_info['run_id']}/{REFERENCE_STATS_FILENAME}"
+                )
+            except (MlflowException, OSError, ValueError) as e:
+                # 아티팩트가 없거나 내려받지 못했거나 JSON이 깨진 경우 로컬 파일로 대체
+                print(f"  ⚠️  원본 run의 기준 통계 로드 실패: {e}")
+        stats_path = Path("models") / REFERENCE_STATS_FILENAME
+        if stats_path.exists():
+            return json.loads(stats_path.read_text())
+        return None
+
+    def run_incremental_pipeline(
+        self,
+        data_path=None,
+        synthetic_rows=None,
+        n_new_trees=DEFAULT_NEW_TREES,
+        retire_oldest=0,
+        source="mlflow",
+        run_name=None,
+        chunk_size=100_000,
+        budgets=None,
+    ):
+        """증분 재학습: 현재 모델에 새 데이터로 트리를 추가해 새 버전으로 등록
+
+        source("mlflow" 또는 "local")에서 원본 모델을 불러와 새 데이터(data_path 파일 또는
+        synthetic_rows 합성 데이터)의 80%로 트리 n_new_trees개를 warm start로 추가하고,
+        retire_oldest개의 가장 오래된 트리를 제거합니다. 나머지 20% held-out 세트로 원본과
+        갱신 모델을 함께 평가하며(원본은 parent_* 메트릭), 새 버전에는 원본의
+        parent_version/parent_run_id 태그와 드리프트 기준 통계를 이어서 기록합니다.
+        """
+        profiler = StageProfiler(trace_malloc=self.trace_malloc)
+        self.stage_profile = profiler
+
+        with mlflow.start_run(run_name=run_name) as run, self._batched_logging(run):
+            print("=" * 60)
+            print("MLflow 추적이 포함된 증분 재학습 Pipeline 시작")
+            print("=" * 60)
+
+            with profiler.stage("data"):
+                print("\n[1/4] 📊 현재 모델과 새 데이터 로드")
+                parent, parent_info = self.load_current_model(source)
+                print(
+                    f"  → 원본 모델: {parent_info['version']} "
+                    f"(트리 {len(parent.estimators_)}개, {parent_info['source']})"
+                )
+                X, y = load_new_data(data_path, synthetic_rows, chunk_size)
+                X = self.preprocess_data(X, verbose=False)
+                X_train, X_test, y_train, y_test = split_holdout(X, y)
+                print(f"  → 새 데이터: 학습 {len(y_train)}개, held-out {len(y_test)}개")
+
+            with profiler.stage("training"):
+                print(f"\n[2/4] 🤖 트리 {n_new_trees}개 추가 (warm start)")
+                model = grow_forest(
+                    parent, X_train, y_train, n_new_trees, retire_oldest
+                )
+                params = {
+                    "n_estimators": len(model.estimators_),
+                    "max_depth": model.max_depth,
+                    "training_mode": "incremental",
+                    "new_trees": n_new_trees,
+                    "retired_trees": retire_oldest,
+                    "new_rows": len(y_train),
+                }
+                self.tracker.log_params(params)
+                print(f"  → 트리 {len(model.estimators_)}개")
+
+            with profiler.stage("evaluation"):
+                print("\n[3/4] 📈 held-out 평가 (원본 대비)")
+                parent_metrics = evaluate(parent, X_test, y_test)
+                self.tracker.log_metrics(
+                    {f"parent_{name}": v for name, v in parent_metrics.items()}
+                )
+                print(f"  → 원본 Accuracy: {parent_metrics['accuracy']:.4f}")
+                metrics = self._log_and_validate_metrics(
+                    evaluate(model, X_test, y_test)
+                )
+
+            with profiler.stage("registry"):
+                print("\n[4/4] 🏪 MLflow Model Registry")
+                if self.check_serving_budget_with_tracking(model, X_test, budgets):
+                    self.register_model_with_mlflow(
+                        model,
+                        params,
+                        metrics,
+                        self._parent_reference_stats(parent_info),
+                        parent_info=parent_info,
+                    )
+                    self.tracker.wait()
+
+            self.tracker.log_metrics(profiler.as_metrics())
+            print("\n⏱️  단계별 비용 (MLflow 메트릭 stage_* 로 기록됨)")
+            print(profiler.summary_table())
+
+            run_id = mlflow.active_run().info.run_id
+            print(f"\n✅ 증분 재학습 완료! MLflow Run ID: {run_id}")
+            print("=" * 60)
+
+            return model, metrics
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -257,12 +989,157 @@ if __name__ == "__main__":
         action="store_true",
         help="여러 하이퍼파라미터 조합으로 자동 실행",
     )
+    parser.add_argument(
+        "--data-path",
+        type=str,
+        default=None,
+        help="청크 단위로 읽을 데이터 파일 (.csv/.parquet/.npy, 기본값: Iris 내장)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=100_000,
+        help="out-of-core 모드의 청크 크기 (기본값: 100000)",
+    )
+    parser.add_argument(
+        "--max-single-latency-ms",
+        type=float,
+        default=DEFAULT_BUDGETS["max_single_row_p99_ms"],
+        help="등록 허용 단건 추론 p99 지연시간 (ms)",
+    )
+    parser.add_argument(
+        "--max-batch-latency-ms",
+        type=float,
+        default=DEFAULT_BUDGETS["max_batch_p99_ms"],
+        help="등록 허용 배치(1000건) 추론 p99 지연시간 (ms)",
+    )
+    parser.add_argument(
+        "--max-model-size-mb",
+        type=float,
+        default=DEFAULT_BUDGETS["max_serialized_size_mb"],
+        help="등록 허용 직렬화 모델 크기 (MB)",
+    )
+    parser.add_argument(
+        "--max-node-count",
+        type=int,
+        default=DEFAULT_BUDGETS["max_node_count"],
+        help="등록 허용 전체 트리 노드 수 (기본값: 제한 없음)",
+    )
+    parser.add_argument(
+        "--no-compact",
+        action="store_true",
+        help="학습 후 모델 압축 단계를 건너뜀",
+    )
+    parser.add_argument(
+        "--compaction-tolerance",
+        type=float,
+        default=0.0,
+        help="압축 시 허용하는 검증 데이터 정확도 감소폭 (기본값: 0.0)",
+    )
+    parser.add_argument(
+        "--no-distill",
+        action="store_true",
+        help="fast 티어(증류 결정 트리) 생성을 건너뜀",
+    )
+    parser.add_argument(
+        "--distill-max-depth",
+        type=int,
+        default=4,
+        help="fast 티어 결정 트리의 max_depth (기본값: 4)",
+    )
+    parser.add_argument(
+        "--synthetic-rows",
+        type=float,
+        default=None,
+        help="Iris 대신 사용할 합성 데이터 행 수 (예: 1e6, 메모리에 생성)",
+    )
+    parser.add_argument(
+        "--cv-folds",
+        type=int,
+        default=None,
+        help="80/20 분할 대신 k-fold 교차 검증으로 평가 (예: 5)",
+    )
+    parser.add_argument(
+        "--cv-max-cores",
+        type=int,
+        default=None,
+        help="교차 검증 fold들이 함께 쓰는 전체 코어 수 (기본값: 모든 코어)",
+    )
+    parser.add_argument(
+        "--stage-cache",
+        type=str,
+        default=None,
+        help="단계 출력을 저장해 재사용할 디렉토리 (예: .cache/stages)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="현재 모델에 --data-path/--synthetic-rows 새 데이터로 트리를 추가 (증분 재학습)",
+    )
+    parser.add_argument(
+        "--base-model",
+        choices=["mlflow", "local"],
+        default="mlflow",
+        help="증분 재학습의 원본 모델 (MLflow 최신 버전 또는 models/model.pkl)",
+    )
+    parser.add_argument(
+        "--new-trees",
+        type=int,
+        default=DEFAULT_NEW_TREES,
+        help=f"증분 재학습에서 추가할 트리 수 (기본값: {DEFAULT_NEW_TREES})",
+    )
+    parser.add_argument(
+        "--retire-oldest",
+        type=int,
+        default=0,
+        help="증분 재학습 후 제거할 가장 오래된 트리 수 (기본값: 0)",
+    )
+    parser.add_argument(
+        "--artifact-codec",
+        choices=sorted(CODECS),
+        default=DEFAULT_CODEC,
+        help=f"모델 파일 압축 코덱 (기본값: {DEFAULT_CODEC}, lz4/zstd는 패키지 필요)",
+    )
+    parser.add_argument(
+        "--artifact-level",
+        type=int,
+        default=None,
+        help="모델 파일 압축 레벨 (기본값: 코덱 기본값)",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        default=None,
+        help="단계별 비용 측정 결과를 저장할 JSON 경로 (CI 회귀 추적용)",
+    )
 
     args = parser.parse_args()
+    synthetic_rows = int(args.synthetic_rows) if args.synthetic_rows else None
+    budgets = {
+        "max_single_row_p99_ms": args.max_single_latency_ms,
+        "max_batch_p99_ms": args.max_batch_latency_ms,
+        "max_serialized_size_mb": args.max_model_size_mb,
+        "max_node_count": args.max_node_count,
+    }
 
     pipeline = IrisMLPipelineWithMLflow()
+    pipeline.artifact_options = {
+        "codec": args.artifact_codec,
+        "level": args.artifact_level,
+    }
 
-    if args.run_all:
+    if args.incremental:
+        pipeline.run_incremental_pipeline(
+            data_path=args.data_path,
+            synthetic_rows=synthetic_rows,
+            n_new_trees=args.new_trees,
+            retire_oldest=args.retire_oldest,
+            source=args.base_model,
+            run_name=args.run_name,
+            chunk_size=args.chunk_size,
+            budgets=budgets,
+        )
+    elif args.run_all:
         # 여러 하이퍼파라미터 조합으로 자동 실행
         param_combinations = [
             {"n_estimators": 100, "max_depth": 5, "run_name": "run_001"},
@@ -282,6 +1159,17 @@ if __name__ == "__main__":
                 n_estimators=params["n_estimators"],
                 max_depth=params["max_depth"],
                 run_name=params["run_name"],
+                data_path=args.data_path,
+                chunk_size=args.chunk_size,
+                budgets=budgets,
+                compact=not args.no_compact,
+                compaction_tolerance=args.compaction_tolerance,
+                distill=not args.no_distill,
+                distill_max_depth=args.distill_max_depth,
+                synthetic_rows=synthetic_rows,
+                cv_folds=args.cv_folds,
+                cv_max_cores=args.cv_max_cores,
+                stage_cache=args.stage_cache,
             )
 
         print("\n" + "=" * 60)
@@ -294,4 +1182,16 @@ if __name__ == "__main__":
             n_estimators=args.n_estimators,
             max_depth=args.max_depth,
             run_name=args.run_name,
+            data_path=args.data_path,
+            chunk_size=args.chunk_size,
+            profile_output=args.profile_output,
+            budgets=budgets,
+            compact=not args.no_compact,
+            compaction_tolerance=args.compaction_tolerance,
+            distill=not args.no_distill,
+            distill_max_depth=args.distill_max_depth,
+            synthetic_rows=synthetic_rows,
+            cv_folds=args.cv_folds,
+            cv_max_cores=args.cv_max_cores,
+            stage_cache=args.stage_cache,
         )
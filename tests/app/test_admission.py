@@ -0,0 +1,122 @@
+"""admission.py에 대한 테스트"""
+
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from app.admission import BoundedExecutor, Rejected
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_runs_in_dedicated_thread_with_context():
+    """전용 스레드에서 실행되고 contextvars가 전달되는지 확인"""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1, deadline_s=5)
+
+    def job():
+        return threading.current_thread().name, request_id.get()
+
+    async def main():
+        request_id.set("req-1")
+        return await executor.run(job)
+
+    thread_name, value = run(main())
+    assert thread_name.startswith("test")
+    assert value == "req-1"
+    assert executor.stats()["completed"] == 1
+    executor.shutdown()
+
+
+def test_rejects_when_queue_full():
+    """동시 실행 + 대기열 한도를 넘으면 429로 거절"""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1, deadline_s=5)
+    release = threading.Event()
+
+    async def main():
+        running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(Rejected) as exc_info:
+            await executor.run(release.wait)
+        release.set()
+        await asyncio.gather(*running)
+        return exc_info.value
+
+    rejected = run(main())
+    assert rejected.status_code == 429
+    assert rejected.retry_after >= 1
+    stats = executor.stats()
+    assert stats["rejected_queue_full"] == 1
+    assert stats["in_flight"] == 0
+    executor.shutdown()
+
+
+def test_rejects_after_deadline_without_running_queued_work():
+    """deadline을 넘긴 대기 요청은 503으로 거절하고 실행하지 않음 (실행 중인 요청은 끝까지)"""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=4, deadline_s=0.1)
+    release = threading.Event()
+    ran = []
+
+    async def main():
+        blocker = asyncio.ensure_future(executor.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        with pytest.raises(Rejected) as exc_info:
+            await executor.run(ran.append, 1)
+        release.set()
+        assert await blocker is True
+        return exc_info.value
+
+    rejected = run(main())
+    assert rejected.status_code == 503
+    assert ran == []
+    stats = executor.stats()
+    assert stats["rejected_deadline"] == 1
+    assert stats["completed"] == 1
+    executor.shutdown()
+
+
+def test_drops_expired_work_when_worker_picks_it_up():
+    """기다리는 쪽이 사라져도 deadline을 넘겨 꺼낸 작업은 실행하지 않음"""
+    executor = BoundedExecutor("test", max_workers=1, max_queue=4, deadline_s=0.05)
+    ran = []
+
+    async def main():
+        blocker = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+        await asyncio.sleep(0.01)
+        queued = asyncio.ensure_future(executor.run(ran.append, 1))
+        await asyncio.sleep(0.01)
+        # 클라이언트 연결이 끊겨 응답을 기다리는 작업이 취소된 경우
+        queued.cancel()
+        await blocker
+        while executor.stats()["in_flight"]:
+            await asyncio.sleep(0.01)
+
+    run(main())
+    assert ran == []
+    stats = executor.stats()
+    assert stats["rejected_deadline"] == 1
+    assert stats["completed"] == 1
+    executor.shutdown()
+
+
+def test_from_env(monkeypatch):
+    """환경변수로 한도를 설정"""
+    monkeypatch.setenv("TESTPOOL_MAX_CONCURRENCY", "3")
+    monkeypatch.setenv("TESTPOOL_MAX_QUEUE", "7")
+    monkeypatch.setenv("TESTPOOL_DEADLINE_MS", "2.5")
+
+    executor = BoundedExecutor.from_env(
+        "TESTPOOL", max_workers=1, max_queue=1, deadline_ms=1000
+    )
+
+    stats = executor.stats()
+    assert stats["max_concurrency"] == 3
+    assert stats["max_queue"] == 7
+    assert stats["deadline_ms"] == 2.5
+    executor.shutdown()
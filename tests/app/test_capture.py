@@ -0,0 +1,122 @@
+"""capture.py에 대한 테스트"""
+
+import threading
+
+from app.capture import CaptureSink, capture_files, iter_captured
+
+
+def make_record(i):
+    return {"request": {"features": [float(i), 0.0, 0.0, 0.0]}, "latency_ms": 1.0}
+
+
+def test_writes_records_in_order(tmp_path):
+    """큐에 넣은 기록을 순서대로 JSONL로 기록"""
+    sink = CaptureSink(tmp_path, batch_size=3, flush_interval_s=0.01)
+    sink.start()
+    for i in range(10):
+        sink.record(make_record(i))
+    sink.close()
+
+    records = list(iter_captured(tmp_path))
+    assert [r["request"]["features"][0] for r in records] == list(range(10))
+    assert sink.stats()["written"] == 10
+    assert sink.stats()["dropped"] == 0
+
+
+def test_write_errors_are_counted_and_writer_keeps_running(tmp_path):
+    """쓰기에 실패한 배치는 세고 버리며, 기록 스레드는 이후 기록을 계속 씀"""
+    sink = CaptureSink(tmp_path, batch_size=1, flush_interval_s=0.01)
+    sink.start()
+    sink.record({"request": object()})  # JSON으로 직렬화할 수 없는 값
+    for i in range(3):
+        sink.record(make_record(i))
+    sink.close()
+
+    records = list(iter_captured(tmp_path))
+    assert [r["request"]["features"][0] for r in records] == [0.0, 1.0, 2.0]
+    stats = sink.stats()
+    assert stats["written"] == 3
+    assert stats["write_errors"] == 1
+    assert stats["last_error"].startswith("TypeError")
+
+
+class FullDiskFile:
+    """쓰기마다 OSError를 내는 파일"""
+
+    closed = False
+
+    def write(self, data):
+        raise OSError("disk full")
+
+    def close(self):
+        self.closed = True
+
+
+def test_io_error_moves_to_new_file(tmp_path, monkeypatch):
+    """파일 쓰기 오류 뒤에는 그 파일을 닫고 새 파일을 열어 계속 기록"""
+    sink = CaptureSink(tmp_path, batch_size=1, flush_interval_s=0.01)
+    full_disk = FullDiskFile()
+    rotate = sink._rotate
+
+    def rotate_to_full_disk_once():
+        rotate()
+        if not full_disk.closed:
+            sink._file.close()
+            sink._file = full_disk
+
+    monkeypatch.setattr(sink, "_rotate", rotate_to_full_disk_once)
+    sink.start()
+    for i in range(2):
+        sink.record(make_record(i))
+    sink.close()
+
+    assert full_disk.closed
+    assert [r["request"]["features"][0] for r in iter_captured(tmp_path)] == [1.0]
+    assert sink.stats()["write_errors"] == 1
+    assert sink.stats()["last_error"] == "OSError: disk full"
+
+
+def test_rotates_and_keeps_max_files(tmp_path):
+    """크기 상한마다 새 파일로 넘어가고 오래된 파일은 삭제"""
+    sink = CaptureSink(
+        tmp_path, max_file_bytes=200, max_files=2, batch_size=1, flush_interval_s=0.01
+    )
+    sink.start()
+    for i in range(20):
+        sink.record(make_record(i))
+    sink.close()
+
+    files = capture_files(tmp_path)
+    assert len(files) == 2
+    assert all(path.stat().st_size <= 200 for path in files)
+    # 남은 파일에는 가장 최근 기록이 있음
+    records = list(iter_captured(tmp_path))
+    assert records[-1]["request"]["features"][0] == 19
+
+
+def test_drops_when_queue_full(tmp_path):
+    """큐가 가득 차면 블로킹하지 않고 버림"""
+    sink = CaptureSink(tmp_path, queue_size=5)  # writer를 시작하지 않음
+    for i in range(8):
+        sink.record(make_record(i))
+
+    assert sink.stats()["queued"] == 5
+    assert sink.stats()["dropped"] == 3
+
+
+def test_dropped_count_is_exact_under_concurrency(tmp_path):
+    """여러 스레드가 동시에 버려도 버린 개수를 정확히 셈"""
+    sink = CaptureSink(tmp_path, queue_size=1)  # writer를 시작하지 않음
+    sink.record(make_record(0))
+
+    def flood():
+        for i in range(1000):
+            sink.record(make_record(i))
+
+    threads = [threading.Thread(target=flood) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sink.stats()["dropped"] == 8000
@@ -0,0 +1,262 @@
+"""client.py에 대한 테스트"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from app import main
+from app.client import AsyncIrisClient, IrisClient
+
+ROWS = [[5.1, 3.5, 1.4, 0.2], [6.2, 3.4, 5.4, 2.3], [5.7, 2.8, 4.1, 1.3]]
+
+
+@pytest.fixture(autouse=True)
+def setup_test_model(monkeypatch):
+    """테스트용 모델과 배치 예측 호출 횟수 기록"""
+    model = RandomForestClassifier(n_estimators=5, random_state=42)
+    model.fit(np.array(ROWS), np.array([0, 2, 1]))
+    monkeypatch.setattr(main, "MODEL", model)
+    monkeypatch.setattr(
+        main,
+        "MODEL_INFO",
+        {
+            "version": "v1.0",
+            "metrics": {},
+            "feature_names": [
+                "sepal_length",
+                "sepal_width",
+                "petal_length",
+                "petal_width",
+            ],
+            "target_names": ["setosa", "versicolor", "virginica"],
+        },
+    )
+
+    batch_sizes = []
+    score_batch = main._tracked_score_batch
+
+    def counting_score_batch(rows, *args):
+        batch_sizes.append(len(rows))
+        return score_batch(rows, *args)
+
+    monkeypatch.setattr(main, "_tracked_score_batch", counting_score_batch)
+    return batch_sizes
+
+
+def mock_client(responses, async_client=False):
+    """응답(또는 예외)을 차례로 돌려주는 httpx 클라이언트"""
+    calls = []
+    iterator = iter(responses)
+
+    def handler(request):
+        calls.append(request)
+        response = next(iterator)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client_cls = httpx.AsyncClient if async_client else httpx.Client
+    http_client = client_cls(
+        transport=httpx.MockTransport(handler), base_url="http://test"
+    )
+    return http_client, calls
+
+
+def test_predict_matches_api():
+    """SDK 결과가 /predict 응답과 같은지 확인"""
+    with IrisClient.for_app(main.app, batch_window_ms=0) as client:
+        direct = client.predict(ROWS[1])
+    with IrisClient.for_app(main.app) as client:
+        batched = client.predict(ROWS[1])
+        many = client.predict_batch(ROWS)
+
+    assert batched == direct
+    assert many[1] == direct
+    assert [r["prediction"] for r in many] == [0, 2, 1]
+
+
+def test_sync_predict_calls_are_coalesced(setup_test_model):
+    """여러 스레드의 predict 호출이 하나의 배치 요청으로 묶임"""
+    results = [None] * 8
+    with IrisClient.for_app(main.app, batch_window_ms=200) as client:
+
+        def call(i):
+            results[i] = client.predict(ROWS[i % 3])
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sum(setup_test_model) == 8
+    assert len(setup_test_model) < 8
+    assert [r["prediction"] for r in results] == [[0, 2, 1][i % 3] for i in range(8)]
+
+
+def test_malformed_row_fails_only_its_caller(setup_test_model):
+    """잘못된 행은 큐에 넣기 전에 ValueError로 거절되어 같은 배치의 다른 호출은 성공"""
+    bad_rows = [[5.1, 3.5, 1.4], [5.1, 3.5, 1.4, "x"], [5.1, 3.5, 1.4, float("nan")]]
+    errors = []
+    results = []
+    with IrisClient.for_app(main.app, batch_window_ms=200) as client:
+
+        def call(row):
+            try:
+                results.append(client.predict(row))
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=call, args=(row,)) for row in ROWS + bad_rows
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(errors) == 3
+    assert sorted(r["prediction"] for r in results) == [0, 1, 2]
+    assert sum(setup_test_model) == 3
+
+
+def test_async_malformed_row_fails_only_its_caller(setup_test_model):
+    """비동기 클라이언트도 잘못된 행만 ValueError로 실패"""
+
+    async def run():
+        async with AsyncIrisClient.for_app(main.app, batch_window_ms=20) as client:
+            return await asyncio.gather(
+                *(client.predict(row) for row in ROWS + [[1.0, 2.0]]),
+                return_exceptions=True,
+            )
+
+    *results, error = asyncio.run(run())
+
+    assert isinstance(error, ValueError)
+    assert [r["prediction"] for r in results] == [0, 2, 1]
+    assert setup_test_model == [3]
+
+
+def test_sync_batches_are_sent_concurrently():
+    """응답을 기다리는 배치가 있어도 다음 배치를 max_concurrent_batches개까지 동시에 전송"""
+    lock = threading.Lock()
+    in_flight, peak = [0], [0]
+    release = threading.Event()
+
+    def handler(request):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        release.wait(5)
+        with lock:
+            in_flight[0] -= 1
+        n_rows = len(json.loads(request.content)["instances"])
+        predictions = [{"prediction": 0}] * n_rows
+        return httpx.Response(
+            200, json={"predictions": predictions, "model_version": "v"}
+        )
+
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(handler), base_url="http://test"
+    )
+    client = IrisClient(
+        http_client=http_client,
+        batch_window_ms=1,
+        max_batch_size=1,
+        max_concurrent_batches=3,
+    )
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.predict(ROWS[0])))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while peak[0] < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert peak[0] == 3
+    assert len(results) == 6
+
+
+def test_predict_batch_splits_by_max_batch_size(setup_test_model):
+    """max_batch_size를 넘는 입력은 나눠서 전송"""
+    with IrisClient.for_app(main.app, max_batch_size=2) as client:
+        results = client.predict_batch(ROWS * 2)
+    assert len(results) == 6
+    assert setup_test_model == [2, 2, 2]
+
+
+def test_retries_overload_and_honors_retry_after():
+    """503은 Retry-After만큼 기다린 뒤 재시도"""
+    http_client, calls = mock_client(
+        [
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"status": "healthy"}),
+        ]
+    )
+    client = IrisClient(http_client=http_client, backoff_s=0)
+    assert client.health() == {"status": "healthy"}
+    assert len(calls) == 2
+    client.close()
+
+
+def test_does_not_retry_client_errors():
+    """400 같은 클라이언트 오류는 재시도하지 않음"""
+    http_client, calls = mock_client([httpx.Response(400, json={"detail": "bad"})])
+    client = IrisClient(http_client=http_client, batch_window_ms=0)
+    with pytest.raises(httpx.HTTPStatusError):
+        client.predict(ROWS[0])
+    assert len(calls) == 1
+    client.close()
+
+
+def test_gives_up_after_max_retries():
+    """재시도 횟수를 넘으면 마지막 오류를 그대로 전달"""
+    error = httpx.ConnectError("refused")
+    http_client, calls = mock_client([error] * 3)
+    client = IrisClient(http_client=http_client, max_retries=2, backoff_s=0)
+    with pytest.raises(httpx.ConnectError):
+        client.health()
+    assert len(calls) == 3
+    client.close()
+
+
+def test_async_predict_calls_are_coalesced(setup_test_model):
+    """같은 이벤트 루프의 predict 호출이 하나의 배치 요청으로 묶임"""
+
+    async def run():
+        async with AsyncIrisClient.for_app(main.app, batch_window_ms=20) as client:
+            return await asyncio.gather(*(client.predict(row) for row in ROWS * 3))
+
+    results = asyncio.run(run())
+
+    assert setup_test_model == [9]
+    assert [r["prediction"] for r in results] == [0, 2, 1] * 3
+    assert all(r["model_version"] == "v1.0" for r in results)
+
+
+def test_async_retries_transport_errors():
+    """비동기 클라이언트도 연결 오류를 재시도"""
+    http_client, calls = mock_client(
+        [httpx.ConnectError("refused"), httpx.Response(200, json={"ok": True})],
+        async_client=True,
+    )
+
+    async def run():
+        async with AsyncIrisClient(http_client=http_client, backoff_s=0) as client:
+            return await client.model_info()
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert len(calls) == 2
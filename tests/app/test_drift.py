@@ -0,0 +1,106 @@
+"""drift.py에 대한 테스트"""
+
+import time
+
+import numpy as np
+import pytest
+
+from app.drift import (
+    DriftMonitor,
+    ks_statistic,
+    population_stability_index,
+    sample_reference,
+)
+from scripts.reference_stats import compute_reference_stats
+
+
+@pytest.fixture
+def reference():
+    X = np.random.default_rng(0).normal(size=(5000, 4))
+    return compute_reference_stats(X, feature_names=["a", "b", "c", "d"])
+
+
+def test_psi_and_ks():
+    """같은 분포는 0, 다른 분포는 양수"""
+    expected = np.array([0.25, 0.25, 0.25, 0.25])
+    assert population_stability_index(expected, expected) == 0
+    assert ks_statistic(expected, expected) == 0
+
+    shifted = np.array([0.0, 0.1, 0.4, 0.5])
+    assert population_stability_index(expected, shifted) > 0.25
+    assert ks_statistic(expected, shifted) == pytest.approx(0.4)
+
+
+def test_ring_buffer_keeps_latest_rows():
+    """버퍼가 가득 차면 가장 오래된 입력부터 덮어씀"""
+    monitor = DriftMonitor(n_features=1, capacity=4)
+    monitor.set_reference({"feature_names": ["a"]})
+
+    monitor.observe([[1.0], [2.0], [3.0]])
+    monitor.observe([[4.0], [5.0]])
+    assert sorted(monitor.window()[:, 0]) == [2.0, 3.0, 4.0, 5.0]
+
+    monitor.observe(np.arange(10.0).reshape(-1, 1))
+    assert sorted(monitor.window()[:, 0]) == [6.0, 7.0, 8.0, 9.0]
+
+
+def test_observe_is_noop_without_reference():
+    """기준 통계가 없으면 입력을 모으지 않음"""
+    monitor = DriftMonitor(capacity=8)
+    monitor.observe(np.ones((3, 4)))
+    assert len(monitor.window()) == 0
+    assert monitor.update() is None
+
+
+def test_detects_shifted_feature(reference):
+    """한 특성만 이동하면 그 특성만 드리프트로 판정"""
+    monitor = DriftMonitor(capacity=2000, min_samples=100)
+    monitor.set_reference(reference)
+    X = np.random.default_rng(1).normal(size=(2000, 4))
+    X[:, 2] += 1.0
+    monitor.observe(X)
+
+    report = monitor.update()
+
+    assert report["window_size"] == 2000
+    assert report["status"] == "drift"
+    assert report["features"]["c"]["status"] == "significant"
+    for name in ("a", "b", "d"):
+        assert report["features"][name]["status"] == "stable"
+
+
+def test_insufficient_data(reference):
+    """최소 표본 수보다 적으면 판정하지 않음"""
+    monitor = DriftMonitor(min_samples=100)
+    monitor.set_reference(reference)
+    monitor.observe(np.zeros((10, 4)))
+
+    assert monitor.update()["status"] == "insufficient_data"
+
+
+def test_background_updates(reference):
+    """백그라운드 스레드가 주기적으로 결과를 갱신"""
+    monitor = DriftMonitor(min_samples=1)
+    monitor.set_reference(reference)
+    monitor.observe(np.zeros((5, 4)))
+    monitor.start(interval_s=0.01)
+    try:
+        for _ in range(500):
+            if monitor.latest is not None:
+                break
+            time.sleep(0.01)
+    finally:
+        monitor.stop()
+    assert monitor.latest["window_size"] == 5
+    assert not monitor.running
+
+
+def test_sample_reference_follows_bin_fractions(reference):
+    """기준 통계에서 뽑은 표본은 같은 구간 비율을 따름"""
+    X = sample_reference(reference, n_samples=4000)
+
+    assert X.shape == (4000, 4)
+    monitor = DriftMonitor(capacity=4000)
+    monitor.set_reference(reference)
+    monitor.observe(X)
+    assert monitor.update()["status"] == "stable"
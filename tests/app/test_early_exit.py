@@ -0,0 +1,65 @@
+"""early_exit.py에 대한 테스트"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from app.early_exit import FlatForest
+
+IRIS_X, IRIS_Y = load_iris(return_X_y=True)
+
+
+@pytest.fixture(scope="module")
+def samples():
+    rng = np.random.default_rng(0)
+    return np.vstack([IRIS_X, rng.uniform(0.0, 8.0, size=(500, 4))])
+
+
+@pytest.mark.parametrize("max_depth", [3, None])
+def test_full_evaluation_matches_sklearn(samples, max_depth):
+    """모든 트리를 평가하면 sklearn predict_proba와 같음"""
+    model = RandomForestClassifier(
+        n_estimators=30, max_depth=max_depth, random_state=0
+    ).fit(IRIS_X, IRIS_Y)
+    forest = FlatForest(model, chunk_size=model.n_estimators)
+
+    proba, trees_used = forest.predict_proba(samples)
+
+    assert np.allclose(proba, model.predict_proba(samples))
+    assert (trees_used == 30).all()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 16])
+def test_exact_mode_never_changes_prediction(samples, chunk_size):
+    """exact 모드는 트리를 덜 쓰더라도 예측 클래스가 항상 같음"""
+    model = RandomForestClassifier(n_estimators=60, random_state=1).fit(IRIS_X, IRIS_Y)
+    forest = FlatForest(model, chunk_size=chunk_size)
+
+    predictions, trees_used = forest.predict(samples, mode="exact")
+
+    assert np.array_equal(predictions, model.predict(samples))
+    assert trees_used.min() < 60
+    # 남은 트리 수보다 앞서야 멈추므로 최소 절반 이상 평가
+    assert trees_used.min() > 30
+
+
+def test_budget_mode_stops_early_and_reports_agreement(samples):
+    """시간 예산이 0이면 첫 chunk만 평가하고, 일치율을 측정"""
+    model = RandomForestClassifier(n_estimators=40, random_state=2).fit(IRIS_X, IRIS_Y)
+    forest = FlatForest(model, chunk_size=5)
+
+    _, trees_used = forest.predict(samples[:10], mode="budget", budget_ms=0)
+    assert (trees_used == 5).all()
+
+    report = forest.measure(model, samples[:50], budget_ms=0)
+    assert report["exact_agreement_rate"] == 1.0
+    assert report["budget_mean_trees_used"] == 5
+    assert 0 <= report["budget_agreement_rate"] <= 1
+
+
+def test_rejects_unknown_mode():
+    """알 수 없는 모드는 ValueError"""
+    model = RandomForestClassifier(n_estimators=2).fit(IRIS_X, IRIS_Y)
+    with pytest.raises(ValueError):
+        FlatForest(model).predict_proba(IRIS_X[:1], mode="fast")
@@ -0,0 +1,100 @@
+"""lookup_table.py에 대한 테스트"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from app.lookup_table import LookupTable, split_thresholds
+
+IRIS_X, IRIS_Y = load_iris(return_X_y=True)
+
+
+@pytest.fixture(scope="module")
+def forest():
+    return RandomForestClassifier(n_estimators=20, max_depth=4, random_state=0).fit(
+        IRIS_X, IRIS_Y
+    )
+
+
+def random_inputs(n=5000):
+    """격자 경계값과 Iris 범위 밖을 모두 포함하는 입력"""
+    rng = np.random.default_rng(0)
+    return np.vstack(
+        [
+            IRIS_X,
+            rng.uniform(-1.0, 9.0, size=(n, 4)),
+            np.round(rng.uniform(0.0, 8.0, size=(n, 4)), 2),
+        ]
+    )
+
+
+def test_split_thresholds(forest):
+    """특성별 임계값은 정렬되어 있고 모든 트리의 분할을 포함"""
+    thresholds = split_thresholds(forest, 4)
+
+    assert len(thresholds) == 4
+    for feature, values in enumerate(thresholds):
+        assert np.all(np.diff(values) > 0)
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            internal = tree.children_left != tree.children_right
+            assert np.isin(
+                tree.threshold[internal & (tree.feature == feature)], values
+            ).all()
+
+
+def test_full_grid_is_exact(forest):
+    """격자를 자르지 않으면 모든 입력이 격자 안이며 확률이 모델과 같음"""
+    table = LookupTable(forest, 4, max_cells=10**7)
+    X = random_inputs()
+
+    proba, inside = table.lookup(X)
+    assert inside.all()
+    assert np.array_equal(proba, forest.predict_proba(X))
+    assert table.stats()["trimmed_thresholds"] == 0
+
+
+@pytest.mark.parametrize("X_ref", [None, IRIS_X])
+def test_bounded_grid_falls_back_outside(forest, X_ref):
+    """칸 수 상한을 넘으면 범위를 좁히고, 범위 밖 입력은 모델로 계산"""
+    table = LookupTable(forest, 4, max_cells=2000, X_ref=X_ref)
+    X = random_inputs()
+
+    stats = table.stats()
+    assert stats["cells"] <= 2000
+    assert stats["trimmed_thresholds"] > 0
+    assert table.nbytes < 2000 * 3 * 8 + 4096
+
+    proba, inside = table.lookup(X)
+    assert 0 < inside.sum() < len(X)
+    assert np.array_equal(proba[inside], forest.predict_proba(X[inside]))
+    assert np.isnan(proba[~inside]).all()
+
+    assert np.array_equal(table.predict_proba(X, forest), forest.predict_proba(X))
+    assert table.hits == inside.sum()
+    assert table.fallbacks == (~inside).sum()
+
+
+def test_reference_inputs_increase_coverage(forest):
+    """참고 입력이 있으면 그 입력이 격자 안에 더 많이 들어오도록 범위를 고름"""
+    blind = LookupTable(forest, 4, max_cells=2000)
+    guided = LookupTable(forest, 4, max_cells=2000, X_ref=IRIS_X)
+
+    assert guided.lookup(IRIS_X)[1].mean() > blind.lookup(IRIS_X)[1].mean()
+
+
+def test_single_tree():
+    """결정 트리 하나도 같은 방식으로 조회"""
+    model = DecisionTreeClassifier(random_state=0).fit(IRIS_X, IRIS_Y)
+    table = LookupTable(model, 4)
+    X = random_inputs()
+
+    assert np.array_equal(table.predict_proba(X, model), model.predict_proba(X))
+
+
+def test_rejects_impossible_bound(forest):
+    """칸이 하나도 만들 수 없는 상한은 ValueError"""
+    with pytest.raises(ValueError):
+        LookupTable(forest, 4, max_cells=0)
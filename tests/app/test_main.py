@@ -45,6 +45,11 @@ def setup_test_model():
     # 테스트 후 정리
     main.MODEL = None
     main.MODEL_INFO = None
+    main.WARMUP_INFO = None
+    main.LOADED_FINGERPRINT = None
+    main.FAST_MODEL = None
+    main.FAST_MODEL_INFO = None
+    main.DRIFT_MONITOR.set_reference(None)
 
 
 def test_read_root():
@@ -141,3 +146,530 @@ def test_predict_various_inputs(features):
     assert result["prediction_name"] in ["setosa", "versicolor", "virginica"]
     assert len(result["probability"]) == 3  # 3개 클래스
 
+
+def test_health_reports_executor_stats():
+    """헬스 체크에 추론/관리 스레드풀 상태가 포함되는지 확인"""
+    result = client.get("/health").json()
+    assert "in_flight" in result["executors"]["inference"]
+    assert "in_flight" in result["executors"]["admin"]
+
+
+def test_predict_rejected_when_overloaded(monkeypatch):
+    """추론 스레드풀이 가득 차면 Retry-After와 함께 429 응답"""
+    from app.admission import BoundedExecutor
+
+    executor = BoundedExecutor("test", max_workers=1, max_queue=0, deadline_s=1)
+    monkeypatch.setattr(main, "INFERENCE_EXECUTOR", executor)
+    executor._in_flight = 1  # 실행 중인 요청이 한도만큼 있는 상태
+
+    response = client.post("/predict", json={"features": [5.1, 3.5, 1.4, 0.2]})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    executor.shutdown()
+
+
+def test_ready_only_after_warm_up():
+    """워밍업 전에는 503, 워밍업 후에는 200과 소요 시간 반환"""
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    main.WARMUP_INFO = main.warm_up_model(main.MODEL, main.MODEL_INFO)
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    result = response.json()
+    assert result["ready"] is True
+    assert result["warmup"]["model_version"] == "v1.0"
+    assert result["warmup"]["batch_sizes"] == list(main.WARMUP_BATCH_SIZES)
+    assert result["warmup"]["duration_ms"] >= 0
+
+
+def test_resolve_model_fingerprint_uses_local_file(tmp_path, monkeypatch, capsys):
+    """MLflow를 쓸 수 없으면 로컬 모델 파일의 mtime/크기로 지문 생성"""
+    import os
+
+    from mlflow.exceptions import MlflowException
+
+    def unavailable():
+        raise MlflowException("연결 실패")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "MlflowClient", unavailable)
+    monkeypatch.setattr(main, "REGISTRY_ERROR", None)
+    assert main.resolve_model_fingerprint() is None
+    assert main.resolve_model_fingerprint() is None
+    # 같은 조회 오류는 폴링마다 반복해서 출력하지 않음
+    assert capsys.readouterr().out.count("레지스트리 조회 실패") == 1
+
+    model_path = tmp_path / "models" / "model.pkl"
+    model_path.parent.mkdir()
+    model_path.write_bytes(b"v1")
+    first = main.resolve_model_fingerprint()
+    assert first.startswith("local-")
+    assert main.resolve_model_fingerprint() == first
+
+    model_path.write_bytes(b"v2-updated")
+    os.utime(model_path, ns=(0, 123))
+    assert main.resolve_model_fingerprint() != first
+
+
+def test_profiling_admin_endpoints():
+    """프로파일러를 켜고 헤더로 지정한 요청의 collapsed stack을 받음"""
+    response = client.post(
+        "/admin/profiling", json={"enabled": True, "sample_rate": 0.0}
+    )
+    assert response.status_code == 200
+    assert response.json()["enabled"] is True
+    try:
+        for _ in range(3):
+            response = client.post(
+                "/predict",
+                json={"features": [5.1, 3.5, 1.4, 0.2]},
+                headers={"X-Profile": "1"},
+            )
+            assert response.status_code == 200
+        assert client.get("/admin/profiling").json()["profiled_requests"] == 3
+
+        response = client.get("/admin/profiling/collapsed")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+    finally:
+        client.post("/admin/profiling", json={"enabled": False})
+        client.delete("/admin/profiling")
+
+    response = client.post("/admin/profiling", json={"sample_rate": 2})
+    assert response.status_code == 400
+
+
+def test_model_info_reports_memory():
+    """모델 정보에 노드 수와 메모리 크기가 포함되는지 확인"""
+    memory = client.get("/model/info").json()["memory"]
+    assert memory["n_trees"] == 10
+    assert memory["node_count"] > 0
+    assert memory["pickled_size_bytes"] > 0
+    assert "process_rss_bytes" in memory
+
+
+def test_admin_memory_with_tracemalloc():
+    """관리 API로 tracemalloc을 켜면 상위 할당 위치를 반환"""
+    assert client.get("/admin/memory").json()["tracemalloc"] is None
+
+    response = client.post("/admin/memory/tracemalloc", json={"enabled": True})
+    assert response.json() == {"tracing": True}
+    try:
+        result = client.get("/admin/memory", params={"top": 5}).json()
+        assert len(result["tracemalloc"]["top"]) <= 5
+        assert result["model"]["node_count"] > 0
+        assert "history" in result["reloads"]
+    finally:
+        response = client.post("/admin/memory/tracemalloc", json={"enabled": False})
+    assert response.json() == {"tracing": False}
+
+
+def test_refresh_model_records_memory_history(tmp_path, monkeypatch):
+    """리로드할 때마다 워밍업과 메모리 기록이 갱신되는지 확인"""
+    from unittest.mock import MagicMock
+
+    import joblib
+
+    from app.memory import MemoryTracker
+
+    registry = MagicMock()
+    registry.get_latest_versions.return_value = []
+    monkeypatch.setattr(main, "MlflowClient", lambda: registry)
+    monkeypatch.setattr(main, "MEMORY_TRACKER", MemoryTracker())
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    joblib.dump(
+        {"model": main.MODEL, "version": "v2.0", "metrics": {}},
+        tmp_path / "models" / "model.pkl",
+    )
+
+    main.refresh_model()
+    main.refresh_model()
+    main.POST_LOAD_THREAD.join()
+
+    assert main.MODEL_INFO["version"] == "v2.0"
+    assert main.WARMUP_INFO["model_version"] == "v2.0"
+    assert main.LOADED_FINGERPRINT.startswith("local-")
+    history = main.MEMORY_TRACKER.summary()["history"]
+    assert [entry["model_version"] for entry in history] == ["v2.0", "v2.0"]
+
+
+def test_refresh_model_swaps_after_warm_up(tmp_path, monkeypatch):
+    """리로드 중에는 기존 모델로 서빙하고 /ready는 503, 워밍업 후 한 번에 교체"""
+    from unittest.mock import MagicMock
+
+    import joblib
+
+    registry = MagicMock()
+    registry.get_latest_versions.return_value = []
+    monkeypatch.setattr(main, "MlflowClient", lambda: registry)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    joblib.dump(
+        {"model": main.MODEL, "version": "v2.0", "metrics": {}},
+        tmp_path / "models" / "model.pkl",
+    )
+    main.WARMUP_INFO = main.warm_up_model(main.MODEL, main.MODEL_INFO)
+    during_reload = {}
+    warm_up_model = main.warm_up_model
+
+    def observing_warm_up(*args):
+        during_reload["ready"] = client.get("/ready").status_code
+        during_reload["version"] = client.post(
+            "/predict", json={"features": [5.1, 3.5, 1.4, 0.2]}
+        ).json()["model_version"]
+        return warm_up_model(*args)
+
+    monkeypatch.setattr(main, "warm_up_model", observing_warm_up)
+    main.refresh_model()
+    main.POST_LOAD_THREAD.join()
+
+    assert during_reload == {"ready": 503, "version": "v1.0"}
+    assert client.get("/ready").json()["warmup"]["model_version"] == "v2.0"
+    assert main.MODEL_INFO["version"] == "v2.0"
+    # 조기 종료용 FlatForest는 요청 경로가 아니라 로드할 때 새 모델로 생성
+    assert main.FLAT_FOREST[0] is main.MODEL
+    assert main.EARLY_EXIT_INFO["n_trees"] == 10
+    main.EARLY_EXIT_INFO = None
+
+
+def test_refresh_model_failure_keeps_serving_model(tmp_path, monkeypatch):
+    """로드에 실패하면 기존 모델과 레디니스를 그대로 유지"""
+    from unittest.mock import MagicMock
+
+    registry = MagicMock()
+    registry.get_latest_versions.return_value = []
+    monkeypatch.setattr(main, "MlflowClient", lambda: registry)
+    monkeypatch.chdir(tmp_path)
+    model = main.MODEL
+    main.WARMUP_INFO = main.warm_up_model(main.MODEL, main.MODEL_INFO)
+
+    with pytest.raises(FileNotFoundError):
+        main.refresh_model()
+
+    assert main.MODEL is model
+    assert client.get("/ready").status_code == 200
+
+
+def test_drift_report():
+    """기준 통계가 있으면 예측 입력을 모아 특성별 PSI/KS를 반환"""
+    from scripts.reference_stats import compute_reference_stats
+
+    assert client.get("/monitoring/drift").json()["enabled"] is False
+
+    reference = compute_reference_stats(np.random.default_rng(0).normal(size=(500, 4)))
+    main.DRIFT_MONITOR.set_reference(reference)
+    main.DRIFT_MONITOR.min_samples = 1
+    try:
+        for _ in range(3):
+            client.post("/predict", json={"features": [5.1, 3.5, 1.4, 0.2]})
+        report = client.get("/monitoring/drift").json()
+    finally:
+        main.DRIFT_MONITOR.min_samples = 100
+
+    assert report["enabled"] is True
+    assert report["window_size"] == 3
+    assert set(report["features"]) == set(reference["feature_names"])
+    assert report["status"] == "drift"
+
+
+def test_predict_capture(tmp_path, monkeypatch):
+    """CAPTURE_DIR을 설정하면 요청/응답/지연시간을 다시 보낼 수 있는 형식으로 기록"""
+    from app.capture import iter_captured
+
+    monkeypatch.setenv("CAPTURE_DIR", str(tmp_path))
+    sink = main.start_capture()
+    try:
+        features = [5.1, 3.5, 1.4, 0.2]
+        response = client.post("/predict", json={"features": features})
+        compact = client.post(
+            "/predict",
+            params={"early_exit": "budget", "budget_ms": 5},
+            headers={"X-Response-Mode": "class"},
+            json={"features": features},
+        )
+        assert client.get("/health").json()["capture"]["directory"] == str(tmp_path)
+    finally:
+        sink.close()
+        main.CAPTURE_SINK = None
+
+    first, second = iter_captured(tmp_path)
+    assert first["path"] == "/predict"
+    assert first["query"] == {"tier": "full"}
+    assert first["request"] == {"features": features}
+    assert first["response"] == response.json()
+    assert first["model_version"] == "v1.0"
+    assert first["latency_ms"] > 0
+
+    replayed = client.post(first["path"], params=first["query"], json=first["request"])
+    assert replayed.json() == first["response"]
+
+    # 헤더로 받은 응답 모드와 조기 종료 설정도 쿼리로 기록
+    assert second["query"] == {
+        "tier": "full",
+        "early_exit": "budget",
+        "budget_ms": 5.0,
+        "response_mode": "class",
+    }
+    replayed = client.post(
+        second["path"], params=second["query"], json=second["request"]
+    )
+    assert replayed.json() == compact.json()
+
+
+def test_websocket_pipelined_predictions():
+    """하나의 연결로 여러 요청을 연속으로 보내고 id로 응답을 매칭"""
+    rows = [[5.1, 3.5, 1.4, 0.2], [6.2, 3.4, 5.4, 2.3], [5.7, 2.8, 4.1, 1.3]]
+    expected = {
+        f"req-{i}": client.post("/predict", json={"features": row}).json()
+        for i, row in enumerate(rows)
+    }
+
+    with client.websocket_connect("/ws/predict") as websocket:
+        for i, row in enumerate(rows):
+            websocket.send_json({"id": f"req-{i}", "features": row})
+        responses = {r["id"]: r for r in (websocket.receive_json() for _ in rows)}
+
+        websocket.send_json({"id": "batch", "instances": rows})
+        batch = websocket.receive_json()
+
+    for request_id, result in expected.items():
+        response = responses[request_id]
+        assert response["prediction"] == result["prediction"]
+        assert response["probability"] == result["probability"]
+        assert response["model_version"] == "v1.0"
+    assert [p["prediction"] for p in batch["predictions"]] == [
+        expected[f"req-{i}"]["prediction"] for i in range(3)
+    ]
+
+
+def test_websocket_errors_keep_connection_open():
+    """잘못된 메시지는 오류 응답만 보내고 연결은 유지"""
+    with client.websocket_connect("/ws/predict") as websocket:
+        websocket.send_json({"id": 1, "features": [1.0, 2.0]})
+        assert websocket.receive_json() == {
+            "id": 1,
+            "error": "4개 특성 필요",
+            "status_code": 400,
+        }
+        websocket.send_text("not json")
+        assert websocket.receive_json()["status_code"] == 400
+        websocket.send_json([5.1, 3.5, 1.4, 0.2])
+        assert websocket.receive_json() == {
+            "id": None,
+            "error": "JSON 객체가 필요합니다",
+            "status_code": 400,
+        }
+
+        websocket.send_json({"id": 2, "features": [5.1, 3.5, 1.4, 0.2]})
+        assert websocket.receive_json()["id"] == 2
+
+
+def test_predict_batch():
+    """배치 예측은 행별 /predict 결과와 같음"""
+    rows = [[5.1, 3.5, 1.4, 0.2], [6.2, 3.4, 5.4, 2.3]]
+    response = client.post("/predict/batch", json={"instances": rows})
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["model_version"] == "v1.0"
+    for row, prediction in zip(rows, result["predictions"]):
+        single = client.post("/predict", json={"features": row}).json()
+        assert prediction["prediction"] == single["prediction"]
+        assert prediction["probability"] == single["probability"]
+
+    response = client.post("/predict/batch", json={"instances": [[1.0, 2.0]]})
+    assert response.status_code == 400
+    response = client.post("/predict/batch", json={"instances": []})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("mode", ["exact", "budget"])
+def test_predict_early_exit(mode):
+    """조기 종료 모드는 사용한 트리 수를 응답에 포함"""
+    features = {"features": [6.2, 3.4, 5.4, 2.3]}
+    full = client.post("/predict", json=features).json()
+    assert "trees_used" not in full
+
+    response = client.post("/predict", params={"early_exit": mode}, json=features)
+    assert response.status_code == 200
+    result = response.json()
+    assert 1 <= result["trees_used"] <= 10
+    if mode == "exact":
+        assert result["prediction"] == full["prediction"]
+
+    response = client.post("/predict", params={"early_exit": "fast"}, json=features)
+    assert response.status_code == 422
+    response = client.post(
+        "/predict", params={"early_exit": "budget", "budget_ms": -1}, json=features
+    )
+    assert response.status_code == 422
+
+
+def test_predict_response_modes():
+    """response_mode 쿼리 또는 X-Response-Mode 헤더로 응답 필드를 줄임"""
+    features = {"features": [6.2, 3.4, 5.4, 2.3]}
+    full = client.post("/predict", json=features).json()
+
+    response = client.post("/predict", params={"response_mode": "class"}, json=features)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"prediction": full["prediction"]}
+
+    result = client.post(
+        "/predict", headers={"X-Response-Mode": "topk:2"}, json=features
+    ).json()
+    assert result["top_k"][0] == full["prediction"]
+    assert result["probability"] == sorted(full["probability"], reverse=True)[:2]
+
+    # 쿼리가 헤더보다 우선
+    result = client.post(
+        "/predict",
+        params={"response_mode": "round:1", "early_exit": "exact"},
+        headers={"X-Response-Mode": "class"},
+        json=features,
+    ).json()
+    assert set(result) == set(full) | {"trees_used"}
+    assert all(p == round(p, 1) for p in result["probability"])
+
+    response = client.post("/predict", params={"response_mode": "xml"}, json=features)
+    assert response.status_code == 400
+
+
+def test_predict_topk_uses_model_classes(monkeypatch):
+    """topk는 확률 위치가 아니라 모델의 classes_ 값 (학습에 없는 클래스가 있어도 맞음)"""
+    from sklearn.datasets import load_iris
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = load_iris(return_X_y=True)
+    keep = y != 1
+    model = RandomForestClassifier(n_estimators=5, random_state=42)
+    model.fit(X[keep], y[keep])
+    monkeypatch.setattr(main, "MODEL", model)
+
+    features = {"features": [6.2, 3.4, 5.4, 2.3]}
+    for params in [{}, {"early_exit": "exact"}]:
+        result = client.post(
+            "/predict", params={"response_mode": "topk:2", **params}, json=features
+        ).json()
+        assert result["prediction"] == 2
+        assert result["top_k"] == [2, 0]
+
+
+def test_openapi_declares_response_modes():
+    """응답 모드별 응답 형태를 OpenAPI 스키마에 명시"""
+    schema = client.get("/openapi.json").json()
+    response = schema["paths"]["/predict"]["post"]["responses"]["200"]
+    refs = {
+        option["$ref"].rsplit("/", 1)[-1]
+        for option in response["content"]["application/json"]["schema"]["anyOf"]
+    }
+    assert refs == {"PredictionOutput", "ClassPredictionOutput", "TopKPredictionOutput"}
+    assert (
+        "top_k" in schema["components"]["schemas"]["TopKPredictionOutput"]["required"]
+    )
+
+
+def test_model_info_reports_early_exit_agreement():
+    """로드 시 측정한 조기 종료 일치율을 모델 정보에 포함"""
+    main.measure_early_exit()
+    try:
+        info = client.get("/model/info").json()["early_exit"]
+    finally:
+        main.EARLY_EXIT_INFO = None
+    assert info["exact_agreement_rate"] == 1.0
+    assert info["n_trees"] == 10
+    assert "budget_agreement_rate" in info
+
+
+def fast_model_from(teacher):
+    """테스트용 모델을 흉내 내는 fast 티어 결정 트리"""
+    from scripts.distillation import distill_forest
+
+    X = np.array([[5.1, 3.5, 1.4, 0.2], [6.2, 3.4, 5.4, 2.3], [5.7, 2.8, 4.1, 1.3]])
+    return distill_forest(teacher, X, max_depth=3, n_synthetic=200)
+
+
+def test_predict_fast_tier():
+    """tier=fast는 증류 모델로 예측하고 fast 버전을 응답"""
+    features = {"features": [5.1, 3.5, 1.4, 0.2]}
+    response = client.post("/predict", params={"tier": "fast"}, json=features)
+    assert response.status_code == 400
+
+    main.FAST_MODEL = fast_model_from(main.MODEL)
+    main.FAST_MODEL_INFO = {
+        "version": "v1.0-fast",
+        "target_names": main.MODEL_INFO["target_names"],
+        "metrics": {"agreement_rate": 1.0},
+    }
+
+    response = client.post("/predict", params={"tier": "fast"}, json=features)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["model_version"] == "v1.0-fast"
+    assert result["prediction_name"] == "setosa"
+
+    response = client.post(
+        "/predict/batch",
+        params={"tier": "fast"},
+        json={"instances": [[5.1, 3.5, 1.4, 0.2], [6.2, 3.4, 5.4, 2.3]]},
+    )
+    assert response.json()["model_version"] == "v1.0-fast"
+
+    response = client.post(
+        "/predict", params={"tier": "fast", "early_exit": "exact"}, json=features
+    )
+    assert response.status_code == 400
+
+    info = client.get("/model/info").json()
+    assert info["fast_tier"]["model_version"] == "v1.0-fast"
+
+
+def test_load_fast_model_requires_matching_teacher(tmp_path, monkeypatch):
+    """로컬 fast 모델은 원본 모델 version이 같을 때만 로드"""
+    import joblib
+
+    path = tmp_path / "fast_model.pkl"
+    monkeypatch.setattr(main, "FAST_MODEL_PATH", path)
+    fast_model = fast_model_from(main.MODEL)
+
+    joblib.dump({"model": fast_model, "teacher_version": "v0.9"}, path)
+    assert main.load_fast_model(main.MODEL_INFO) == (None, None)
+
+    joblib.dump(
+        {"model": fast_model, "teacher_version": "v1.0", "metrics": {"speedup": 9}},
+        path,
+    )
+    main.MODEL_INFO["source"] = "local"
+    loaded, info = main.load_fast_model(main.MODEL_INFO)
+    assert loaded is not None
+    assert info["version"] == "v1.0-fast"
+    assert info["metrics"] == {"speedup": 9}
+    # 교체는 refresh_model이 하므로 서빙 중인 fast 티어는 그대로
+    assert main.FAST_MODEL is None
+
+
+def test_predict_with_lookup_table(monkeypatch):
+    """조회 테이블을 켜면 같은 결과를 테이블에서 반환하고 통계를 보고"""
+    features = {"features": [6.2, 3.4, 5.4, 2.3]}
+    expected = client.post("/predict", json=features).json()
+
+    monkeypatch.setattr(main, "LOOKUP_TABLE_MAX_CELLS", 100_000)
+    try:
+        assert main.build_lookup_table() is not None
+        result = client.post("/predict", json=features).json()
+        batch = client.post(
+            "/predict/batch", json={"instances": [[6.2, 3.4, 5.4, 2.3], [99, 0, 0, 0]]}
+        ).json()
+        info = client.get("/model/info").json()["lookup_table"]
+    finally:
+        main.LOOKUP_TABLE = None
+
+    assert result == expected
+    assert batch["predictions"][0]["probability"] == expected["probability"]
+    assert info["cells"] <= 100_000
+    assert info["hits"] >= 2
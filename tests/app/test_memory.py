@@ -0,0 +1,86 @@
+"""memory.py에 대한 테스트"""
+
+import gc
+import tracemalloc
+import weakref
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from app.memory import MemoryTracker, model_memory, process_rss_bytes, tracemalloc_top
+
+
+def make_forest(n_estimators=5):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 4))
+    y = np.arange(60) % 3
+    return RandomForestClassifier(n_estimators=n_estimators, random_state=0).fit(X, y)
+
+
+def test_model_memory_counts_nodes_and_bytes():
+    """노드 수와 노드/값 배열 크기, 직렬화 크기를 집계"""
+    model = make_forest()
+
+    memory = model_memory(model)
+
+    node_count = sum(e.tree_.node_count for e in model.estimators_)
+    assert memory["n_trees"] == 5
+    assert memory["node_count"] == node_count
+    assert memory["node_array_bytes"] == node_count * 64
+    assert memory["value_array_bytes"] == node_count * 3 * 8
+    assert memory["pickled_size_bytes"] > memory["node_array_bytes"]
+
+
+def test_model_memory_single_tree():
+    """단일 결정 트리도 집계"""
+    tree = DecisionTreeClassifier(max_depth=2).fit([[0], [1], [2]], [0, 1, 1])
+    assert model_memory(tree)["n_trees"] == 1
+
+
+def test_process_rss_and_tracemalloc_top():
+    """RSS는 양수, tracemalloc은 켜져 있을 때만 상위 목록 반환"""
+    rss = process_rss_bytes()
+    assert rss is None or rss > 0
+
+    assert tracemalloc_top() is None
+    tracemalloc.start()
+    try:
+        data = [bytearray(1024) for _ in range(100)]
+        top = tracemalloc_top(limit=3)
+    finally:
+        tracemalloc.stop()
+    assert len(top["top"]) <= 3
+    assert top["traced_current_bytes"] > 0
+    del data
+
+
+def test_tracker_caches_and_records_history():
+    """모델이 바뀔 때만 다시 집계하고, 로드마다 기록을 남김"""
+    tracker = MemoryTracker(history_size=2)
+    first, second = make_forest(3), make_forest(4)
+
+    assert tracker.model_memory(first) is tracker.model_memory(first)
+    tracker.record_load(first, "v1")
+    tracker.record_load(second, "v2")
+    tracker.record_load(first, "v3")
+
+    summary = tracker.summary()
+    assert summary["loads"] == 2
+    assert [entry["model_version"] for entry in summary["history"]] == ["v2", "v3"]
+    assert "rss_growth_bytes" in summary
+
+
+def test_tracker_cache_follows_model_identity():
+    """다른 모델은 다시 집계하고, 캐시가 이전 모델을 붙잡아 두지 않음"""
+    tracker = MemoryTracker()
+    first = make_forest(3)
+    assert tracker.model_memory(first)["n_trees"] == 3
+
+    ref = weakref.ref(first)
+    del first
+    gc.collect()
+    assert ref() is None
+
+    # 해제된 모델의 id를 새 모델이 재사용해도 새로 집계
+    assert tracker.model_memory(make_forest(4))["n_trees"] == 4
@@ -0,0 +1,89 @@
+"""model_watcher.py에 대한 테스트"""
+
+import threading
+
+import pytest
+
+from app.model_watcher import ModelWatcher
+
+
+def make_watcher(fingerprints, loaded="v1", **kwargs):
+    """resolve가 fingerprints를 차례로 반환하는 감시자"""
+    state = {"loaded": loaded, "reloads": []}
+    iterator = iter(fingerprints)
+
+    def resolve():
+        value = next(iterator)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def reload():
+        state["reloads"].append(state["loaded"])
+        state["loaded"] = state["next"]
+
+    watcher = ModelWatcher(
+        resolve_fingerprint=resolve,
+        loaded_fingerprint=lambda: state["loaded"],
+        reload=reload,
+        interval_s=kwargs.pop("interval_s", 10),
+        **kwargs,
+    )
+    return watcher, state
+
+
+def test_reloads_only_when_fingerprint_changes():
+    """지문이 바뀔 때만 리로드"""
+    watcher, state = make_watcher(["v1", "v1", "v2", "v2", None])
+    state["next"] = "v2"
+
+    results = [watcher.poll_once() for _ in range(5)]
+
+    assert results == [False, False, True, False, False]
+    assert state["reloads"] == ["v1"]
+    assert watcher.stats()["reloads"] == 1
+
+
+def test_backoff_on_failure_and_reset_on_success():
+    """실패하면 간격이 지수적으로 늘고, 성공하면 원래대로 돌아옴"""
+    error = RuntimeError("tracking server down")
+    watcher, _ = make_watcher(
+        [error, error, error, "v1"], interval_s=10, jitter=0, max_backoff_s=60
+    )
+
+    delays = []
+    for _ in range(4):
+        watcher.poll_once()
+        delays.append(watcher.next_delay())
+
+    assert delays == [20, 40, 60, 10]
+    assert watcher.stats()["last_error"] is None
+
+
+def test_jitter_bounds():
+    """jitter는 기본 간격의 ±비율 안에서 적용"""
+    watcher, _ = make_watcher([], interval_s=10, jitter=0.2)
+    delays = [watcher.next_delay() for _ in range(200)]
+    assert min(delays) >= 8
+    assert max(delays) <= 12
+    assert len(set(delays)) > 1
+
+
+def test_background_thread_polls_and_stops():
+    """백그라운드 스레드가 주기적으로 폴링하고 stop으로 종료"""
+    polled = threading.Event()
+
+    def resolve():
+        polled.set()
+        return "v1"
+
+    watcher = ModelWatcher(
+        resolve_fingerprint=resolve,
+        loaded_fingerprint=lambda: "v1",
+        reload=pytest.fail,
+        interval_s=0.01,
+    )
+    watcher.start()
+    assert polled.wait(timeout=5)
+    watcher.stop()
+    assert not watcher._thread.is_alive()
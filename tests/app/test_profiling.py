@@ -0,0 +1,94 @@
+"""profiling.py에 대한 테스트"""
+
+import contextvars
+import threading
+import time
+
+import pytest
+
+from app.profiling import _PROFILED, SamplingProfiler, collapse_stack
+
+
+def busy_inference(stop):
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+def test_collapse_stack_orders_outermost_first():
+    """collapsed stack은 바깥쪽 프레임부터 ';'로 이어짐"""
+
+    def inner():
+        import sys
+
+        return collapse_stack(sys._getframe())
+
+    stack = inner().split(";")
+    assert stack[-1].startswith("inner (test_profiling.py:")
+    assert any(
+        label.startswith("test_collapse_stack_orders_outermost_first")
+        for label in stack
+    )
+
+
+def test_disabled_profiler_does_not_sample():
+    """꺼져 있으면 헤더가 있어도 프로파일링하지 않음"""
+    profiler = SamplingProfiler(sample_rate=1.0)
+    assert profiler.should_profile([(b"x-profile", b"1")]) is False
+    assert profiler._sampler is None
+
+
+def test_header_forces_profiling_when_enabled():
+    """켜져 있으면 X-Profile 헤더로 샘플링 비율과 무관하게 프로파일링"""
+    profiler = SamplingProfiler(sample_rate=0.0)
+    profiler.configure(enabled=True)
+    try:
+        assert profiler.should_profile([(b"x-profile", b"1")]) is True
+        assert profiler.should_profile([]) is False
+    finally:
+        profiler.configure(enabled=False)
+    assert profiler.enabled is False
+
+
+def test_wrap_samples_only_profiled_calls():
+    """wrap한 함수는 프로파일링 대상 요청에서 호출될 때만 샘플링"""
+    profiler = SamplingProfiler()
+    tracked = profiler.wrap(busy_inference)
+    stop = threading.Event()
+
+    worker = threading.Thread(target=tracked, args=(stop,))
+    worker.start()
+    time.sleep(0.02)
+    profiler.sample()
+    stop.set()
+    worker.join()
+    assert profiler.collapsed() == ""
+
+    stop.clear()
+    # 미들웨어가 표시한 요청 컨텍스트를 추론 스레드로 전달하는 상황
+    token = _PROFILED.set(True)
+    context = contextvars.copy_context()
+    _PROFILED.reset(token)
+    worker = threading.Thread(target=context.run, args=(tracked, stop))
+    worker.start()
+    time.sleep(0.02)
+    profiler.sample()
+    profiler.sample()
+    stop.set()
+    worker.join()
+
+    lines = profiler.collapsed().splitlines()
+    assert len(lines) >= 1
+    assert all("busy_inference" in line for line in lines)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == 2
+
+    profiler.reset()
+    assert profiler.stats()["samples"] == 0
+
+
+def test_configure_validates_values():
+    """잘못된 설정값은 ValueError"""
+    profiler = SamplingProfiler()
+    with pytest.raises(ValueError):
+        profiler.configure(sample_rate=1.5)
+    with pytest.raises(ValueError):
+        profiler.configure(interval_ms=0)
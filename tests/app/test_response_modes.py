@@ -0,0 +1,70 @@
+"""app/response_modes.py에 대한 테스트"""
+
+import json
+
+import pytest
+
+from app.main import PredictionOutput
+from app.response_modes import parse_mode, serializer
+
+OUTPUT = PredictionOutput(
+    prediction=2,
+    prediction_name="virginica",
+    probability=[0.1, 0.2345678, 0.6654322],
+    model_version='v1.0 "test"',
+)
+
+
+def test_parse_mode():
+    assert parse_mode(None) == ("full", None)
+    assert parse_mode(" Class ") == ("class", None)
+    assert parse_mode("topk") == ("topk", 1)
+    assert parse_mode("topk:2") == ("topk", 2)
+    assert parse_mode("round") == ("round", 3)
+    assert parse_mode("round:0") == ("round", 0)
+
+    for spec in ["all", "class:1", "topk:0", "topk:x", "round:11"]:
+        with pytest.raises(ValueError):
+            parse_mode(spec)
+
+
+def test_serializers_are_prebuilt_per_mode():
+    """같은 모드/인자는 같은 직렬화 함수를 재사용, full은 None"""
+    assert serializer("full") is None
+    assert serializer("topk:2") is serializer(" TOPK:2")
+    assert serializer("topk:2") is not serializer("topk:1")
+
+
+def test_class_mode():
+    """prediction 필드가 float이어도 정수로 직렬화"""
+    assert serializer("class")(OUTPUT) == b'{"prediction":2}'
+    assert isinstance(OUTPUT.prediction, float)
+
+
+def test_topk_mode():
+    """확률 내림차순 상위 k개 (k가 클래스 수보다 크면 전체)"""
+    result = json.loads(serializer("topk:2")(OUTPUT))
+    assert result == {
+        "prediction": 2,
+        "top_k": [2, 1],
+        "probability": [0.6654322, 0.2345678],
+        "model_version": 'v1.0 "test"',
+    }
+    assert json.loads(serializer("topk:5")(OUTPUT))["top_k"] == [2, 1, 0]
+    # 확률 위치가 아니라 모델의 classes_ 값으로 표시
+    assert json.loads(serializer("topk:2")(OUTPUT, [3, 5, 7]))["top_k"] == [7, 5]
+
+
+def test_round_mode():
+    """기존 응답 필드에 확률만 반올림, trees_used는 있을 때만"""
+    result = json.loads(serializer("round:2")(OUTPUT))
+    assert result == {
+        "prediction": 2,
+        "prediction_name": "virginica",
+        "probability": [0.1, 0.23, 0.67],
+        "model_version": 'v1.0 "test"',
+    }
+    assert b"[0.1,0.23,0.67]" in serializer("round:2")(OUTPUT)
+
+    early = OUTPUT.model_copy(update={"trees_used": 6})
+    assert json.loads(serializer("round:0")(early))["trees_used"] == 6
@@ -0,0 +1,96 @@
+"""app/serialization.py에 대한 테스트"""
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from app.serialization import (
+    MAGIC,
+    ChecksumError,
+    artifact_header,
+    dump_artifact,
+    load_artifact,
+)
+
+
+@pytest.fixture(scope="module")
+def artifact():
+    X, y = load_iris(return_X_y=True)
+    model = RandomForestClassifier(n_estimators=10, random_state=42).fit(X, y)
+    return {"model": model, "version": "v1.0", "metrics": {"accuracy": 1.0}}
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib", "bz2", "lzma"])
+@pytest.mark.parametrize("out_of_band", [True, False])
+def test_round_trip(tmp_path, artifact, codec, out_of_band):
+    """코덱/out-of-band 조합마다 같은 예측을 하는 모델로 복원"""
+    path = tmp_path / "model.pkl"
+    header = dump_artifact(artifact, path, codec=codec, out_of_band=out_of_band)
+
+    loaded = load_artifact(path)
+    X, _ = load_iris(return_X_y=True)
+    assert loaded["version"] == "v1.0"
+    assert np.array_equal(
+        loaded["model"].predict_proba(X), artifact["model"].predict_proba(X)
+    )
+    assert artifact_header(path) == header
+    # 트리 노드/값 배열은 pickle 스트림 밖의 버퍼로 저장
+    assert bool(header["buffer_bytes"]) == out_of_band
+    assert not list(tmp_path.glob("*.tmp*"))
+
+
+def test_compression_level(tmp_path, artifact):
+    """압축 레벨이 높을수록 파일이 작아짐"""
+    sizes = {}
+    for codec, level in [("none", None), ("zlib", 1), ("zlib", 9)]:
+        path = tmp_path / f"{codec}-{level}.pkl"
+        dump_artifact(artifact, path, codec=codec, level=level)
+        sizes[(codec, level)] = path.stat().st_size
+
+    assert sizes[("zlib", 9)] <= sizes[("zlib", 1)] < sizes[("none", None)]
+    with pytest.raises(ValueError, match="알 수 없는 코덱"):
+        dump_artifact(artifact, tmp_path / "bad.pkl", codec="snappy")
+
+
+def test_checksum_detects_corruption(tmp_path, artifact):
+    """본문이 바뀌거나 잘린 파일은 압축을 풀기 전에 거부"""
+    path = tmp_path / "model.pkl"
+    dump_artifact(artifact, path, codec="none")
+    data = bytearray(path.read_bytes())
+
+    data[-100] ^= 0xFF
+    path.write_bytes(data)
+    with pytest.raises(ChecksumError, match="체크섬"):
+        load_artifact(path)
+    # 검증을 끄면 손상 여부와 상관없이 로드를 시도
+    load_artifact(path, verify=False)
+
+    path.write_bytes(data[:-100])
+    with pytest.raises(ChecksumError, match="잘렸"):
+        load_artifact(path)
+
+
+def test_loads_legacy_joblib_file(tmp_path, artifact):
+    """MAGIC이 없는 기존 joblib 파일도 그대로 로드"""
+    path = tmp_path / "model.pkl"
+    joblib.dump(artifact, path)
+
+    assert not path.read_bytes().startswith(MAGIC)
+    assert artifact_header(path) is None
+    assert load_artifact(path)["version"] == "v1.0"
+
+
+@pytest.mark.parametrize("codec, writeable", [("none", True), ("zlib", False)])
+def test_buffers_stored_per_part(tmp_path, codec, writeable):
+    """버퍼마다 따로 압축, none 코덱만 복사 없이 쓰기 가능한 배열로 복원"""
+    path = tmp_path / "arrays.pkl"
+    arrays = {"a": np.arange(1000.0), "b": np.ones(500)}
+    header = dump_artifact(arrays, path, codec=codec)
+
+    assert len(header["part_bytes"]) == 3
+    assert sum(header["part_bytes"]) == header["stored_bytes"]
+    loaded = load_artifact(path)
+    assert np.array_equal(loaded["a"], arrays["a"])
+    assert loaded["a"].flags.writeable == writeable
@@ -0,0 +1 @@
+"""Benchmarks 테스트 패키지"""
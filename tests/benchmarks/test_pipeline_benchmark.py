@@ -0,0 +1,100 @@
+"""benchmarks/pipeline_benchmark.py에 대한 테스트"""
+
+import pytest
+
+from benchmarks.pipeline_benchmark import (
+    build_cases,
+    case_id,
+    compare_to_baseline,
+    environment_mismatches,
+    format_comparison,
+    load_baseline,
+    run_case,
+)
+
+
+def report_with(stages_by_id):
+    return {
+        "results": [
+            {"id": case, "stages": {s: {"wall_time_s": t} for s, t in stages.items()}}
+            for case, stages in stages_by_id.items()
+        ]
+    }
+
+
+def test_build_cases():
+    """IrisMLPipeline은 크기만, MLflow 파이프라인은 크기 x 하이퍼파라미터"""
+    cases = build_cases(
+        sizes=[None, 1000],
+        param_grid=[
+            {"n_estimators": 10, "max_depth": 3},
+            {"n_estimators": 50, "max_depth": 5},
+        ],
+    )
+
+    assert len(cases) == 6
+    assert case_id(cases[0]) == "IrisMLPipeline/rows=iris"
+    assert case_id(cases[-1]) == (
+        "IrisMLPipelineWithMLflow/rows=1000/max_depth=5/n_estimators=50"
+    )
+    assert len({case_id(case) for case in cases}) == 6
+
+
+def test_compare_to_baseline_flags_regressions():
+    """threshold 이상, 최소 시간 이상 느려진 단계만 회귀"""
+    baseline = report_with(
+        {"a": {"training": 1.0, "data": 0.01, "registry": 1.0}, "old": {"x": 1.0}}
+    )
+    current = report_with(
+        {
+            "a": {"training": 1.5, "data": 0.03, "registry": 1.1, "new_stage": 1.0},
+            "new": {"training": 1.0},
+        }
+    )
+
+    rows, regressions = compare_to_baseline(current, baseline, threshold=0.2)
+
+    assert [(row["id"], row["stage"]) for row in rows] == [
+        ("a", "training"),
+        ("a", "data"),
+        ("a", "registry"),
+    ]
+    # data는 200% 느려졌지만 차이가 측정 잡음 수준이라 제외
+    assert [row["stage"] for row in regressions] == ["training"]
+    assert "⚠️" in format_comparison(rows)
+
+
+def test_load_baseline_requires_file(tmp_path):
+    """기준 결과가 없으면 조용히 넘어가지 않고 FileNotFoundError"""
+    with pytest.raises(FileNotFoundError, match="--update-baseline"):
+        load_baseline(tmp_path / "missing.json")
+
+    path = tmp_path / "baseline.json"
+    path.write_text('{"environment": {}, "results": []}')
+    assert load_baseline(path) == {"environment": {}, "results": []}
+
+
+def test_environment_mismatches():
+    """시간 비교에 영향을 주는 환경 정보만 비교 (커밋, 시각은 제외)"""
+    baseline = {"python": "3.11.4", "cpu_count": 8, "numpy": "1.26.0"}
+    current = {"python": "3.11.4", "cpu_count": 4, "numpy": "1.26.0"}
+
+    assert environment_mismatches(
+        {**current, "git_commit": "b"}, {**baseline, "git_commit": "a"}
+    ) == [("cpu_count", 8, 4)]
+    assert environment_mismatches(baseline, baseline) == []
+
+
+def test_run_case_iris_pipeline(monkeypatch, tmp_path):
+    """실제 파이프라인을 임시 디렉토리에서 실행하고 단계별 결과를 모음"""
+    monkeypatch.chdir(tmp_path)
+    result = run_case({"pipeline": "IrisMLPipeline", "rows": None, "params": {}}, 2)
+
+    assert result["id"] == "IrisMLPipeline/rows=iris"
+    assert result["repeats"] == 2
+    assert set(result["stages"]) == {"data", "training", "evaluation", "serving"}
+    assert result["stages"]["training"]["wall_time_s"] > 0
+    # 시간이 부풀려지지 않도록 tracemalloc 없이 측정
+    assert "tracemalloc_peak_mb" not in result["stages"]["training"]
+    # 파이프라인 산출물은 작업 디렉토리에 남기지 않음
+    assert not (tmp_path / "models").exists()
@@ -0,0 +1,28 @@
+"""benchmarks/scaling.py에 대한 테스트"""
+
+from benchmarks.scaling import format_table, run_scaling
+
+
+def test_run_scaling_small_sizes(tmp_path):
+    """작은 크기로 in-memory/out-of-core 측정이 모두 동작하는지 확인"""
+    report = run_scaling(
+        sizes=[2000, 6000],
+        data_dir=tmp_path,
+        chunk_size=2000,
+        n_estimators=6,
+        max_depth=3,
+        in_memory_max_rows=2000,
+        trace_malloc=False,
+    )
+
+    assert report["environment"]["cpu_count"] > 0
+    small, large = report["results"]
+    assert small["training_mode"] == "in_memory"
+    assert large["training_mode"] == "out_of_core"
+    for result in report["results"]:
+        stages = [stage["stage"] for stage in result["stages"]]
+        assert stages == ["generate", "preprocess", "train", "inference"]
+        assert result["inference_rows_per_s"] > 0
+    # 측정 후 생성한 데이터 파일은 지움
+    assert not list(tmp_path.iterdir())
+    assert "out_of_core" in format_table(report["results"])
@@ -0,0 +1,32 @@
+"""benchmarks/serialization.py에 대한 테스트"""
+
+import app.serialization
+from benchmarks.serialization import format_table, run_benchmark
+
+
+def test_run_benchmark_small_model(monkeypatch):
+    """옵션별 크기/시간 측정, 패키지가 없는 코덱은 건너뛰고 콜드 스타트 추정치 계산"""
+
+    def missing_zstd():
+        raise ImportError("zstandard 없음")
+
+    monkeypatch.setattr(app.serialization, "_zstd", missing_zstd)
+    report = run_benchmark(
+        options=[("joblib", None), ("none", None), ("zlib", 3), ("zstd", 3)],
+        n_rows=2000,
+        n_estimators=5,
+        repeats=1,
+        bandwidth_mbps=100,
+    )
+
+    assert report["environment"]["cpu_count"] > 0
+    codecs = [result["codec"] for result in report["results"]]
+    assert codecs == ["joblib", "none", "zlib"]
+    assert report["skipped"] == ["zstd"]
+
+    sizes = {result["codec"]: result["size_bytes"] for result in report["results"]}
+    assert sizes["zlib"] < sizes["none"]
+    for result in report["results"]:
+        assert result["load_time_ms"] > 0
+        assert result["cold_start_ms"] > result["load_time_ms"]
+    assert "Cold(ms)" in format_table(report["results"])
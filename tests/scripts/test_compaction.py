@@ -0,0 +1,206 @@
+"""compaction.py에 대한 테스트"""
+
+import io
+import sys
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+from scripts.compaction import (
+    MIN_VALIDATION_ROWS,
+    compact_forest,
+    format_report,
+    min_tree_count,
+    prune_tree,
+    select_trees,
+    snap_thresholds_to_float32,
+    split_validation,
+    validation_sets,
+)
+from scripts.synthetic_data import load_synthetic
+
+
+@pytest.fixture(scope="module")
+def iris_split():
+    """Iris train/test 분할과 학습된 포레스트"""
+    X, y = load_iris(return_X_y=True)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+    model = RandomForestClassifier(n_estimators=30, max_depth=5, random_state=42)
+    model.fit(X_train, y_train)
+    return model, X_train, X_test, y_train, y_test
+
+
+@pytest.fixture(scope="module")
+def synthetic_split():
+    """압축 검증에 충분한 크기의 합성 데이터로 학습한 포레스트와 검증 데이터"""
+    X, y = load_synthetic(3000)
+    X_fit, X_val, y_fit, y_val = split_validation(X, y)
+    model = RandomForestClassifier(n_estimators=50, max_depth=8, random_state=42)
+    model.fit(X_fit, y_fit)
+    return (model, *validation_sets(X_val, y_val))
+
+
+def random_inputs(n=5000):
+    """Iris 범위를 넉넉히 덮는 임의 입력"""
+    rng = np.random.default_rng(0)
+    return rng.uniform([4.0, 1.5, 0.5, 0.0], [8.5, 4.5, 7.5, 3.0], size=(n, 4))
+
+
+def test_snap_thresholds_to_float32():
+    """float32로 내린 임계값이 float32 입력에 대해 같은 분기를 만드는지 확인"""
+    thresholds = np.array([2.45, 0.1, 1.0 / 3.0, 5.0])
+    snapped = snap_thresholds_to_float32(thresholds)
+
+    assert np.all(snapped <= thresholds)
+    assert np.array_equal(snapped, snapped.astype(np.float32).astype(np.float64))
+    x = random_inputs().astype(np.float32).astype(np.float64).ravel()
+    for t, s in zip(thresholds, snapped):
+        assert np.array_equal(x <= t, x <= s)
+
+
+def test_prune_tree_keeps_class_predictions(iris_split):
+    """가지치기 후에도 트리의 클래스 예측이 같은지 확인"""
+    model = iris_split[0]
+    X = random_inputs()
+
+    for estimator in model.estimators_[:10]:
+        pruned = prune_tree(estimator.tree_)
+        assert pruned.node_count <= estimator.tree_.node_count
+        original = estimator.tree_.predict(X.astype(np.float32)).argmax(axis=1)
+        compacted = pruned.predict(X.astype(np.float32)).argmax(axis=1)
+        assert np.array_equal(original, compacted)
+
+
+def test_prune_tree_deeper_than_recursion_limit():
+    """재귀 한도보다 깊은 트리도 RecursionError 없이 가지치기"""
+    n = sys.getrecursionlimit() + 500
+    X = np.arange(n, dtype=np.float64).reshape(-1, 1)
+    y = np.arange(n) % 2
+    tree = DecisionTreeClassifier(random_state=0).fit(X, y).tree_
+    assert tree.max_depth > sys.getrecursionlimit()
+
+    pruned = prune_tree(tree)
+    assert pruned.max_depth == tree.max_depth
+    X32 = X.astype(np.float32)
+    assert np.array_equal(
+        pruned.predict(X32).argmax(axis=1), tree.predict(X32).argmax(axis=1)
+    )
+
+
+def test_select_trees_preserves_reference_predictions(iris_split):
+    """선택된 트리만으로도 기준 데이터 예측이 같은지 확인"""
+    model, X_train = iris_split[0], iris_split[1]
+    kept = select_trees(model, X_train)
+
+    assert min_tree_count(model.n_estimators) <= len(kept) <= model.n_estimators
+    proba = np.mean([model.estimators_[i].predict_proba(X_train) for i in kept], 0)
+    assert np.array_equal(proba.argmax(axis=1), model.predict(X_train))
+    assert np.abs(proba - model.predict_proba(X_train)).max() <= 0.05
+
+
+def test_select_trees_keeps_minimum_tree_count(iris_split):
+    """작은 기준 데이터에서도 최소 트리 수 아래로는 제거하지 않음"""
+    model, X_train = iris_split[0], iris_split[1]
+    # 확률 변화를 제한하지 않으면 예측 클래스만 유지하는 트리 하나까지 줄 수 있는 상황
+    kept = select_trees(model, X_train[:12], max_proba_shift=1.0)
+
+    assert min_tree_count(30) == 10
+    assert len(kept) == 10
+    assert min_tree_count(100) == 20
+    assert min_tree_count(5) == 5
+
+
+def test_select_trees_bounds_probability_shift(iris_split):
+    """확률 변화 허용치가 0이면 앙상블 확률을 바꾸는 트리는 제거하지 않음"""
+    model, X_train = iris_split[0], iris_split[1]
+    kept = select_trees(model, X_train, max_proba_shift=0.0)
+
+    proba = np.mean([model.estimators_[i].predict_proba(X_train) for i in kept], 0)
+    assert np.allclose(proba, model.predict_proba(X_train))
+
+
+def test_select_trees_subsamples_large_reference(iris_split):
+    """기준 데이터가 max_rows보다 크면 표본만으로 트리를 선택"""
+    model = iris_split[0]
+    X = random_inputs(50_000)
+    kept = select_trees(model, X, max_rows=500)
+
+    assert min_tree_count(model.n_estimators) <= len(kept) <= model.n_estimators
+    assert np.array_equal(kept, select_trees(model, X, max_rows=500))
+
+
+def test_validation_split_is_disjoint():
+    """압축 검증 데이터는 학습 데이터와 겹치지 않고, 트리 선택/적용 판단용으로 나뉨"""
+    X = np.arange(100).reshape(-1, 1)
+    y = np.arange(100) % 3
+    X_fit, X_val, _, y_val = split_validation(X, y)
+    X_ref, X_check, y_check = validation_sets(X_val, y_val)
+
+    assert len(X_fit) + len(X_val) == 100
+    assert not set(X_fit.ravel()) & set(X_val.ravel())
+    assert not set(X_ref.ravel()) & set(X_check.ravel())
+    assert len(X_ref) + len(X_check) == len(X_val)
+    assert np.array_equal(y_check, X_check.ravel() % 3)
+
+
+def test_compact_forest(synthetic_split):
+    """압축 모델이 더 작고, 정확도/확률을 유지하며, joblib으로 저장/로드되는지 확인"""
+    model, X_ref, X_check, y_check = synthetic_split
+    compacted, report = compact_forest(model, X_ref, X_check, y_check)
+
+    assert report["applied"]
+    assert min_tree_count(50) <= report["n_trees_after"] <= report["n_trees_before"]
+    assert report["node_count_after"] < report["node_count_before"]
+    assert report["size_bytes_after"] < report["size_bytes_before"]
+    assert report["accuracy_after"] >= report["accuracy_before"]
+    assert report["proba_shift"] <= report["max_proba_shift"]
+    assert compacted is not model
+    assert model.n_estimators == 50  # 원본은 변경하지 않음
+    assert "트리" in format_report(report)
+
+    buffer = io.BytesIO()
+    joblib.dump({"model": compacted}, buffer)
+    buffer.seek(0)
+    loaded = joblib.load(buffer)["model"]
+    assert np.array_equal(loaded.predict(X_check), compacted.predict(X_check))
+
+
+def test_compact_forest_reverts_when_accuracy_drops(synthetic_split):
+    """정확도가 허용 오차보다 떨어지면 원본 모델을 반환"""
+    model, X_ref, X_check, y_check = synthetic_split
+    # 정답을 뒤집어 압축 모델 정확도 변화가 있으면 실패하도록 함
+    wrong = (y_check + 1) % 3
+    compacted, report = compact_forest(model, X_ref, X_check, wrong, tolerance=-1.0)
+
+    assert not report["applied"]
+    assert compacted is model
+
+
+def test_compact_forest_reverts_when_probabilities_shift(synthetic_split):
+    """정확도가 같아도 predict_proba가 허용치보다 많이 바뀌면 원본 모델을 반환"""
+    model, X_ref, X_check, y_check = synthetic_split
+    compacted, report = compact_forest(
+        model, X_ref, X_check, y_check, tolerance=1.0, max_proba_shift=0.0
+    )
+
+    assert report["proba_shift"] > 0.0
+    assert not report["applied"]
+    assert compacted is model
+
+
+def test_compact_forest_skips_small_validation_data(iris_split):
+    """검증 데이터가 MIN_VALIDATION_ROWS보다 적으면 (Iris) 압축하지 않음"""
+    model, X_train, X_test, _, y_test = iris_split
+    compacted, report = compact_forest(model, X_train[:12], X_test, y_test)
+
+    assert compacted is model
+    assert report["skipped"] and not report["applied"]
+    assert report["validation_rows"] == 42 < MIN_VALIDATION_ROWS
+    assert "건너뜀" in format_report(report)
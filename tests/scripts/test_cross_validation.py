@@ -0,0 +1,99 @@
+"""cross_validation.py에 대한 테스트"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+
+from scripts.cross_validation import (
+    cross_validate,
+    data_fingerprint,
+    fold_indices,
+    format_report,
+    plan_workers,
+)
+
+PARAMS = {"n_estimators": 20, "max_depth": 3, "random_state": 42}
+
+
+@pytest.fixture(scope="module")
+def iris():
+    return load_iris(return_X_y=True)
+
+
+def test_data_fingerprint_depends_on_content(iris):
+    """내용이 같으면 같은 해시, 한 값이라도 다르면 다른 해시"""
+    X, y = iris
+    changed = X.copy()
+    changed[0, 0] += 0.1
+
+    assert data_fingerprint(X, y) == data_fingerprint(X.copy(), y.copy())
+    assert data_fingerprint(X, y) != data_fingerprint(changed, y)
+
+
+def test_fold_indices_partition_and_stratify(iris, tmp_path):
+    """fold들의 test 부분이 전체 행을 한 번씩 덮고 클래스 비율이 유지되는지 확인"""
+    X, y = iris
+    folds, cached = fold_indices(X, y, n_splits=5, cache_dir=tmp_path)
+
+    assert not cached
+    assert len(folds) == 5
+    test_rows = np.concatenate([test for _, test in folds])
+    assert np.array_equal(np.sort(test_rows), np.arange(len(y)))
+    for train, test in folds:
+        assert len(np.intersect1d(train, test)) == 0
+        assert len(train) + len(test) == len(y)
+        assert np.array_equal(np.bincount(y[test]), [10, 10, 10])
+
+
+def test_fold_indices_reused_from_cache(iris, tmp_path, monkeypatch):
+    """같은 데이터/k/seed는 디스크 캐시에서 같은 fold를 불러옴"""
+    X, y = iris
+    folds, _ = fold_indices(X, y, n_splits=5, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    import sklearn.model_selection
+
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시가 있으면 fold를 다시 만들지 않아야 합니다")
+
+    monkeypatch.setattr(sklearn.model_selection, "StratifiedKFold", fail)
+    cached_folds, cached = fold_indices(X, y, n_splits=5, cache_dir=tmp_path)
+
+    assert cached
+    for (train, test), (cached_train, cached_test) in zip(folds, cached_folds):
+        assert np.array_equal(train, cached_train)
+        assert np.array_equal(test, cached_test)
+
+
+def test_plan_workers_respects_core_budget():
+    """worker 수 * n_jobs가 코어 예산을 넘지 않음"""
+    assert plan_workers(5, max_cores=1) == (1, 1)
+    assert plan_workers(5, max_cores=4) == (4, 1)
+    assert plan_workers(5, max_cores=16) == (5, 3)
+    assert plan_workers(3, max_cores=8) == (3, 2)
+
+
+def test_cross_validate_matches_sequential(iris, tmp_path):
+    """병렬 실행 결과가 fold를 하나씩 학습한 결과와 같은지 확인"""
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = iris
+    result = cross_validate(PARAMS, X, y, n_splits=3, max_cores=2, cache_dir=tmp_path)
+
+    assert result["workers"] == 2
+    assert result["n_jobs_per_worker"] == 1
+    assert len(result["folds"]) == 3
+
+    folds, _ = fold_indices(X, y, n_splits=3, cache_dir=tmp_path)
+    expected = []
+    for train, test in folds:
+        model = RandomForestClassifier(**PARAMS).fit(X[train], y[train])
+        expected.append(np.mean(model.predict(X[test]) == y[test]))
+    assert [fold["accuracy"] for fold in result["folds"]] == pytest.approx(expected)
+    assert result["mean"]["accuracy"] == pytest.approx(np.mean(expected))
+    assert result["std"]["accuracy"] == pytest.approx(np.std(expected))
+    assert result["mean"]["accuracy"] > 0.9
+
+    report = format_report(result)
+    assert "3-fold" in report
+    assert "fold 2" in report
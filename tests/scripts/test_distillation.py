@@ -0,0 +1,76 @@
+"""distillation.py에 대한 테스트"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+
+from scripts.distillation import (
+    augment_inputs,
+    distill_forest,
+    distillation_report,
+    format_report,
+)
+
+
+@pytest.fixture(scope="module")
+def iris_forest():
+    """Iris train/test 분할과 학습된 포레스트"""
+    X, y = load_iris(return_X_y=True)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+    model = RandomForestClassifier(n_estimators=50, max_depth=5, random_state=42)
+    model.fit(X_train, y_train)
+    return model, X_train, X_test, y_test
+
+
+def test_augment_inputs_stays_near_training_data(iris_forest):
+    """합성 입력은 학습 입력 주변에 생성"""
+    _, X_train, _, _ = iris_forest
+    X_synthetic = augment_inputs(X_train, 500)
+
+    assert X_synthetic.shape == (500, 4)
+    assert np.allclose(X_synthetic.mean(axis=0), X_train.mean(axis=0), atol=0.3)
+    assert np.array_equal(X_synthetic, augment_inputs(X_train, 500))
+
+
+def test_distill_forest_mimics_teacher(iris_forest):
+    """얕은 결정 트리가 교사의 예측과 확률을 따라가는지 확인"""
+    model, X_train, X_test, _ = iris_forest
+    student = distill_forest(model, X_train, max_depth=4)
+
+    assert isinstance(student, DecisionTreeClassifier)
+    assert student.get_depth() <= 4
+    assert np.array_equal(student.classes_, model.classes_)
+    assert np.mean(student.predict(X_test) == model.predict(X_test)) >= 0.95
+    # soft label 학습이므로 확률도 0/1이 아니라 교사의 확률에 가까움
+    assert (
+        np.abs(student.predict_proba(X_test) - model.predict_proba(X_test)).mean()
+        < 0.05
+    )
+
+
+def test_distillation_report(iris_forest):
+    """일치율, 확률 오차, 지연시간 비교 항목 확인"""
+    model, X_train, X_test, y_test = iris_forest
+    student = distill_forest(model, X_train, max_depth=3, n_synthetic=0)
+    report = distillation_report(model, student, X_test, y_test)
+
+    for key in (
+        "agreement_rate",
+        "nearby_agreement_rate",
+        "proba_mae",
+        "node_count",
+        "accuracy",
+        "single_row_latency_p50_ms",
+        "single_row_latency_p99_ms",
+        "speedup",
+    ):
+        assert key in report
+    assert 0 <= report["agreement_rate"] <= 1
+    assert report["node_count"] <= 15
+    assert report["speedup"] > 1
+    assert "일치율" in format_report(report)
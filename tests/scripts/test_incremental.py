@@ -0,0 +1,98 @@
+"""incremental.py에 대한 테스트"""
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from scripts.incremental import (
+    evaluate,
+    grow_forest,
+    load_local_model,
+    load_new_data,
+    split_holdout,
+)
+from scripts.synthetic_data import load_synthetic
+
+
+@pytest.fixture(scope="module")
+def parent_forest():
+    X, y = load_iris(return_X_y=True)
+    return RandomForestClassifier(n_estimators=30, max_depth=4, random_state=42).fit(
+        X, y
+    )
+
+
+def test_grow_forest_keeps_old_trees(parent_forest):
+    """기존 트리는 그대로 두고 새 데이터로 학습한 트리만 추가"""
+    X_new, y_new = load_synthetic(300, seed=7)
+    updated = grow_forest(parent_forest, X_new, y_new, n_new_trees=10)
+
+    assert len(updated.estimators_) == 40
+    assert updated.n_estimators == 40
+    assert not updated.warm_start
+    assert all(
+        a is not b for a, b in zip(updated.estimators_, parent_forest.estimators_)
+    )
+    for old, kept in zip(parent_forest.estimators_, updated.estimators_[:30]):
+        assert np.array_equal(old.tree_.threshold, kept.tree_.threshold)
+    # 원본 모델은 바뀌지 않음
+    assert len(parent_forest.estimators_) == 30
+    assert evaluate(updated, X_new, y_new)["accuracy"] > 0.9
+
+
+def test_grow_forest_retires_oldest_trees(parent_forest):
+    """retire_oldest개의 가장 오래된 트리를 제거해 크기 유지"""
+    X_new, y_new = load_synthetic(300, seed=7)
+    grown = grow_forest(parent_forest, X_new, y_new, n_new_trees=10)
+    updated = grow_forest(parent_forest, X_new, y_new, n_new_trees=10, retire_oldest=10)
+
+    assert len(updated.estimators_) == 30
+    for expected, kept in zip(grown.estimators_[10:], updated.estimators_):
+        assert np.array_equal(expected.tree_.threshold, kept.tree_.threshold)
+
+
+def test_grow_forest_rejects_missing_classes(parent_forest):
+    """새 데이터에 없는 클래스가 있으면 warm start 학습을 거부"""
+    X_new, y_new = load_synthetic(300, seed=7)
+    mask = y_new != 2
+
+    with pytest.raises(ValueError, match="클래스"):
+        grow_forest(parent_forest, X_new[mask], y_new[mask])
+    with pytest.raises(ValueError):
+        grow_forest(parent_forest, X_new, y_new, n_new_trees=5, retire_oldest=35)
+    with pytest.raises(ValueError, match="retire_oldest"):
+        grow_forest(parent_forest, X_new, y_new, n_new_trees=5, retire_oldest=-1)
+
+
+def test_load_local_model_and_new_data(tmp_path, parent_forest):
+    """로컬 모델 파일과 CSV 새 데이터 로드, held-out 분할"""
+    joblib.dump(
+        {"model": parent_forest, "version": "v1", "mlflow_run_id": "run-1"},
+        tmp_path / "model.pkl",
+    )
+    model, info = load_local_model(tmp_path / "model.pkl")
+    assert info == {"version": "v1", "run_id": "run-1", "source": "local"}
+    assert len(model.estimators_) == 30
+
+    X, y = load_synthetic(100, seed=3)
+    df = pd.DataFrame(
+        X, columns=["sepal_length", "sepal_width", "petal_length", "petal_width"]
+    )
+    df["target"] = y
+    df.to_csv(tmp_path / "new.csv", index=False)
+
+    X_loaded, y_loaded = load_new_data(tmp_path / "new.csv", chunk_size=30)
+    assert X_loaded.shape == (100, 4)
+    assert np.array_equal(y_loaded, y)
+
+    _, _, _, y_test = split_holdout(X_loaded, y_loaded)
+    assert len(y_test) == 20
+    assert set(y_test) == set(y)
+
+    with pytest.raises(FileNotFoundError):
+        load_local_model(tmp_path / "missing.pkl")
+    with pytest.raises(ValueError):
+        load_new_data()
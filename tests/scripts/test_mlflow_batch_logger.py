@@ -0,0 +1,125 @@
+"""mlflow_batch_logger.py에 대한 테스트"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.mlflow_batch_logger import (
+    MAX_ENTITIES_PER_BATCH,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_PER_BATCH,
+    MAX_TAGS_PER_BATCH,
+    BatchedRunLogger,
+)
+
+
+def test_buffers_until_flush():
+    """flush 전에는 전송하지 않고, flush 시 한 번의 log_batch로 전송"""
+    client = MagicMock()
+    logger = BatchedRunLogger(client, "run-1")
+
+    logger.log_params({"n_estimators": 100, "max_depth": 5})
+    logger.log_metric("accuracy", 0.9)
+    logger.log_metrics({"f1_score": 0.8, "recall": 0.7})
+    logger.set_tag("validation", "passed")
+    logger.set_tags({"framework": "scikit-learn"})
+    client.log_batch.assert_not_called()
+
+    logger.close()
+
+    client.log_batch.assert_called_once()
+    args, kwargs = client.log_batch.call_args
+    assert args == ("run-1",)
+    assert {p.key: p.value for p in kwargs["params"]} == {
+        "n_estimators": "100",
+        "max_depth": "5",
+    }
+    assert {m.key: m.value for m in kwargs["metrics"]} == {
+        "accuracy": 0.9,
+        "f1_score": 0.8,
+        "recall": 0.7,
+    }
+    assert {t.key for t in kwargs["tags"]} == {"validation", "framework"}
+
+
+def test_flush_splits_into_batch_limits():
+    """log_batch 한 번의 크기 제한을 넘으면 여러 번 나눠서 전송"""
+    client = MagicMock()
+    logger = BatchedRunLogger(client, "run-1")
+
+    logger.log_metrics({f"m{i}": i for i in range(MAX_METRICS_PER_BATCH + 1)})
+    logger.log_params({f"p{i}": i for i in range(MAX_PARAMS_PER_BATCH * 2 + 1)})
+    logger.flush()
+
+    sizes = [
+        (len(call.kwargs["metrics"]), len(call.kwargs["params"]))
+        for call in client.log_batch.call_args_list
+    ]
+    # 한 번에 보내는 전체 개수도 MAX_ENTITIES_PER_BATCH를 넘지 않음
+    first = MAX_ENTITIES_PER_BATCH - MAX_PARAMS_PER_BATCH
+    assert sizes == [
+        (first, MAX_PARAMS_PER_BATCH),
+        (MAX_METRICS_PER_BATCH + 1 - first, MAX_PARAMS_PER_BATCH),
+        (0, 1),
+    ]
+
+    # 이미 전송한 기록은 다시 보내지 않음
+    logger.flush()
+    assert client.log_batch.call_count == 3
+    logger.close()
+
+
+def test_flush_limits_total_entities_per_batch():
+    """메트릭/파라미터/태그가 모두 가득 차도 요청마다 합계가 제한 이하"""
+    client = MagicMock()
+    logger = BatchedRunLogger(client, "run-1")
+
+    logger.log_metrics({f"m{i}": i for i in range(MAX_METRICS_PER_BATCH)})
+    logger.log_params({f"p{i}": i for i in range(MAX_PARAMS_PER_BATCH)})
+    logger.set_tags({f"t{i}": i for i in range(MAX_TAGS_PER_BATCH)})
+    logger.close()
+
+    totals = [
+        sum(len(call.kwargs[kind]) for kind in ("metrics", "params", "tags"))
+        for call in client.log_batch.call_args_list
+    ]
+    assert max(totals) <= MAX_ENTITIES_PER_BATCH
+    assert sum(totals) == MAX_METRICS_PER_BATCH + MAX_PARAMS_PER_BATCH * 2
+
+
+def test_submit_runs_in_background_and_close_waits():
+    """submit한 작업은 백그라운드에서 실행되고 close가 완료를 기다림"""
+    client = MagicMock()
+    release = threading.Event()
+    done = []
+
+    def upload():
+        release.wait(timeout=5)
+        done.append(threading.current_thread().name)
+
+    logger = BatchedRunLogger(client, "run-1")
+    logger.submit(upload)
+    assert done == []
+
+    release.set()
+    logger.close()
+
+    assert len(done) == 1
+    assert done[0].startswith("mlflow-upload")
+
+
+def test_background_error_is_raised_after_flush():
+    """백그라운드 작업의 예외를 다시 발생시키되, 버퍼는 먼저 전송"""
+    client = MagicMock()
+
+    def upload():
+        raise RuntimeError("upload failed")
+
+    logger = BatchedRunLogger(client, "run-1")
+    logger.log_metric("accuracy", 0.9)
+    logger.submit(upload)
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        logger.close()
+    client.log_batch.assert_called_once()
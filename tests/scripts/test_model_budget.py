@@ -0,0 +1,66 @@
+"""model_budget.py에 대한 테스트"""
+
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+from scripts.model_budget import (
+    benchmark_model,
+    check_budgets,
+    count_nodes,
+    serialized_size_bytes,
+)
+
+
+@pytest.fixture(scope="module")
+def iris_model():
+    """예산 검사용 작은 모델"""
+    X, y = load_iris(return_X_y=True)
+    model = RandomForestClassifier(n_estimators=5, max_depth=3, random_state=42)
+    model.fit(X, y)
+    return model, X
+
+
+def test_count_nodes(iris_model):
+    """포레스트 전체 노드 수가 트리별 노드 수의 합인지 확인"""
+    model, _ = iris_model
+    expected = sum(tree.tree_.node_count for tree in model.estimators_)
+    assert count_nodes(model) == expected
+    assert count_nodes(model.estimators_[0]) == model.estimators_[0].tree_.node_count
+
+
+def test_benchmark_model(iris_model):
+    """지연시간/크기 측정 결과 형식 확인"""
+    model, X = iris_model
+    report = benchmark_model(model, X[:10], batch_size=64, repeats=5, warmup=1)
+
+    assert report["batch_size"] == 64
+    assert (
+        0 < report["single_row_latency_p50_ms"] <= report["single_row_latency_p99_ms"]
+    )
+    assert 0 < report["batch_latency_p50_ms"] <= report["batch_latency_p99_ms"]
+    assert report["serialized_size_mb"] * 1024 * 1024 == serialized_size_bytes(model)
+    assert report["node_count"] == count_nodes(model)
+
+
+def test_check_budgets():
+    """예산 초과 항목만 보고되는지 확인"""
+    report = {
+        "single_row_latency_p99_ms": 5.0,
+        "batch_latency_p99_ms": 20.0,
+        "serialized_size_mb": 0.5,
+        "node_count": 1000,
+    }
+
+    assert check_budgets(report) == []
+    violations = check_budgets(
+        report, {"max_single_row_p99_ms": 1.0, "max_node_count": 500}
+    )
+    assert len(violations) == 2
+    assert any("node_count" in v for v in violations)
+
+
+def test_check_budgets_unknown_key():
+    """알 수 없는 예산 항목은 ValueError"""
+    with pytest.raises(ValueError):
+        check_budgets({}, {"max_anything": 1})
@@ -0,0 +1,168 @@
+"""out_of_core.py에 대한 테스트"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+
+from scripts.out_of_core import (
+    FEATURE_NAMES,
+    TARGET_COLUMN,
+    ChunkedDataSource,
+    confusion_in_chunks,
+    fit_forest_in_chunks,
+    iter_split_chunks,
+    metrics_from_confusion,
+)
+
+
+def write_iris(path):
+    """Iris 데이터를 파일로 저장 (형식은 확장자로 결정)"""
+    iris = load_iris()
+    if path.suffix == ".npy":
+        np.save(path, np.column_stack([iris.data, iris.target]))
+    else:
+        df = pd.DataFrame(iris.data, columns=FEATURE_NAMES)
+        df[TARGET_COLUMN] = iris.target
+        if path.suffix == ".csv":
+            df.to_csv(path, index=False)
+        else:
+            df.to_parquet(path, index=False)
+    return iris
+
+
+class TestChunkedDataSource:
+    """ChunkedDataSource 클래스 테스트"""
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet", ".npy"])
+    def test_reads_all_rows_in_chunks(self, tmp_path, suffix):
+        """모든 형식에서 청크 크기대로 전체 데이터를 읽는지 확인"""
+        path = tmp_path / f"iris{suffix}"
+        iris = write_iris(path)
+
+        chunks = list(ChunkedDataSource(path, chunk_size=40))
+
+        assert [len(y) for _, y in chunks] == [40, 40, 40, 30]
+        X = np.concatenate([X for X, _ in chunks])
+        y = np.concatenate([y for _, y in chunks])
+        assert np.allclose(X, iris.data)
+        assert np.array_equal(y, iris.target)
+
+    def test_rejects_unknown_format(self, tmp_path):
+        """지원하지 않는 형식은 ValueError"""
+        path = tmp_path / "iris.txt"
+        path.write_text("")
+        with pytest.raises(ValueError):
+            ChunkedDataSource(path)
+
+    def test_missing_columns(self, tmp_path):
+        """필수 컬럼이 없으면 ValueError"""
+        path = tmp_path / "bad.csv"
+        pd.DataFrame({"a": [1.0]}).to_csv(path, index=False)
+        with pytest.raises(ValueError):
+            list(ChunkedDataSource(path))
+
+
+def test_split_is_deterministic_and_disjoint(tmp_path):
+    """같은 소스를 다시 읽어도 train/test 분할이 동일하고 겹치지 않음"""
+    path = tmp_path / "iris.csv"
+    write_iris(path)
+    source = ChunkedDataSource(path, chunk_size=50)
+
+    train = np.concatenate([X for X, _ in iter_split_chunks(source, "train")])
+    test = np.concatenate([X for X, _ in iter_split_chunks(source, "test")])
+    test_again = np.concatenate([X for X, _ in iter_split_chunks(source, "test")])
+
+    assert len(train) + len(test) == 150
+    assert np.array_equal(test, test_again)
+
+
+def test_validation_split_comes_out_of_train(tmp_path):
+    """validation은 train에서만 떼어 내고, test 분할은 그대로 유지"""
+    path = tmp_path / "iris.csv"
+    write_iris(path)
+    source = ChunkedDataSource(path, chunk_size=50)
+
+    def rows(subset, validation_size):
+        chunks = iter_split_chunks(source, subset, validation_size=validation_size)
+        return np.concatenate([X for X, _ in chunks])
+
+    train = rows("train", 0.2)
+    validation = rows("validation", 0.2)
+    assert np.array_equal(rows("test", 0.2), rows("test", 0.0))
+    assert len(train) + len(validation) == len(rows("train", 0.0))
+    assert len(validation) > 0
+    assert list(iter_split_chunks(source, "validation")) == []
+
+
+def test_fit_forest_in_chunks_merges_estimators():
+    """청크별 포레스트가 하나의 RandomForestClassifier로 병합되는지 확인"""
+    iris = load_iris()
+    order = np.random.default_rng(0).permutation(150)
+    X, y = iris.data[order], iris.target[order]
+    chunks = [(X[i : i + 50], y[i : i + 50]) for i in range(0, 150, 50)]
+
+    model = fit_forest_in_chunks(chunks, classes=range(3), trees_per_chunk=5)
+
+    assert model.n_estimators == 15
+    assert len(model.estimators_) == 15
+    assert accuracy_score(y, model.predict(X)) > 0.9
+    assert model.predict_proba(X).shape == (150, 3)
+
+
+def test_fit_forest_in_chunks_caps_total_trees():
+    """청크 수가 많아도 트리 수는 max_trees로 제한되고 여러 청크의 트리가 섞임"""
+    iris = load_iris()
+    order = np.random.default_rng(0).permutation(150)
+    X, y = iris.data[order], iris.target[order]
+    chunks = [(X, y)] * 10
+
+    model = fit_forest_in_chunks(
+        chunks, classes=range(3), trees_per_chunk=5, max_trees=12
+    )
+
+    assert model.n_estimators == len(model.estimators_) == 12
+    seeds = {tree.random_state for tree in model.estimators_}
+    assert len(seeds) == 12
+    assert accuracy_score(y, model.predict(X)) > 0.9
+
+
+def test_fit_forest_in_chunks_buffers_incomplete_chunks():
+    """클래스가 부족한 청크는 다음 청크와 합쳐서 학습"""
+    iris = load_iris()
+    # 정렬된 Iris는 50개씩 한 클래스만 포함
+    chunks = [
+        (iris.data[i : i + 50], iris.target[i : i + 50]) for i in range(0, 150, 50)
+    ]
+
+    model = fit_forest_in_chunks(chunks, classes=range(3), trees_per_chunk=4)
+
+    assert model.n_estimators == 4
+    assert list(model.classes_) == [0, 1, 2]
+
+
+def test_metrics_from_confusion_matches_sklearn():
+    """혼동 행렬 기반 메트릭이 sklearn 결과와 같은지 확인"""
+    iris = load_iris()
+    model = fit_forest_in_chunks(
+        [(iris.data, iris.target)], classes=range(3), trees_per_chunk=3, max_depth=1
+    )
+    chunks = [
+        (iris.data[i : i + 32], iris.target[i : i + 32]) for i in range(0, 150, 32)
+    ]
+
+    confusion = confusion_in_chunks(model, chunks, n_classes=3)
+    metrics = metrics_from_confusion(confusion)
+
+    y_pred = model.predict(iris.data)
+    expected = {
+        "accuracy": accuracy_score(iris.target, y_pred),
+        "f1_score": f1_score(iris.target, y_pred, average="weighted"),
+        "precision": precision_score(
+            iris.target, y_pred, average="weighted", zero_division=0
+        ),
+        "recall": recall_score(iris.target, y_pred, average="weighted"),
+    }
+    for name, value in expected.items():
+        assert metrics[name] == pytest.approx(value)
@@ -0,0 +1,39 @@
+"""reference_stats.py에 대한 테스트"""
+
+import json
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+
+from scripts.reference_stats import compute_reference_stats, save_reference_stats
+
+
+def test_bins_follow_quantiles():
+    """구간 경계는 분위수, 구간별 비율의 합은 1"""
+    X = np.random.default_rng(0).normal(size=(1000, 2))
+
+    stats = compute_reference_stats(X, feature_names=["a", "b"], n_bins=10)
+
+    assert stats["feature_names"] == ["a", "b"]
+    assert stats["n_samples"] == 1000
+    for edges, fractions in zip(stats["bin_edges"], stats["bin_fractions"]):
+        assert len(edges) == 9
+        assert len(fractions) == 10
+        assert sum(fractions) == pytest.approx(1.0)
+        assert fractions == pytest.approx([0.1] * 10, abs=0.01)
+
+
+def test_duplicate_quantiles_are_merged(tmp_path):
+    """값이 몰려 있어 분위수가 겹치면 구간을 합치고, JSON으로 저장 가능"""
+    X = load_iris().data
+
+    stats = compute_reference_stats(X)
+
+    # petal_width는 값 종류가 적어 분위수가 겹침
+    edges = stats["bin_edges"][3]
+    assert edges == sorted(set(edges))
+    assert len(stats["bin_fractions"][3]) == len(edges) + 1
+
+    path = save_reference_stats(stats, tmp_path / "models" / "reference_stats.json")
+    assert json.loads(path.read_text()) == stats
@@ -0,0 +1,156 @@
+"""stage_graph.py에 대한 테스트"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from scripts.stage_graph import (
+    StageGraph,
+    add_data_stages,
+    load_dataset,
+    preprocess_features,
+)
+
+
+def make_counting_graph(cache_dir, calls, scale=2, offset=1):
+    """a → (b, c) → d 그래프 (단계별 실행 횟수를 calls에 기록)"""
+
+    def stage(name, fn):
+        def run(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return fn(*args, **kwargs)
+
+        run.__qualname__ = f"stage_{name}"
+        return run
+
+    graph = StageGraph(cache_dir=cache_dir)
+    graph.add("a", stage("a", lambda: np.arange(5)))
+    graph.add("b", stage("b", lambda a, scale: a * scale), ("a",), {"scale": scale})
+    graph.add("c", stage("c", lambda a, offset: a + offset), ("a",), {"offset": offset})
+    graph.add("d", stage("d", lambda b, c: int((b + c).sum())), ("b", "c"))
+    return graph
+
+
+def test_run_resolves_dependencies(tmp_path):
+    """targets와 그 입력 단계만 실행"""
+    calls = {}
+    graph = make_counting_graph(tmp_path, calls)
+
+    assert np.array_equal(graph.run(["b"])["b"], np.arange(5) * 2)
+    assert calls == {"a": 1, "b": 1}
+    assert graph.run(["d"])["d"] == 35
+    # 이미 실행한 단계는 다시 실행하지 않음
+    assert calls == {"a": 1, "b": 1, "c": 1, "d": 1}
+
+
+def test_outputs_memoized_on_disk(tmp_path):
+    """같은 파라미터로 다시 만든 그래프는 모든 단계를 캐시에서 불러옴"""
+    calls = {}
+    make_counting_graph(tmp_path, calls).run()
+    graph = make_counting_graph(tmp_path, calls)
+
+    assert graph.run(["d"])["d"] == 35
+    assert calls == {"a": 1, "b": 1, "c": 1, "d": 1}
+    assert sorted(graph.cached_stages()) == ["a", "b", "c", "d"]
+
+
+def test_param_change_reruns_only_downstream(tmp_path):
+    """c의 파라미터만 바꾸면 c와 그 하위 단계 d만 다시 실행"""
+    calls = {}
+    make_counting_graph(tmp_path, calls).run()
+    graph = make_counting_graph(tmp_path, calls, offset=3)
+
+    assert graph.run(["d"])["d"] == 45
+    assert calls == {"a": 1, "b": 1, "c": 2, "d": 2}
+    assert sorted(graph.executed_stages()) == ["c", "d"]
+    assert sorted(graph.cached_stages()) == ["a", "b"]
+
+
+def test_function_change_invalidates_stage(tmp_path):
+    """바이트코드가 같아도 상수, 기본 인자, 감싼 함수, 버전이 바뀌면 다시 실행"""
+
+    def executed(fn, version=None):
+        fn.__qualname__ = "value"
+        graph = StageGraph(cache_dir=tmp_path)
+        graph.add("value", fn, version=version)
+        graph.run()
+        return graph.executed_stages() == ["value"]
+
+    def wrapped(fn):
+        def run():
+            return fn()
+
+        return run
+
+    assert executed(lambda: 1)
+    assert not executed(lambda: 1)
+    # 상수만 다름
+    assert executed(lambda: 2)
+    # 기본 인자만 다름
+    assert executed(lambda scale=2: scale)
+    assert not executed(lambda scale=2: scale)
+    assert executed(lambda scale=3: scale)
+    # 래퍼의 코드는 같고 감싼 함수의 상수만 다름
+    assert executed(wrapped(lambda: 10))
+    assert not executed(wrapped(lambda: 10))
+    assert executed(wrapped(lambda: 11))
+    # 함수가 같아도 단계 버전을 올리면 다시 실행
+    assert executed(lambda: 2, version=2)
+    assert not executed(lambda: 2, version=2)
+
+
+def test_uncached_stage_always_runs(tmp_path):
+    """cache=False 단계는 캐시가 있어도 매번 실행"""
+    runs = []
+    for _ in range(2):
+        graph = StageGraph(cache_dir=tmp_path)
+        graph.add("value", lambda: 1)
+        graph.add(
+            "side_effect", lambda value: runs.append(value), ("value",), cache=False
+        )
+        graph.run()
+
+    assert runs == [1, 1]
+    assert graph.cached_stages() == ["value"]
+
+
+def test_independent_stages_run_concurrently():
+    """서로 의존하지 않는 단계는 동시에 실행 (둘 다 barrier에 도달해야 통과)"""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait_for_other(a):
+        barrier.wait()
+        return a
+
+    graph = StageGraph()
+    graph.add("a", lambda: 1)
+    graph.add("left", wait_for_other, ("a",))
+    graph.add("right", wait_for_other, ("a",))
+
+    assert graph.run(["left", "right"]) == {"left": 1, "right": 1}
+
+
+def test_invalid_graph_rejected():
+    graph = StageGraph()
+    graph.add("a", lambda: 1)
+
+    with pytest.raises(ValueError, match="알 수 없는 입력"):
+        graph.add("b", lambda x: x, ("missing",))
+    with pytest.raises(ValueError, match="이미 있는"):
+        graph.add("a", lambda: 2)
+    with pytest.raises(KeyError):
+        graph.run(["missing"])
+
+
+def test_shared_data_stages(tmp_path):
+    """공유 데이터 단계: Iris 로드 → 전처리 → 8:2 분할 → 기준 통계"""
+    graph = add_data_stages(StageGraph(cache_dir=tmp_path))
+    outputs = graph.run(["split", "reference_stats"])
+
+    X_train, X_test, _, _ = outputs["split"]
+    assert (len(X_train), len(X_test)) == (120, 30)
+    assert outputs["reference_stats"]["n_samples"] == 120
+
+    X, _ = load_dataset()
+    assert np.array_equal(preprocess_features(X, verbose=False), X)
@@ -0,0 +1,65 @@
+"""stage_profiler.py에 대한 테스트"""
+
+import json
+import time
+import tracemalloc
+
+from scripts.stage_profiler import StageProfiler
+
+
+class TestStageProfiler:
+    """StageProfiler 클래스 테스트"""
+
+    def test_stage_records_costs(self):
+        """단계별 시간과 메모리 peak가 기록되는지 확인"""
+        profiler = StageProfiler()
+
+        with profiler.stage("data"):
+            buffer = bytearray(4 * 1024 * 1024)
+            time.sleep(0.01)
+        del buffer
+
+        (result,) = profiler.results
+        assert result["stage"] == "data"
+        assert result["wall_time_s"] >= 0.01
+        assert result["cpu_time_s"] >= 0
+        assert result["tracemalloc_peak_mb"] >= 4
+        # 측정을 위해 시작한 tracemalloc은 단계가 끝나면 정지
+        assert not tracemalloc.is_tracing()
+
+    def test_stage_records_on_exception(self):
+        """단계에서 예외가 나도 측정 결과는 남는지 확인"""
+        profiler = StageProfiler(trace_malloc=False)
+
+        try:
+            with profiler.stage("training"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert profiler.results[0]["stage"] == "training"
+        assert profiler.results[0]["tracemalloc_peak_mb"] is None
+
+    def test_as_metrics_and_summary(self):
+        """MLflow 메트릭 이름과 요약 표 형식 확인"""
+        profiler = StageProfiler(trace_malloc=False)
+        with profiler.stage("evaluation"):
+            pass
+
+        metrics = profiler.as_metrics()
+        assert "stage_evaluation_wall_time_s" in metrics
+        assert "stage_evaluation_cpu_time_s" in metrics
+        assert "stage_evaluation_tracemalloc_peak_mb" not in metrics
+        assert "evaluation" in profiler.summary_table()
+
+    def test_write_json(self, tmp_path):
+        """JSON 출력에 단계 결과와 추가 정보가 포함되는지 확인"""
+        profiler = StageProfiler(trace_malloc=False)
+        with profiler.stage("serving"):
+            pass
+
+        path = profiler.write_json(tmp_path / "out" / "profile.json", pipeline="X")
+
+        payload = json.loads(path.read_text())
+        assert payload["pipeline"] == "X"
+        assert payload["stages"][0]["stage"] == "serving"
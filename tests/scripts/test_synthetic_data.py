@@ -0,0 +1,68 @@
+"""synthetic_data.py에 대한 테스트"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+
+from scripts.out_of_core import ChunkedDataSource
+from scripts.synthetic_data import (
+    SyntheticDataSource,
+    generate_chunk,
+    iter_synthetic_chunks,
+    load_synthetic,
+    write_synthetic_dataset,
+)
+
+
+def test_generate_chunk_is_deterministic():
+    """같은 seed와 청크 번호는 항상 같은 데이터, 다른 청크는 다른 데이터"""
+    X1, y1 = generate_chunk(1000, chunk_index=3, seed=7)
+    X2, y2 = generate_chunk(1000, chunk_index=3, seed=7)
+    X3, _ = generate_chunk(1000, chunk_index=4, seed=7)
+
+    assert np.array_equal(X1, X2)
+    assert np.array_equal(y1, y2)
+    assert not np.array_equal(X1, X3)
+
+
+def test_follows_iris_class_distributions():
+    """클래스별 평균과 비율이 Iris와 비슷"""
+    X_iris, y_iris = load_iris(return_X_y=True)
+    X, y = load_synthetic(60_000, chunk_size=25_000)
+
+    assert X.shape == (60_000, 4)
+    assert (X > 0).all()
+    assert np.allclose(np.bincount(y) / len(y), 1 / 3, atol=0.01)
+    for c in range(3):
+        assert np.allclose(
+            X[y == c].mean(axis=0), X_iris[y_iris == c].mean(axis=0), atol=0.05
+        )
+
+
+def test_chunks_cover_requested_rows():
+    """마지막 청크는 남은 행 수만큼만 생성"""
+    sizes = [len(y) for _, y in iter_synthetic_chunks(2500, chunk_size=1000)]
+    assert sizes == [1000, 1000, 500]
+
+    source = SyntheticDataSource(2500, chunk_size=1000)
+    assert sum(len(y) for _, y in source) == 2500
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".csv"])
+def test_write_synthetic_dataset_is_readable(tmp_path, suffix):
+    """청크 단위로 쓴 파일을 ChunkedDataSource로 그대로 읽음"""
+    path = write_synthetic_dataset(tmp_path / f"data{suffix}", 2500, chunk_size=1000)
+
+    chunks = list(ChunkedDataSource(path, chunk_size=1000))
+    X = np.concatenate([X for X, _ in chunks])
+    y = np.concatenate([y for _, y in chunks])
+    X_expected, y_expected = load_synthetic(2500, chunk_size=1000)
+
+    assert np.array_equal(y, y_expected)
+    assert np.allclose(X, X_expected, atol=1e-4)
+
+
+def test_rejects_unknown_format(tmp_path):
+    """지원하지 않는 확장자는 ValueError"""
+    with pytest.raises(ValueError):
+        write_synthetic_dataset(tmp_path / "data.txt", 10)
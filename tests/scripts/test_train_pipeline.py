@@ -1,11 +1,12 @@
 """train_pipeline.py에 대한 테스트"""
 
+import json
 import tempfile
 from pathlib import Path
 
-import joblib
 import numpy as np
 
+from app.serialization import artifact_header, load_artifact
 from scripts.train_pipeline import IrisMLPipeline
 
 
@@ -33,6 +34,35 @@ class TestIrisMLPipeline:
         assert X_train.shape[1] == 4  # 4개 특성
         assert X_test.shape[1] == 4
 
+    def test_data_pipeline_synthetic(self):
+        """합성 데이터 소스로 데이터 파이프라인 테스트"""
+        pipeline = IrisMLPipeline()
+        X_train, X_test, y_train, y_test = pipeline.data_pipeline(synthetic_rows=5000)
+
+        assert X_train.shape == (4000, 4)
+        assert X_test.shape == (1000, 4)
+        assert len(y_test) == 1000
+        assert set(y_train) == {0, 1, 2}
+
+    def test_overridden_preprocess_data_is_used(self, tmp_path):
+        """하위 클래스에서 재정의한 preprocess_data를 data_pipeline과 단계 그래프 모두 사용"""
+
+        class ScaledPipeline(IrisMLPipeline):
+            def preprocess_data(self, X, verbose=True):
+                return X * 10
+
+        pipeline = ScaledPipeline()
+        X_train = pipeline.data_pipeline()[0]
+        graph = pipeline.training_graph(stage_cache=tmp_path)
+        graph_X_train = graph.run(["split"])["split"][0]
+
+        expected = IrisMLPipeline().data_pipeline()[0] * 10
+        assert np.array_equal(X_train, expected)
+        assert np.array_equal(graph_X_train, expected)
+        # 재정의한 전처리는 캐시 키에도 반영되어 기본 파이프라인의 캐시를 재사용하지 않음
+        default_graph = IrisMLPipeline().training_graph(stage_cache=tmp_path)
+        assert default_graph.key("preprocess") != graph.key("preprocess")
+
     def test_training_pipeline(self):
         """훈련 파이프라인 테스트"""
         pipeline = IrisMLPipeline()
@@ -55,6 +85,88 @@ class TestIrisMLPipeline:
         assert 0 <= metrics["accuracy"] <= 1
         assert 0 <= metrics["f1_score"] <= 1
 
+    def test_run_pipeline_cross_validation(self, tmp_path):
+        """교차 검증 모드: 평균 메트릭이 같은 형태로 저장되고 fold 인덱스가 캐시됨"""
+        import os
+
+        from app.serialization import load_artifact
+
+        pipeline = IrisMLPipeline()
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+
+            _, metrics = pipeline.run_pipeline(
+                compact=False, cv_folds=3, cv_max_cores=2
+            )
+
+            assert set(metrics) == {"accuracy", "f1_score"}
+            assert len(pipeline.cv_result["folds"]) == 3
+            assert metrics["accuracy"] == pipeline.cv_result["mean"]["accuracy"]
+            assert not pipeline.cv_result["fold_cache_hit"]
+            saved = load_artifact("models/model.pkl")
+            assert saved["metrics"] == metrics
+
+            # 같은 데이터로 다시 실행하면 fold 인덱스를 재사용
+            pipeline.run_pipeline(compact=False, cv_folds=3, cv_max_cores=2)
+            assert pipeline.cv_result["fold_cache_hit"]
+        finally:
+            os.chdir(original_cwd)
+
+    def test_run_pipeline_stage_cache(self, tmp_path):
+        """단계 캐시: 평가 설정만 바꿔 다시 실행하면 학습은 캐시에서 불러옴"""
+        import os
+
+        pipeline = IrisMLPipeline()
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+            model, _ = pipeline.run_pipeline(stage_cache="stages")
+            assert pipeline.stage_graph.cached_stages() == []
+
+            cached_model, metrics = pipeline.run_pipeline(
+                stage_cache="stages", cv_folds=3, cv_max_cores=1
+            )
+
+            graph = pipeline.stage_graph
+            assert set(graph.cached_stages()) == {
+                "data",
+                "preprocess",
+                "split",
+                "reference_stats",
+                "train",
+            }
+            assert set(graph.executed_stages()) == {"evaluate", "package"}
+            assert len(cached_model.estimators_) == len(model.estimators_)
+            assert metrics["accuracy"] == pipeline.cv_result["mean"]["accuracy"]
+        finally:
+            os.chdir(original_cwd)
+
+    def test_run_incremental_pipeline(self, tmp_path):
+        """증분 재학습: 기존 모델에 트리를 추가해 원본 버전과 함께 저장"""
+        import os
+
+        from app.serialization import load_artifact
+
+        pipeline = IrisMLPipeline()
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+            pipeline.run_pipeline(compact=False)
+            parent = load_artifact("models/model.pkl")
+
+            model, metrics = pipeline.run_incremental_pipeline(
+                synthetic_rows=500, n_new_trees=10, retire_oldest=5
+            )
+
+            assert len(model.estimators_) == len(parent["model"].estimators_) + 5
+            assert set(metrics) == {"accuracy", "f1_score"}
+            saved = load_artifact("models/model.pkl")
+            assert saved["parent_version"] == parent["version"]
+            assert saved["metrics"] == metrics
+        finally:
+            os.chdir(original_cwd)
+
     def test_save_model(self):
         """모델 저장 테스트"""
         pipeline = IrisMLPipeline()
@@ -77,12 +189,18 @@ class TestIrisMLPipeline:
                 assert model_path.exists()
 
                 # 모델 로드 확인
-                loaded = joblib.load(model_path)
+                loaded = load_artifact(model_path)
                 assert "model" in loaded
                 assert "version" in loaded
                 assert "metrics" in loaded
                 assert "feature_names" in loaded
                 assert "target_names" in loaded
+                assert artifact_header(model_path)["codec"] == "zlib"
+
+                # 직렬화 옵션 변경
+                pipeline.artifact_options = {"codec": "none"}
+                pipeline.save_model(model, metrics)
+                assert artifact_header(model_path)["codec"] == "none"
             finally:
                 os.chdir(original_cwd)
 
@@ -98,7 +216,7 @@ class TestIrisMLPipeline:
 
                 os.chdir(tmpdir)
 
-                model, metrics = pipeline.run_pipeline()
+                model, metrics = pipeline.run_pipeline(profile_output="profile.json")
 
                 assert model is not None
                 assert "accuracy" in metrics
@@ -107,6 +225,49 @@ class TestIrisMLPipeline:
                 # 모델이 저장되었는지 확인
                 model_path = Path("models/model.pkl")
                 assert model_path.exists()
+
+                # 드리프트 감시용 기준 통계가 모델 옆에 저장되었는지 확인
+                stats = json.loads(Path("models/reference_stats.json").read_text())
+                assert stats["n_samples"] == 120
+                assert len(stats["bin_fractions"]) == 4
+
+                # 단계별 비용이 측정되었는지 확인
+                stages = [r["stage"] for r in pipeline.stage_profile.results]
+                assert stages == ["data", "training", "evaluation", "serving"]
+                assert Path("profile.json").exists()
             finally:
                 os.chdir(original_cwd)
 
+    def test_run_pipeline_out_of_core(self, tmp_path):
+        """out-of-core 모드 전체 파이프라인 실행 테스트"""
+        import os
+
+        import pandas as pd
+        from sklearn.datasets import load_iris
+
+        iris = load_iris()
+        df = pd.DataFrame(
+            iris.data,
+            columns=["sepal_length", "sepal_width", "petal_length", "petal_width"],
+        )
+        df["target"] = iris.target
+        data_path = tmp_path / "iris.csv"
+        df.sample(frac=1, random_state=0).to_csv(data_path, index=False)
+
+        pipeline = IrisMLPipeline()
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+
+            model, metrics = pipeline.run_pipeline(
+                data_path=str(data_path), chunk_size=50, compact=False
+            )
+
+            assert model.n_estimators == 30
+            assert metrics["accuracy"] > 0.85
+
+            # app.main.load_model이 읽는 형식으로 저장되었는지 확인
+            loaded = load_artifact(Path("models/model.pkl"))
+            assert loaded["model"].predict(iris.data[:2]).shape == (2,)
+        finally:
+            os.chdir(original_cwd)
@@ -5,6 +5,21 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
+
+# 지연시간 예산은 실행 환경의 부하에 따라 달라지므로 등록까지 확인하는 테스트에서는 끔
+NO_LATENCY_BUDGETS = {"max_single_row_p99_ms": None, "max_batch_p99_ms": None}
+
+
+def logged_batches(mock_mlflow):
+    """log_batch로 전송된 파라미터/메트릭/태그를 dict로 모음"""
+    client = mock_mlflow.tracking.MlflowClient.return_value
+    params, metrics, tags = {}, {}, {}
+    for call in client.log_batch.call_args_list:
+        params.update({p.key: p.value for p in call.kwargs["params"]})
+        metrics.update({m.key: m.value for m in call.kwargs["metrics"]})
+        tags.update({t.key: t.value for t in call.kwargs["tags"]})
+    return params, metrics, tags
 
 
 class TestIrisMLPipelineWithMLflow:
@@ -37,6 +52,34 @@ class TestIrisMLPipelineWithMLflow:
         assert X_train.shape[1] == 4
         assert X_test.shape[1] == 4
 
+    @patch("scripts.train_pipeline_mlflow.mlflow")
+    def test_overridden_preprocess_data_is_used(self, mock_mlflow):
+        """하위 클래스에서 재정의한 preprocess_data를 data_pipeline과 단계 그래프 모두 사용"""
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        class ScaledPipeline(IrisMLPipelineWithMLflow):
+            def preprocess_data(self, X, verbose=True):
+                return X * 10
+
+        pipeline = ScaledPipeline()
+        graph = pipeline.training_graph(pipeline._model_params(10, 3))
+
+        expected = IrisMLPipelineWithMLflow().data_pipeline()[0] * 10
+        assert np.array_equal(pipeline.data_pipeline()[0], expected)
+        assert np.array_equal(graph.run(["split"])["split"][0], expected)
+
+    @patch("scripts.train_pipeline_mlflow.mlflow")
+    def test_tracker_requires_active_run(self, mock_mlflow):
+        """활성 run이 없으면 run을 대신 열지 않고 RuntimeError"""
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        mock_mlflow.active_run.return_value = None
+        pipeline = IrisMLPipelineWithMLflow()
+
+        with pytest.raises(RuntimeError, match="활성 MLflow run"):
+            _ = pipeline.tracker
+        mock_mlflow.start_run.assert_not_called()
+
     @patch("scripts.train_pipeline_mlflow.mlflow")
     def test_training_pipeline_with_tracking(self, mock_mlflow):
         """MLflow 추적이 포함된 훈련 파이프라인 테스트"""
@@ -54,8 +97,12 @@ class TestIrisMLPipelineWithMLflow:
         assert "max_depth" in params
         assert params["n_estimators"] == 50
         assert params["max_depth"] == 3
-        # MLflow에 파라미터가 기록되었는지 확인
-        mock_mlflow.log_params.assert_called()
+        # 파라미터는 버퍼에 모였다가 한 번의 log_batch로 기록
+        mock_mlflow.tracking.MlflowClient.return_value.log_batch.assert_not_called()
+        pipeline.tracker.close()
+        params, _, _ = logged_batches(mock_mlflow)
+        assert params["n_estimators"] == "50"
+        assert params["max_depth"] == "3"
 
     @patch("scripts.train_pipeline_mlflow.mlflow")
     def test_evaluate_model_with_tracking(self, mock_mlflow):
@@ -75,14 +122,145 @@ class TestIrisMLPipelineWithMLflow:
         assert "precision" in metrics
         assert "recall" in metrics
         assert 0 <= metrics["accuracy"] <= 1
-        # MLflow에 메트릭이 기록되었는지 확인
-        assert mock_mlflow.log_metric.call_count >= 4
+        # MLflow에 메트릭이 한 번의 배치로 기록되었는지 확인
+        pipeline.tracker.close()
+        client = mock_mlflow.tracking.MlflowClient.return_value
+        assert client.log_batch.call_count == 1
+        _, logged_metrics, tags = logged_batches(mock_mlflow)
+        assert {"accuracy", "f1_score", "precision", "recall"} <= set(logged_metrics)
+        assert tags["validation"] == "passed"
+
+    @patch("scripts.train_pipeline_mlflow.mlflow")
+    def test_cross_validate_with_tracking(self, mock_mlflow, tmp_path):
+        """fold별/평균 메트릭 기록과 evaluate_model_with_tracking과 같은 반환 형태"""
+        import os
+
+        from sklearn.datasets import load_iris
+
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        X, y = load_iris(return_X_y=True)
+        pipeline = IrisMLPipelineWithMLflow()
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+            metrics = pipeline.cross_validate_with_tracking(
+                X,
+                y,
+                {"n_estimators": 20, "max_depth": 3, "random_state": 42},
+                n_splits=3,
+                max_cores=2,
+            )
+        finally:
+            os.chdir(original_cwd)
+
+        assert set(metrics) == {"accuracy", "f1_score", "precision", "recall"}
+        assert metrics["accuracy"] > 0.9
+
+        pipeline.tracker.close()
+        params, logged_metrics, tags = logged_batches(mock_mlflow)
+        assert params["cv_folds"] == "3"
+        assert params["cv_workers"] == "2"
+        assert tags["evaluation"] == "cross_validation"
+        assert tags["validation"] == "passed"
+        assert logged_metrics["cv_accuracy_mean"] == metrics["accuracy"]
+        assert "cv_accuracy_std" in logged_metrics
+
+        # fold별 메트릭은 fold 번호를 step으로 기록
+        client = mock_mlflow.tracking.MlflowClient.return_value
+        steps = [
+            m.step
+            for call in client.log_batch.call_args_list
+            for m in call.kwargs["metrics"]
+            if m.key == "cv_accuracy"
+        ]
+        assert steps == [0, 1, 2]
+
+    @patch("scripts.train_pipeline_mlflow.mlflow")
+    def test_run_incremental_pipeline(self, mock_mlflow, tmp_path):
+        """최신 MLflow 버전에 트리를 추가해 부모 run과 연결된 새 버전으로 등록"""
+        import os
+
+        from sklearn.datasets import load_iris
+        from sklearn.ensemble import RandomForestClassifier
+
+        from app.serialization import load_artifact
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        X, y = load_iris(return_X_y=True)
+        parent = RandomForestClassifier(n_estimators=30, max_depth=4, random_state=0)
+        parent.fit(X, y)
+
+        mock_context = MagicMock()
+        mock_context.__enter__ = MagicMock(return_value=mock_context)
+        mock_context.__exit__ = MagicMock(return_value=False)
+        mock_context.info.run_id = "child-run"
+        mock_mlflow.start_run.return_value = mock_context
+        mock_mlflow.active_run.return_value = mock_context
+        client = mock_mlflow.tracking.MlflowClient.return_value
+        client.search_model_versions.return_value = [
+            MagicMock(version="1", run_id="run-v1"),
+            MagicMock(version="3", run_id="run-v3"),
+        ]
+        mock_mlflow.sklearn.load_model.return_value = parent
+        mock_mlflow.artifacts.load_dict.return_value = {"n_samples": 150}
+
+        pipeline = IrisMLPipelineWithMLflow()
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+            model, metrics = pipeline.run_incremental_pipeline(
+                synthetic_rows=500, n_new_trees=10, budgets=NO_LATENCY_BUDGETS
+            )
+
+            mock_mlflow.sklearn.load_model.assert_called_once_with(
+                "models:/iris-classifier/3"
+            )
+            assert len(model.estimators_) == 40
+            assert {"accuracy", "f1_score", "precision", "recall"} == set(metrics)
+
+            params, logged_metrics, tags = logged_batches(mock_mlflow)
+            assert params["training_mode"] == "incremental"
+            assert params["n_estimators"] == "40"
+            assert params["new_rows"] == "400"
+            assert tags["parent_run_id"] == "run-v3"
+            assert tags["parent_version"] == "mlflow-v3"
+            assert "parent_accuracy" in logged_metrics
+
+            # 원본 run의 기준 통계를 이어서 기록
+            mock_mlflow.artifacts.load_dict.assert_called_once_with(
+                "runs:/run-v3/reference_stats.json"
+            )
+            client.log_dict.assert_called_once_with(
+                "child-run", {"n_samples": 150}, "reference_stats.json"
+            )
+            saved = load_artifact("models/model.pkl")
+            assert saved["parent_run_id"] == "run-v3"
+        finally:
+            os.chdir(original_cwd)
+
+    @patch("scripts.train_pipeline_mlflow.mlflow")
+    def test_parent_reference_stats_falls_back_to_local_file(
+        self, mock_mlflow, tmp_path, monkeypatch
+    ):
+        """원본 run의 기준 통계를 받을 수 없으면 로컬 파일 사용"""
+        from mlflow.exceptions import MlflowException
+
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "models").mkdir()
+        (tmp_path / "models" / "reference_stats.json").write_text('{"n_samples": 9}')
+        mock_mlflow.artifacts.load_dict.side_effect = MlflowException("없음")
+        pipeline = IrisMLPipelineWithMLflow()
+
+        stats = pipeline._parent_reference_stats({"run_id": "run-v3"})
+        assert stats == {"n_samples": 9}
 
     @patch("scripts.train_pipeline_mlflow.mlflow")
     def test_register_model_with_mlflow(self, mock_mlflow):
         """MLflow 모델 등록 테스트"""
-        import joblib
-
+        from app.serialization import load_artifact
         from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
 
         # MLflow active_run 모킹
@@ -109,15 +287,19 @@ class TestIrisMLPipelineWithMLflow:
                 pipeline.register_model_with_mlflow(model, params, metrics)
 
                 # MLflow에 모델이 등록되었는지 확인
-                mock_mlflow.sklearn.log_model.assert_called_once()
-                mock_mlflow.set_tags.assert_called_once()
+                mock_mlflow.models.Model.log.assert_called_once()
+                pipeline.tracker.close()
+                _, kwargs = mock_mlflow.models.Model.log.call_args
+                assert kwargs["run_id"] == "test-run-id-123"
+                _, _, tags = logged_batches(mock_mlflow)
+                assert tags["framework"] == "scikit-learn"
 
                 # 로컬 백업 파일이 생성되었는지 확인
                 model_path = Path("models/model.pkl")
                 assert model_path.exists()
 
                 # 모델 로드 확인
-                loaded = joblib.load(model_path)
+                loaded = load_artifact(model_path)
                 assert "model" in loaded
                 assert "mlflow_run_id" in loaded
                 assert loaded["mlflow_run_id"] == "test-run-id-123"
@@ -127,6 +309,7 @@ class TestIrisMLPipelineWithMLflow:
     @patch("scripts.train_pipeline_mlflow.mlflow")
     def test_run_pipeline(self, mock_mlflow):
         """전체 MLflow 파이프라인 실행 테스트"""
+        from app.serialization import load_artifact
         from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
 
         # MLflow context manager 모킹
@@ -150,15 +333,54 @@ class TestIrisMLPipelineWithMLflow:
                 os.chdir(tmpdir)
 
                 model, metrics = pipeline.run_pipeline(
-                    n_estimators=50, max_depth=3, run_name="test_run"
+                    n_estimators=50,
+                    max_depth=3,
+                    run_name="test_run",
+                    budgets=NO_LATENCY_BUDGETS,
                 )
 
                 assert model is not None
                 assert "accuracy" in metrics
                 assert "f1_score" in metrics
 
-                # MLflow start_run이 호출되었는지 확인
-                mock_mlflow.start_run.assert_called_once()
+                # run은 한 번만 시작하고, 백그라운드 모델 업로드는 run_id로 같은 run에 기록
+                # (start_run(run_id=...)으로 다시 연결하면 빠져나올 때 run이 종료됨)
+                mock_mlflow.start_run.assert_called_once_with(run_name="test_run")
+                uploads = mock_mlflow.models.Model.log.call_args_list
+                assert {call.kwargs["run_id"] for call in uploads} == {
+                    "test-run-id-456"
+                }
+
+                # 드리프트 기준 통계가 run 아티팩트와 로컬 파일로 저장되었는지 확인
+                client = mock_mlflow.tracking.MlflowClient.return_value
+                client.log_dict.assert_called_once()
+                run_id, stats, artifact_file = client.log_dict.call_args[0]
+                assert run_id == "test-run-id-456"
+                assert artifact_file == "reference_stats.json"
+                assert stats["feature_names"][0] == "sepal_length"
+                assert Path("models/reference_stats.json").exists()
+
+                # Iris는 검증 데이터가 MIN_VALIDATION_ROWS보다 적어 압축을 건너뛰는지 확인
+                _, stage_metrics, tags = logged_batches(mock_mlflow)
+                assert tags["compaction"] == "skipped"
+
+                # 증류한 fast 티어 모델이 같은 run에 함께 등록되었는지 확인
+                registered = {
+                    call.kwargs["registered_model_name"]
+                    for call in mock_mlflow.models.Model.log.call_args_list
+                }
+                assert registered == {"iris-classifier", "iris-classifier-fast"}
+                assert tags["fast_model"] == "iris-classifier-fast"
+                assert "fast_agreement_rate" in stage_metrics
+                assert "fast_single_row_latency_p99_ms" in stage_metrics
+                fast_artifact = load_artifact("models/fast_model.pkl")
+                local_artifact = load_artifact("models/model.pkl")
+                assert fast_artifact["teacher_version"] == local_artifact["version"]
+
+                # 단계별 비용이 MLflow 메트릭으로 기록되었는지 확인
+                for stage in ("data", "training", "evaluation", "registry"):
+                    assert f"stage_{stage}_wall_time_s" in stage_metrics
+                    assert f"stage_{stage}_cpu_time_s" in stage_metrics
 
                 # 모델이 저장되었는지 확인
                 model_path = Path("models/model.pkl")
@@ -166,3 +388,87 @@ class TestIrisMLPipelineWithMLflow:
             finally:
                 os.chdir(original_cwd)
 
+    @patch("scripts.train_pipeline_mlflow.mlflow")
+    def test_run_pipeline_out_of_core(self, mock_mlflow, tmp_path):
+        """out-of-core 모드 MLflow 파이프라인 실행 테스트"""
+        import os
+
+        import pandas as pd
+        from sklearn.datasets import load_iris
+
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        mock_context = MagicMock()
+        mock_context.__enter__ = MagicMock(return_value=mock_context)
+        mock_context.__exit__ = MagicMock(return_value=False)
+        mock_context.info.run_id = "test-run-id-789"
+        mock_mlflow.start_run.return_value = mock_context
+        mock_mlflow.active_run.return_value = mock_context
+
+        iris = load_iris()
+        df = pd.DataFrame(
+            iris.data,
+            columns=["sepal_length", "sepal_width", "petal_length", "petal_width"],
+        )
+        df["target"] = iris.target
+        data_path = tmp_path / "iris.csv"
+        df.sample(frac=1, random_state=0).to_csv(data_path, index=False)
+
+        pipeline = IrisMLPipelineWithMLflow()
+        original_cwd = Path.cwd()
+        try:
+            os.chdir(tmp_path)
+
+            model, metrics = pipeline.run_pipeline(
+                n_estimators=5,
+                data_path=str(data_path),
+                chunk_size=50,
+                compact=False,
+                budgets=NO_LATENCY_BUDGETS,
+            )
+
+            assert model.n_estimators == 15
+            assert "accuracy" in metrics
+            logged_params, _, _ = logged_batches(mock_mlflow)
+            assert logged_params["training_mode"] == "out_of_core"
+            assert logged_params["n_estimators"] == "15"
+            assert Path("models/model.pkl").exists()
+        finally:
+            os.chdir(original_cwd)
+
+    @patch("scripts.train_pipeline_mlflow.mlflow")
+    def test_run_pipeline_refuses_registration_over_budget(self, mock_mlflow):
+        """서빙 예산을 넘는 모델은 레지스트리에 등록되지 않는지 확인"""
+        from scripts.train_pipeline_mlflow import IrisMLPipelineWithMLflow
+
+        mock_context = MagicMock()
+        mock_context.__enter__ = MagicMock(return_value=mock_context)
+        mock_context.__exit__ = MagicMock(return_value=False)
+        mock_context.info.run_id = "test-run-id-budget"
+        mock_mlflow.start_run.return_value = mock_context
+        mock_mlflow.active_run.return_value = mock_context
+
+        pipeline = IrisMLPipelineWithMLflow()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            original_cwd = Path.cwd()
+            try:
+                import os
+
+                os.chdir(tmpdir)
+
+                model, _ = pipeline.run_pipeline(
+                    n_estimators=10, max_depth=3, budgets={"max_node_count": 1}
+                )
+
+                assert model is not None
+                _, logged, tags = logged_batches(mock_mlflow)
+                assert tags["serving_budget"] == "exceeded"
+                mock_mlflow.models.Model.log.assert_not_called()
+                assert not Path("models/model.pkl").exists()
+
+                # 측정값은 MLflow 메트릭으로 기록
+                assert "serving_single_row_latency_p99_ms" in logged
+                assert "serving_node_count" in logged
+            finally:
+                os.chdir(original_cwd)